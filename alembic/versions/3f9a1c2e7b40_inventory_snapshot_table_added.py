@@ -0,0 +1,48 @@
+"""inventory snapshot table added
+
+Revision ID: 3f9a1c2e7b40
+Revises: 1d4b572080c7
+Create Date: 2026-10-18 09:12:44.318520
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9a1c2e7b40'
+down_revision: Union[str, None] = '1d4b572080c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('inventory_snapshots',
+    sa.Column('product_id', sa.String(length=36), nullable=False),
+    sa.Column('quantity', sa.Numeric(precision=5, scale=0), nullable=False),
+    sa.Column('threshold', sa.Numeric(precision=3, scale=0), nullable=True),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.CheckConstraint('quantity <= 99999', name='ck_snapshot_quantity_max'),
+    sa.CheckConstraint('quantity >= 0', name='ck_snapshot_quantity_non_negative'),
+    sa.CheckConstraint('threshold <= 999', name='ck_snapshot_threshold_max'),
+    sa.CheckConstraint('threshold >= 0', name='ck_snapshot_threshold_non_negative'),
+    sa.ForeignKeyConstraint(['product_id'], ['products.id'], ),
+    sa.PrimaryKeyConstraint('product_id')
+    )
+    op.execute(
+        "INSERT INTO inventory_snapshots (product_id, quantity, threshold, version) "
+        "SELECT i.product_id, i.quantity_after, i.threshold, "
+        "(SELECT COUNT(*) FROM inventories c WHERE c.product_id = i.product_id) "
+        "FROM inventories i "
+        "WHERE i.id = (SELECT MAX(l.id) FROM inventories l WHERE l.product_id = i.product_id)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('inventory_snapshots')
@@ -0,0 +1,47 @@
+"""daily revenue rollup added
+
+Revision ID: 8c2d5e71a9f3
+Revises: 3f9a1c2e7b40
+Create Date: 2026-10-18 11:40:03.527114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c2d5e71a9f3'
+down_revision: Union[str, None] = '3f9a1c2e7b40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('daily_revenue',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('platform_id', sa.Integer(), nullable=False),
+    sa.Column('category_id', sa.String(length=36), nullable=False),
+    sa.Column('revenue', sa.Numeric(precision=16, scale=2), nullable=False),
+    sa.Column('units_sold', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['category_id'], ['categories.id'], ),
+    sa.ForeignKeyConstraint(['platform_id'], ['platforms.id'], ),
+    sa.PrimaryKeyConstraint('day', 'platform_id', 'category_id')
+    )
+    op.execute(
+        "INSERT INTO daily_revenue (day, platform_id, category_id, revenue, units_sold) "
+        "SELECT DATE(s.sale_date), s.platform_id, p.category_id, "
+        "SUM(si.total_price), SUM(si.quantity) "
+        "FROM sale_items si "
+        "JOIN sales s ON s.id = si.sales_id "
+        "JOIN products p ON p.id = si.product_id "
+        "WHERE s.sale_date IS NOT NULL "
+        "GROUP BY DATE(s.sale_date), s.platform_id, p.category_id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('daily_revenue')
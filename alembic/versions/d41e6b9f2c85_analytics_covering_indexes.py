@@ -0,0 +1,37 @@
+"""analytics covering indexes
+
+Revision ID: d41e6b9f2c85
+Revises: 8c2d5e71a9f3
+Create Date: 2026-10-18 14:02:37.904218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41e6b9f2c85'
+down_revision: Union[str, None] = '8c2d5e71a9f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # only databases created by create_all from the old model have it, no migration ever added it
+    existing = {index['name'] for index in sa.inspect(op.get_bind()).get_indexes('sales')}
+    if 'idx_sales_created_at' in existing:
+        op.drop_index('idx_sales_created_at', table_name='sales')
+    op.create_index('idx_sales_sale_date_total_amount', 'sales', ['sale_date', 'total_amount'], unique=False)
+    op.create_index('idx_sale_items_sales_product_total', 'sale_items', ['sales_id', 'product_id', 'total_price'], unique=False)
+    op.create_index('idx_inventory_product_created_at', 'inventories', ['product_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_inventory_product_created_at', table_name='inventories')
+    op.drop_index('idx_sale_items_sales_product_total', table_name='sale_items')
+    op.drop_index('idx_sales_sale_date_total_amount', table_name='sales')
+    op.create_index('idx_sales_created_at', 'sales', ['updated_at'], unique=False)
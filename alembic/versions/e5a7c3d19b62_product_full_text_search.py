@@ -0,0 +1,35 @@
+"""product full text search
+
+Revision ID: e5a7c3d19b62
+Revises: d41e6b9f2c85
+Create Date: 2026-10-18 15:11:52.318406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.product_model import PRODUCT_SEARCH_DDL, PRODUCT_SEARCH_DROP_DDL
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a7c3d19b62'
+down_revision: Union[str, None] = 'd41e6b9f2c85'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    for statement in PRODUCT_SEARCH_DDL.get(dialect, []):
+        op.execute(statement)
+    if dialect == "sqlite":
+        op.execute("INSERT INTO products_fts(products_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for statement in PRODUCT_SEARCH_DROP_DDL.get(op.get_bind().dialect.name, []):
+        op.execute(statement)
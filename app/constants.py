@@ -7,3 +7,62 @@ DB_URL = os.getenv("DB_URL")
 
 if not DB_URL:
     raise ValueError("Missing DB_URL environment variable")
+
+STOCK_LOCKING_MODE = os.getenv("STOCK_LOCKING_MODE", "pessimistic").lower()
+STOCK_UPDATE_MAX_RETRIES = int(os.getenv("STOCK_UPDATE_MAX_RETRIES", "3"))
+BULK_ORDER_MAX_SIZE = int(os.getenv("BULK_ORDER_MAX_SIZE", "1000"))
+
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+
+DB_READ_URL = os.getenv("DB_READ_URL")
+DB_READ_MAX_LAG_SECONDS = float(os.getenv("DB_READ_MAX_LAG_SECONDS", "5"))
+DB_READ_CHECK_INTERVAL = float(os.getenv("DB_READ_CHECK_INTERVAL", "10"))
+
+DB_ASYNC = os.getenv("DB_ASYNC", "false").lower() in ("1", "true", "yes")
+DB_ASYNC_URL = os.getenv("DB_ASYNC_URL")
+
+# bootstrap: create the schema and seed on every worker start (development)
+# check: only verify the database is reachable and migrated, seed with `python -m app.core.bootstrap`
+STARTUP_MODE = os.getenv("STARTUP_MODE", "bootstrap").lower()
+
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory").lower()
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
+CACHE_KEY_PREFIX = os.getenv("CACHE_KEY_PREFIX", "ecommerce")
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "10000"))
+
+CATALOG_CACHE_ENABLED = os.getenv("CATALOG_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+CATALOG_CACHE_TTL = float(os.getenv("CATALOG_CACHE_TTL", "300"))
+
+REVENUE_CACHE_ENABLED = os.getenv("REVENUE_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+REVENUE_CACHE_OPEN_TTL = float(os.getenv("REVENUE_CACHE_OPEN_TTL", "30"))
+# closed ranges are invalidated by backdated sales, the TTL only lets untouched keys age out
+REVENUE_CACHE_CLOSED_TTL = float(os.getenv("REVENUE_CACHE_CLOSED_TTL", "86400"))
+
+# longest revenue series served per granularity, in points
+REVENUE_SERIES_MAX_DAYS = int(os.getenv("REVENUE_SERIES_MAX_DAYS", "400"))
+REVENUE_SERIES_MAX_WEEKS = int(os.getenv("REVENUE_SERIES_MAX_WEEKS", "520"))
+REVENUE_SERIES_MAX_MONTHS = int(os.getenv("REVENUE_SERIES_MAX_MONTHS", "120"))
+
+HEALTH_DB_MAX_LATENCY_MS = float(os.getenv("HEALTH_DB_MAX_LATENCY_MS", "250"))
+HEALTH_POOL_MAX_SATURATION = float(os.getenv("HEALTH_POOL_MAX_SATURATION", "0.9"))
+HEALTH_CHECK_CACHE = os.getenv("HEALTH_CHECK_CACHE", "false").lower() in ("1", "true", "yes")
+HEALTH_CACHE_MAX_LATENCY_MS = float(os.getenv("HEALTH_CACHE_MAX_LATENCY_MS", "50"))
+
+QUERY_STATS_ENABLED = os.getenv("QUERY_STATS_ENABLED", "true").lower() in ("1", "true", "yes")
+QUERY_SLOW_MS = float(os.getenv("QUERY_SLOW_MS", "100"))
+QUERY_STATS_SLOWEST = int(os.getenv("QUERY_STATS_SLOWEST", "3"))
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "false").lower() in ("1", "true", "yes")
+
+if STOCK_LOCKING_MODE not in ("pessimistic", "optimistic"):
+    raise ValueError("STOCK_LOCKING_MODE must be either 'pessimistic' or 'optimistic'")
+
+if STARTUP_MODE not in ("bootstrap", "check"):
+    raise ValueError("STARTUP_MODE must be either 'bootstrap' or 'check'")
+
+if CACHE_BACKEND not in ("memory", "redis"):
+    raise ValueError("CACHE_BACKEND must be either 'memory' or 'redis'")
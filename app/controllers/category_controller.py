@@ -7,13 +7,22 @@ from ..schemas.category_schema import CategoryCreate, CategoryUpdate, CategoryOu
 from ..schemas.base_schema import PaginatedResponse
 from ..models.category_model import Category
 from ..utils.response_wrapper import APIResponse
+from ..utils.pagination import paginate
+from ..utils.projection import Projection
+from ..core.cache import cached
 
 
+CATEGORY_COLUMNS = Projection(CategoryOut, Category)
+
+
+@cached("categories")
 def list_categories(
     db: Session,
     page: int = 1,
     limit: int = 100,
-    search: str = ""
+    search: str = "",
+    cursor: str | None = None,
+    include_total: bool = True
 ) -> APIResponse[PaginatedResponse[CategoryOut]]:
     try:
         if page < 1:
@@ -21,8 +30,7 @@ def list_categories(
         if limit < 1:
             limit = 100
             
-        skip = (page - 1) * limit
-        query = db.query(Category)
+        query = db.query(*CATEGORY_COLUMNS.columns)
         
         if search:
             query = query.filter(
@@ -30,21 +38,18 @@ def list_categories(
                 func.lower(Category.sku).contains(func.lower(search))
             )
         
-        categories = query.offset(skip).limit(limit).all()
-        total_count = query.with_entities(func.count(Category.id)).scalar()
-        page_count = max(1, (total_count + limit - 1) // limit)
+        categories, pagination = paginate(
+            query,
+            [Category.id],
+            page=page,
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total
+        )
         
         response_data = PaginatedResponse[CategoryOut](
-            items=[CategoryOut.model_validate(cat) for cat in categories],
-            pagination={
-                "total_items": total_count,
-                "total_pages": page_count,
-                "current_page": page,
-                "page_size": limit,
-                "items_on_page": len(categories),
-                "has_next": (page * limit) < total_count,
-                "has_previous": page > 1
-            }
+            items=[CATEGORY_COLUMNS.values(row) for row in categories],
+            pagination=pagination
         )
         
         return APIResponse[PaginatedResponse[CategoryOut]](
@@ -54,6 +59,8 @@ def list_categories(
             error=None
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -61,6 +68,7 @@ def list_categories(
         )
 
 
+@cached("categories")
 def retrieve_category(category_id: str, db: Session):    
     category = db.query(Category).filter(Category.id == category_id.strip()).first()
     
@@ -0,0 +1,90 @@
+from datetime import datetime
+from typing import Iterator, List, Optional, Sequence, Tuple
+from sqlalchemy import select
+
+from ..db.database import ReadSessionLocal
+from ..models.sale_model import Sale
+from ..models.sale_item_model import SaleItem
+from ..models.product_model import Product
+from ..models.inventory_model import Inventory
+from ..core.revenue_rollup import to_utc_naive
+
+EXPORT_BATCH_SIZE = 1000
+
+
+def _date_filters(column, start_date: Optional[datetime], end_date: Optional[datetime]) -> list:
+    if start_date is not None and end_date is not None and start_date >= end_date:
+        raise ValueError("Start date must be before end date.")
+
+    filters = []
+    if start_date is not None:
+        filters.append(column >= to_utc_naive(start_date))
+    if end_date is not None:
+        filters.append(column < to_utc_naive(end_date))
+    return filters
+
+
+def _stream(statement) -> Iterator[Sequence[tuple]]:
+    # yield_per streams from a server-side cursor, so memory stays at one batch whatever the row count
+    with ReadSessionLocal() as session:
+        result = session.execute(statement.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        for batch in result.partitions():
+            yield batch
+
+
+def export_sales(
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    product_id: Optional[str] = None,
+    platform_id: Optional[int] = None
+) -> Tuple[List[str], Iterator[Sequence[tuple]]]:
+    filters = _date_filters(Sale.sale_date, start_date, end_date)
+    if product_id:
+        filters.append(SaleItem.product_id == product_id)
+    if platform_id is not None:
+        filters.append(Sale.platform_id == platform_id)
+
+    statement = select(
+            Sale.id.label("sale_id"),
+            Sale.sale_date,
+            Sale.platform_id,
+            SaleItem.id.label("sale_item_id"),
+            SaleItem.product_id,
+            Product.sku,
+            SaleItem.quantity,
+            SaleItem.per_item_price,
+            SaleItem.total_price
+        )\
+        .join(SaleItem, SaleItem.sales_id == Sale.id)\
+        .join(Product, Product.id == SaleItem.product_id)\
+        .where(*filters)\
+        .order_by(Sale.sale_date, Sale.id, SaleItem.id)
+
+    return list(statement.selected_columns.keys()), _stream(statement)
+
+
+def export_inventory(
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    product_id: Optional[str] = None
+) -> Tuple[List[str], Iterator[Sequence[tuple]]]:
+    filters = _date_filters(Inventory.created_at, start_date, end_date)
+    if product_id:
+        filters.append(Inventory.product_id == product_id)
+
+    statement = select(
+            Inventory.id,
+            Inventory.created_at,
+            Inventory.product_id,
+            Product.sku,
+            Inventory.quantity_before,
+            Inventory.quantity_changed,
+            Inventory.quantity_after,
+            Inventory.threshold,
+            Inventory.reason
+        )\
+        .join(Product, Product.id == Inventory.product_id)\
+        .where(*filters)\
+        .order_by(Inventory.created_at, Inventory.id)
+
+    return list(statement.selected_columns.keys()), _stream(statement)
@@ -1,14 +1,36 @@
 from fastapi import HTTPException
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
 from ..utils.response_wrapper import APIResponse
+from ..utils.pagination import paginate
+from ..utils.projection import Projection
 from ..models.inventory_model import Inventory
 from ..models.product_model import Product
+from ..core.inventory_snapshot import get_stock, record_inventory_change, retry_stale_stock
 from ..schemas.inventory_schema import InventoryCreate, InventoryUpdate, InventoryOut
+from ..schemas.product_schema import ProductOut
 from ..schemas.base_schema import PaginatedResponse
 from decimal import Decimal
 
+INVENTORY_COLUMNS = Projection(InventoryOut, Inventory)
+INVENTORY_PRODUCT_COLUMNS = Projection(
+    ProductOut,
+    Product,
+    prefix="product__",
+    fields=["id", "name", "sku", "price", "category_id"]
+)
+
 def create_inventory(db: Session, inventory: InventoryCreate):
+    try:
+        return retry_stale_stock(lambda lock_stock: _create_inventory(db, inventory, lock_stock))
+    except StaleDataError:
+        raise HTTPException(
+            status_code=409,
+            detail="Stock was modified by a concurrent update, please retry"
+        )
+
+def _create_inventory(db: Session, inventory: InventoryCreate, lock_stock: bool):
     try:
         product = db.query(Product).filter(Product.id == inventory.product_id).first()
         if not product:
@@ -17,19 +39,15 @@ def create_inventory(db: Session, inventory: InventoryCreate):
                 detail="Product not found"
             )
 
-        current_qty = Decimal(0)
-        new_qty = current_qty + inventory.quantity_changed
-
-        db_inventory = Inventory(
-            product_id=inventory.product_id,
+        db_inventory = record_inventory_change(
+            db,
+            inventory.product_id,
             quantity_changed=inventory.quantity_changed,
-            quantity_before=current_qty,
-            quantity_after=new_qty,
+            reason=inventory.reason,
             threshold=inventory.threshold,
-            reason=inventory.reason
+            snapshot=get_stock(db, inventory.product_id, for_update=lock_stock)
         )
 
-        db.add(db_inventory)
         db.commit()
         db.refresh(db_inventory)
 
@@ -40,6 +58,9 @@ def create_inventory(db: Session, inventory: InventoryCreate):
             error=None
         )
 
+    except StaleDataError:
+        db.rollback()
+        raise
     except IntegrityError as e:
         db.rollback()
         raise HTTPException(
@@ -57,33 +78,41 @@ def update_inventory_by_product(
     db: Session,
     product_id: str,
     inventory_update: InventoryUpdate
+) -> APIResponse[InventoryOut]:
+    try:
+        return retry_stale_stock(lambda lock_stock: _update_inventory(db, product_id, inventory_update, lock_stock))
+    except StaleDataError:
+        raise HTTPException(
+            status_code=409,
+            detail="Stock was modified by a concurrent update, please retry"
+        )
+
+def _update_inventory(
+    db: Session,
+    product_id: str,
+    inventory_update: InventoryUpdate,
+    lock_stock: bool
 ) -> APIResponse[InventoryOut]:
     try:
         product = db.query(Product).filter(Product.id == product_id).first()
         if not product:
             raise HTTPException(status_code=404, detail="Product not found")
 
-        last_inventory = db.query(Inventory)\
-            .filter(Inventory.product_id == product_id)\
-            .order_by(Inventory.created_at.desc())\
-            .first()
+        stock = get_stock(db, product_id, for_update=lock_stock)
 
-        current_qty = last_inventory.quantity_after if last_inventory else Decimal(0)
-        new_qty = current_qty + inventory_update.quantity_changed
         threshold = inventory_update.threshold or (
-            last_inventory.threshold if last_inventory else Decimal(10)
+            stock.threshold if stock else Decimal(10)
         )
 
-        new_inventory = Inventory(
-            product_id=product_id,
-            quantity_before=current_qty,
-            quantity_after=new_qty,
+        new_inventory = record_inventory_change(
+            db,
+            product_id,
             quantity_changed=inventory_update.quantity_changed,
-            threshold=threshold,
             reason=inventory_update.reason or "Stock adjustment",
+            threshold=threshold,
+            snapshot=stock
         )
 
-        db.add(new_inventory)
         db.commit()
         db.refresh(new_inventory)
 
@@ -94,6 +123,9 @@ def update_inventory_by_product(
             error=None
         )
 
+    except StaleDataError:
+        db.rollback()
+        raise
     except SQLAlchemyError as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
@@ -102,49 +134,37 @@ def get_product_inventory_history(
     db: Session,
     product_id: str,
     page: int = 1,
-    limit: int = 100
+    limit: int = 100,
+    cursor: str | None = None,
+    include_total: bool = True
 ) -> APIResponse[PaginatedResponse[InventoryOut]]:
     try:
         page = max(1, page)
         limit = max(1, min(limit, 1000))
-        offset = (page - 1) * limit
-
-        query = db.query(Inventory)\
-            .options(joinedload(Inventory.product))\
-            .filter(Inventory.product_id == product_id)\
-            .order_by(Inventory.created_at.desc())
 
-        total_count = query.count()
-
-        history = query.offset(offset).limit(limit).all()
+        query = db.query(*INVENTORY_COLUMNS.columns, *INVENTORY_PRODUCT_COLUMNS.columns)\
+            .join(Product, Product.id == Inventory.product_id)\
+            .filter(Inventory.product_id == product_id)
+
+        history, pagination = paginate(
+            query,
+            [Inventory.id],
+            page=page,
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total,
+            descending=True
+        )
 
-        if not history:
+        if not history and not cursor:
             raise HTTPException(status_code=404, detail="No inventory records found")
 
         items = []
-        for record in history:
-            item_data = InventoryOut.model_validate({
-                **record.__dict__,
-                "product": {
-                    "id": record.product.id,
-                    "name": record.product.name,
-                    "sku": record.product.sku,
-                    "price": record.product.price,
-                    "category_id": record.product.category_id,
-                },
-                "alert": record.quantity_after <= record.threshold
-            })
-            items.append(item_data)
-
-        pagination = {
-            "total_items": total_count,
-            "total_pages": (total_count + limit - 1) // limit,
-            "current_page": page,
-            "page_size": limit,
-            "items_on_page": len(items),
-            "has_next": (page * limit) < total_count,
-            "has_previous": page > 1
-        }
+        for row in history:
+            item = INVENTORY_COLUMNS.values(row)
+            item["product"] = INVENTORY_PRODUCT_COLUMNS.values(row, offset=len(INVENTORY_COLUMNS))
+            item["alert"] = item["threshold"] is not None and item["quantity_after"] <= item["threshold"]
+            items.append(item)
 
         return APIResponse[PaginatedResponse[InventoryOut]](
             status=True,
@@ -1,54 +1,113 @@
 from decimal import Decimal
 from datetime import datetime, timezone
 from fastapi import HTTPException, status
+from sqlalchemy import insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
-from typing import Optional
+from sqlalchemy.orm.exc import StaleDataError
+from typing import Optional, List, Dict, Set, Tuple
 from ..models.sale_model import Sale
 from ..models.sale_item_model import SaleItem
 from ..models.product_model import Product
+from ..models.platform_model import Platform
 from ..models.inventory_model import Inventory
-from ..schemas.sale_item_schema import SaleOut, SaleIn, SaleItemOut
+from ..core.inventory_snapshot import get_stocks, record_inventory_change, stage_inventory_change, retry_stale_stock
+from ..core.revenue_rollup import record_revenue, to_utc_naive
+from ..core.metrics import orders_created, orders_failed, order_items
+from ..schemas.sale_item_schema import SaleOut, SaleIn, SaleItemOut, BulkOrderOut, BulkOrderResult
 from ..utils.response_wrapper import APIResponse
+from ..constants import BULK_ORDER_MAX_SIZE
 
 def create_order(
     db: Session,
     order_data: SaleIn
 ) -> SaleOut:
+    return _run_with_stock_locking(_place_order, db, order_data, source="single")
+
+
+def create_orders_bulk(
+    db: Session,
+    orders: List[SaleIn]
+) -> APIResponse[BulkOrderOut]:
+    if not orders:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At least one order must be provided"
+        )
+    if len(orders) > BULK_ORDER_MAX_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"A bulk request can contain at most {BULK_ORDER_MAX_SIZE} orders"
+        )
+    return _run_with_stock_locking(_place_orders_bulk, db, orders, source="bulk")
+
+
+def _run_with_stock_locking(place, db: Session, payload, source: str):
     try:
-        effective_date = order_data.sale_date if order_data.sale_date is not None else datetime.now(timezone.utc)
-        product_ids = [item.product_id for item in order_data.items]
+        return retry_stale_stock(lambda lock_stock: place(db, payload, lock_stock=lock_stock))
+    except StaleDataError:
+        orders_failed.labels(source=source, reason="conflict").inc(len(payload) if source == "bulk" else 1)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Stock was modified by a concurrent order, please retry"
+        )
+
+
+def _invalid_quantity(order: SaleIn) -> Optional[str]:
+    for item in order.items:
+        if item.quantity <= 0:
+            return f"Quantity of product {item.product_id} must be positive"
+    return None
+
+
+def _place_order(
+    db: Session,
+    order_data: SaleIn,
+    lock_stock: bool
+) -> SaleOut:
+    try:
+        invalid = _invalid_quantity(order_data)
+        if invalid:
+            orders_failed.labels(source="single", reason="invalid").inc()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=invalid
+            )
+
+        # sale_date is a naive column: store UTC so the rollup, the cache and raw scans agree on the day
+        effective_date = to_utc_naive(order_data.sale_date if order_data.sale_date is not None else datetime.now(timezone.utc))
+        product_ids = {item.product_id for item in order_data.items}
         
         products = db.query(Product)\
             .filter(Product.id.in_(product_ids))\
             .all()
         
         if len(products) != len(product_ids):
-            missing = set(product_ids) - {p.id for p in products}
+            missing = product_ids - {p.id for p in products}
+            orders_failed.labels(source="single", reason="not_found").inc()
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Products not found: {missing}"
             )
 
         product_map = {p.id: p for p in products}
+        stock_map = get_stocks(db, product_ids, for_update=lock_stock)
         inventory_updates = {}
         
         for item in order_data.items:
-            product = product_map[item.product_id]
-            inventory = db.query(Inventory)\
-                .filter(Inventory.product_id == product.id)\
-                .order_by(Inventory.created_at.desc())\
-                .first()
+            requested = inventory_updates.get(item.product_id, {}).get('quantity', 0) + item.quantity
+            stock = stock_map.get(item.product_id)
             
-            if inventory is None or inventory.quantity_after < item.quantity:
+            if stock is None or stock.quantity < requested:
+                orders_failed.labels(source="single", reason="out_of_stock").inc()
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Product {product.id} doesn't have enough stock"
+                    detail=f"Product {item.product_id} doesn't have enough stock"
                 )
             
-            inventory_updates[product.id] = {
-                'current': inventory,
-                'quantity': item.quantity
+            inventory_updates[item.product_id] = {
+                'current': stock,
+                'quantity': requested
             }
 
         total_amount = Decimal('0')
@@ -61,6 +120,7 @@ def create_order(
         db.flush()
 
         sale_items = []
+        revenue_lines = []
         for item in order_data.items:
             product = product_map[item.product_id]
             inventory_data = inventory_updates[product.id]
@@ -77,20 +137,23 @@ def create_order(
             db.add(sale_item)
             sale_items.append(sale_item)
             
-            db.add(Inventory(
-                product_id=product.id,
-                quantity_before=inventory_data['current'].quantity_after,
-                quantity_after=inventory_data['current'].quantity_after - item.quantity,
-                threshold=inventory_data['current'].threshold,
+            record_inventory_change(
+                db,
+                product.id,
                 quantity_changed=-item.quantity,
-                reason=f"Sold in order {sale.id}"
-            ))
+                reason=f"Sold in order {sale.id}",
+                snapshot=inventory_data['current']
+            )
             
+            revenue_lines.append(
+                (effective_date, order_data.platform_id, product.category_id, item_total, item.quantity)
+            )
             total_amount += item_total
 
         sale.total_amount = total_amount
-        db.commit()
-        
+        record_revenue(db, revenue_lines)
+
+        # built before the commit expires them, reading them afterwards costs a query per item
         data = SaleOut(
             id=sale.id,
             platform_id=sale.platform_id,
@@ -105,6 +168,10 @@ def create_order(
                 ) for item in sale_items
             ]
         )
+
+        db.commit()
+        orders_created.labels(source="single").inc()
+        order_items.observe(len(order_data.items))
         
         return APIResponse[SaleOut](
             status=True,
@@ -113,15 +180,190 @@ def create_order(
             error=None
         )
 
+    except HTTPException:
+        db.rollback()
+        raise
+    except StaleDataError:
+        db.rollback()
+        raise
+    except SQLAlchemyError as e:
+        db.rollback()
+        orders_failed.labels(source="single", reason="db_error").inc()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Database error: {str(e)}"
+        )
+    except Exception as e:
+        db.rollback()
+        orders_failed.labels(source="single", reason="error").inc()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+def _validate_bulk_order(
+    order: SaleIn,
+    product_map: Dict[str, Product],
+    platform_ids: Set[int],
+    available: Dict[str, Decimal]
+) -> Optional[Tuple[str, str]]:
+    """The failure reason and message of an order that cannot be placed, None if it can."""
+    invalid = _invalid_quantity(order)
+    if invalid:
+        return "invalid", invalid
+
+    if order.platform_id not in platform_ids:
+        return "not_found", f"Platform {order.platform_id} not found"
+
+    missing = {item.product_id for item in order.items} - product_map.keys()
+    if missing:
+        return "not_found", f"Products not found: {missing}"
+
+    requested = {}
+    for item in order.items:
+        requested[item.product_id] = requested.get(item.product_id, 0) + item.quantity
+
+    for product_id, quantity in requested.items():
+        if available.get(product_id) is None or available[product_id] < quantity:
+            return "out_of_stock", f"Product {product_id} doesn't have enough stock"
+
+    for product_id, quantity in requested.items():
+        available[product_id] -= quantity
+    return None
+
+
+def _place_orders_bulk(
+    db: Session,
+    orders: List[SaleIn],
+    lock_stock: bool
+) -> APIResponse[BulkOrderOut]:
+    try:
+        product_ids = {item.product_id for order in orders for item in order.items}
+        requested_platforms = {order.platform_id for order in orders}
+
+        products = db.query(Product)\
+            .filter(Product.id.in_(product_ids))\
+            .all()
+        product_map = {p.id: p for p in products}
+        platform_ids = {
+            platform_id for (platform_id,) in db.query(Platform.id)
+            .filter(Platform.id.in_(requested_platforms))
+        }
+        stock_map = get_stocks(db, product_map.keys(), for_update=lock_stock)
+        available = {product_id: stock.quantity for product_id, stock in stock_map.items()}
+
+        results: List[Optional[BulkOrderResult]] = [None] * len(orders)
+        accepted = []
+        rejected = []
+        for index, order in enumerate(orders):
+            failure = _validate_bulk_order(order, product_map, platform_ids, available)
+            if failure:
+                reason, error = failure
+                rejected.append(reason)
+                results[index] = BulkOrderResult(index=index, status=False, error=error)
+            else:
+                accepted.append((index, order))
+
+        now = to_utc_naive(datetime.now(timezone.utc))
+        sales = []
+        for _, order in accepted:
+            total_amount = sum(
+                (Decimal(str(product_map[item.product_id].price)) * Decimal(str(item.quantity))
+                 for item in order.items),
+                Decimal('0')
+            )
+            sales.append(Sale(
+                platform_id=order.platform_id,
+                total_amount=total_amount,
+                sale_date=to_utc_naive(order.sale_date) if order.sale_date is not None else now
+            ))
+        db.add_all(sales)
+        db.flush()
+
+        sale_item_rows = []
+        inventory_rows = []
+        revenue_lines = []
+        for (index, order), sale in zip(accepted, sales):
+            items_out = []
+            for item in order.items:
+                product = product_map[item.product_id]
+                price = Decimal(str(product.price))
+                item_total = price * Decimal(str(item.quantity))
+
+                sale_item_rows.append({
+                    "product_id": item.product_id,
+                    "sales_id": sale.id,
+                    "quantity": item.quantity,
+                    "per_item_price": price,
+                    "total_price": item_total
+                })
+                inventory_rows.append(stage_inventory_change(
+                    stock_map[item.product_id],
+                    quantity_changed=-item.quantity,
+                    reason=f"Sold in order {sale.id}"
+                ))
+                revenue_lines.append(
+                    (sale.sale_date, sale.platform_id, product.category_id, item_total, item.quantity)
+                )
+                items_out.append(SaleItemOut(
+                    product_id=item.product_id,
+                    quantity=item.quantity,
+                    per_item_price=price,
+                    total_price=item_total
+                ))
+
+            results[index] = BulkOrderResult(
+                index=index,
+                status=True,
+                data=SaleOut(
+                    id=sale.id,
+                    platform_id=sale.platform_id,
+                    total_amount=sale.total_amount,
+                    sale_date=sale.sale_date,
+                    items=items_out
+                )
+            )
+
+        if sale_item_rows:
+            db.execute(insert(SaleItem), sale_item_rows)
+        if inventory_rows:
+            db.execute(insert(Inventory), inventory_rows)
+        record_revenue(db, revenue_lines)
+        db.commit()
+
+        succeeded = len(accepted)
+        orders_created.labels(source="bulk").inc(succeeded)
+        for _, order in accepted:
+            order_items.observe(len(order.items))
+        for reason in rejected:
+            orders_failed.labels(source="bulk", reason=reason).inc()
+        return APIResponse[BulkOrderOut](
+            status=True,
+            message=f"{succeeded} of {len(orders)} orders created successfully",
+            data=BulkOrderOut(
+                total=len(orders),
+                succeeded=succeeded,
+                failed=len(orders) - succeeded,
+                results=results
+            ),
+            error=None
+        )
+
+    except StaleDataError:
+        db.rollback()
+        raise
     except SQLAlchemyError as e:
         db.rollback()
+        orders_failed.labels(source="bulk", reason="db_error").inc(len(orders))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Database error: {str(e)}"
         )
     except Exception as e:
         db.rollback()
+        orders_failed.labels(source="bulk", reason="error").inc(len(orders))
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
-        )
\ No newline at end of file
+        )
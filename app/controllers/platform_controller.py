@@ -5,12 +5,21 @@ from sqlalchemy import func
 
 from ..models.platform_model import Platform
 from ..utils.response_wrapper import APIResponse
+from ..utils.pagination import paginate
+from ..utils.projection import Projection
+from ..core.cache import cached
 from ..schemas.platform_schema import PlatformCreate, PlatformUpdate, PlatformOut
 from ..schemas.base_schema import PaginatedResponse
 
 
+PLATFORM_COLUMNS = Projection(PlatformOut, Platform)
+
+
+@cached("platforms")
 def get_platform(db: Session, platform_id: int):
     platform =  db.query(Platform).filter(Platform.id == platform_id).first()
+    if not platform:
+        raise HTTPException(status_code=404, detail="Platform not found")
     return APIResponse[PlatformOut](
         status=True,
         message="Platform retrieved successfully",
@@ -18,44 +27,39 @@ def get_platform(db: Session, platform_id: int):
         error=None
     )
 
+@cached("platforms")
 def get_platforms(
     db: Session,
     page: int = 1,
     limit: int = 100,
-    search: str = ""
+    search: str = "",
+    cursor: str | None = None,
+    include_total: bool = True
 ) -> APIResponse[PaginatedResponse[PlatformOut]]:
     try:
         if page < 1:
             page = 1
         if limit < 1:
             limit = 100
-            
-        skip = (page - 1) * limit
         
-        query = db.query(Platform)
+        query = db.query(*PLATFORM_COLUMNS.columns)
         
         if search:
             query = query.filter(Platform.name.ilike(f"%{search}%"))
         
-        platforms = query.offset(skip).limit(limit).all()
-        
-        total_count = query.with_entities(func.count(Platform.id)).scalar()
-        
-        page_count = (total_count + limit - 1) // limit if limit > 0 else 1
-        current_page = page
+        platforms, pagination = paginate(
+            query,
+            [Platform.id],
+            page=page,
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total
+        )
         
-        response_data = {
-            "items": platforms,
-            "pagination": {
-                "total_items": total_count,
-                "total_pages": page_count,
-                "current_page": current_page,
-                "page_size": limit,
-                "items_on_page": len(platforms),
-                "has_next": (page * limit) < total_count,
-                "has_previous": page > 1
-            }
-        }
+        response_data = PaginatedResponse[PlatformOut](
+            items=[PLATFORM_COLUMNS.values(row) for row in platforms],
+            pagination=pagination
+        )
         
         return APIResponse[PaginatedResponse[PlatformOut]](
             status=True,
@@ -64,6 +68,8 @@ def get_platforms(
             error=None
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error: {str(e)}")
         raise HTTPException(
@@ -93,7 +99,7 @@ def create_platform(db: Session, platform: PlatformCreate):
     )
 
 def update_platform(db: Session, platform_id: int, platform: PlatformUpdate):
-    db_platform = get_platform(db, platform_id)
+    db_platform = db.query(Platform).filter(Platform.id == platform_id).first()
     if not db_platform:
         raise HTTPException(
             status_code=404,
@@ -125,7 +131,7 @@ def update_platform(db: Session, platform_id: int, platform: PlatformUpdate):
     )
 
 def delete_platform(db: Session, platform_id: int):
-    db_platform = get_platform(db, platform_id)
+    db_platform = db.query(Platform).filter(Platform.id == platform_id).first()
     if not db_platform:
         return False
     
@@ -1,67 +1,67 @@
 from fastapi import HTTPException
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from sqlalchemy import func
 
 from ..models.product_model import Product
+from ..models.category_model import Category
 from ..schemas.product_schema import ProductCreate, ProductUpdate, ProductOut
 from ..schemas.category_schema import CategoryOut
 from ..schemas.base_schema import PaginatedResponse
 from ..utils.response_wrapper import APIResponse
+from ..utils.pagination import paginate
+from ..utils.projection import Projection
+from ..core.product_search import search_products
+from ..core.cache import cached
 
+PRODUCT_COLUMNS = Projection(ProductOut, Product)
+PRODUCT_CATEGORY_COLUMNS = Projection(CategoryOut, Category, prefix="category__")
+
+@cached("products", "categories")
 def get_all_products(
     db: Session,
     page: int = 1,
     limit: int = 100,
     search: str = "",
-    category_id: str | None = None
+    category_id: str | None = None,
+    cursor: str | None = None,
+    include_total: bool = True
 ) -> APIResponse[PaginatedResponse[ProductOut]]:
     try:
         if page < 1:
             page = 1
         if limit < 1:
             limit = 100
-            
-        skip = (page - 1) * limit
         
-        query = db.query(Product).options(joinedload(Product.category))
+        query = db.query(*PRODUCT_COLUMNS.columns, *PRODUCT_CATEGORY_COLUMNS.columns)\
+            .outerjoin(Category, Category.id == Product.category_id)
         
+        ranked_by = None
         if search:
-            query = query.filter(func.lower(Product.name).contains(func.lower(search)))
+            query, ranked_by = search_products(db, query, search)
         if category_id:
             query = query.filter(Product.category_id == category_id)
         
-        count_query = query.with_entities(func.count(Product.id))
-        total_count = count_query.scalar()
-        
-        products = query.offset(skip).limit(limit).all()
-        
-        product_data = []
-        for product in products:
-            product_dict = ProductOut.model_validate(product).model_dump()
-            
-            if product.category:
-                product_dict['category'] = CategoryOut.model_validate({
-                    'id': product.category.id,
-                    'name': product.category.name,
-                    'sku': product.category.sku
-                }).model_dump()
-            
-            product_data.append(product_dict)
-        
-        page_count = max(1, (total_count + limit - 1) // limit)
+        rows, pagination = paginate(
+            query,
+            [Product.id],
+            page=page,
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total,
+            ranked_by=ranked_by
+        )
         
+        products = []
+        for row in rows:
+            product = PRODUCT_COLUMNS.values(row)
+            category = PRODUCT_CATEGORY_COLUMNS.values(row, offset=len(PRODUCT_COLUMNS))
+            product["category"] = category if category["id"] is not None else None
+            products.append(product)
+
         response_data = PaginatedResponse[ProductOut](
-            items=product_data,
-            pagination={
-                "total_items": total_count,
-                "total_pages": page_count,
-                "current_page": page,
-                "page_size": limit,
-                "items_on_page": len(products),
-                "has_next": (page * limit) < total_count,
-                "has_previous": page > 1
-            }
+            items=products,
+            pagination=pagination
         )
         
         return APIResponse[PaginatedResponse[ProductOut]](
@@ -71,6 +71,8 @@ def get_all_products(
             error=None
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -78,6 +80,7 @@ def get_all_products(
         )
 
 
+@cached("products", "categories")
 def get_product(product_id: str, db: Session):
     product = db.query(Product).filter(Product.id == product_id.strip()).first()
     if not product:
@@ -1,20 +1,89 @@
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from decimal import Decimal
-from sqlalchemy import func
-from ..db.database import SessionLocal
+from sqlalchemy import func, or_, and_, case, true
+from sqlalchemy.orm import Session
+from ..db.database import SessionLocal, ReadSessionLocal
 from ..models.sale_model import Sale
 from ..models.category_model import Category
-from ..models.sale_model import Sale
 from ..models.sale_item_model import SaleItem
 from ..models.product_model import Product
+from ..models.daily_revenue_model import DailyRevenue
+from ..core.revenue_rollup import to_utc_naive
+from ..core.revenue_cache import cached_revenue
+from ..core.metrics import timed_analytics
+from ..constants import REVENUE_SERIES_MAX_DAYS, REVENUE_SERIES_MAX_WEEKS, REVENUE_SERIES_MAX_MONTHS
+from ..schemas.sale_item_schema import (
+    SeriesGranularity,
+    RevenueSeriesPoint,
+    RevenueSeriesOut,
+    RankingMetric,
+    ProductSalesRank,
+    ProductRankingOut
+)
 from typing import List, Tuple, Dict, Optional
 
+def _split_period(
+    start_date: datetime,
+    end_date: datetime
+) -> Tuple[Optional[Tuple[date, date]], List[Tuple[datetime, datetime]]]:
+    start_date, end_date = to_utc_naive(start_date), to_utc_naive(end_date)
+
+    # whole days before today come from the rollup, the edges and today from raw sales
+    first_day = start_date.date()
+    if start_date.time() != datetime.min.time():
+        first_day += timedelta(days=1)
+    last_day = min(end_date.date(), datetime.utcnow().date())
+
+    if first_day >= last_day:
+        return None, [(start_date, end_date)]
+
+    raw_ranges = [
+        (start_date, datetime.combine(first_day, datetime.min.time())),
+        (datetime.combine(last_day, datetime.min.time()), end_date),
+    ]
+    return (first_day, last_day), [(lo, hi) for lo, hi in raw_ranges if lo < hi]
+
+def _sale_date_in(ranges: List[Tuple[datetime, datetime]]):
+    return or_(*[and_(Sale.sale_date >= lo, Sale.sale_date < hi) for lo, hi in ranges])
+
+def _revenue_for_ranges(session: Session, periods: List[Tuple[datetime, datetime]]) -> List[Decimal]:
+    splits = [_split_period(start_date, end_date) for start_date, end_date in periods]
+    totals = [Decimal("0.00")] * len(periods)
+
+    rollup_days = {index: days for index, (days, _) in enumerate(splits) if days is not None}
+    if rollup_days:
+        row = session.query(*[
+                func.sum(case((and_(DailyRevenue.day >= lo, DailyRevenue.day < hi), DailyRevenue.revenue)))
+                for lo, hi in rollup_days.values()
+            ])\
+            .filter(
+                DailyRevenue.day >= min(lo for lo, _ in rollup_days.values()),
+                DailyRevenue.day < max(hi for _, hi in rollup_days.values())
+            )\
+            .one()
+        for index, value in zip(rollup_days, row):
+            totals[index] += value or Decimal("0.00")
+
+    raw_ranges = {index: ranges for index, (_, ranges) in enumerate(splits) if ranges}
+    if raw_ranges:
+        row = session.query(*[
+                func.sum(case((_sale_date_in(ranges), Sale.total_amount)))
+                for ranges in raw_ranges.values()
+            ])\
+            .filter(_sale_date_in([r for ranges in raw_ranges.values() for r in ranges]))\
+            .one()
+        for index, value in zip(raw_ranges, row):
+            totals[index] += value or Decimal("0.00")
+
+    return totals
+
+@timed_analytics("revenue")
+def _load_revenue(periods: List[Tuple[datetime, datetime]], primary: bool = False) -> List[Decimal]:
+    with (SessionLocal if primary else ReadSessionLocal)() as session:
+        return _revenue_for_ranges(session, periods)
+
 def get_revenue(start_date: datetime, end_date: datetime) -> Decimal:
-    with SessionLocal() as session:
-        total = session.query(func.sum(Sale.total_amount))\
-            .filter(Sale.sale_date >= start_date, Sale.sale_date < end_date)\
-            .scalar()
-        return total or Decimal("0.00")
+    return cached_revenue([(start_date, end_date)], _load_revenue)[0]
 
 def get_daily_revenue() -> Decimal:
     today = datetime.utcnow().date()
@@ -47,31 +116,25 @@ def get_custom_revenue(start_date: datetime, end_date: datetime) -> Decimal:
     if start_date >= end_date:
         raise ValueError("Start date must be before end date.")
 
-    with SessionLocal() as session:
-        total = session.query(func.sum(Sale.total_amount))\
-            .filter(Sale.sale_date >= start_date, Sale.sale_date < end_date)\
-            .scalar()
-        return total or Decimal("0.00")
+    return get_revenue(start_date, end_date)
 
 def get_revenue_for_periods(periods: List[Tuple[datetime, datetime]]) -> List[Decimal]:
-    results = []
-    with SessionLocal() as session:
-        for start_date, end_date in periods:
-            if start_date >= end_date:
-                raise ValueError(f"Start date {start_date} must be before end date {end_date}.")
-            total = session.query(func.sum(Sale.total_amount))\
-                .filter(Sale.sale_date >= start_date, Sale.sale_date < end_date)\
-                .scalar()
-            results.append(total or Decimal("0.00"))
-    return results
+    for start_date, end_date in periods:
+        if start_date >= end_date:
+            raise ValueError(f"Start date {start_date} must be before end date {end_date}.")
+    if not periods:
+        return []
 
+    return cached_revenue(periods, _load_revenue)
+
+@timed_analytics("category_revenue")
 def get_revenue_for_categories_periods(
     categories: List[str], 
     periods: Optional[List[Tuple[Optional[datetime], Optional[datetime]]]] = None
 ) -> List[Dict[str, Decimal]]:
     results = []
 
-    with SessionLocal() as session:
+    with ReadSessionLocal() as session:
         if not periods:
             query = (
                 session.query(
@@ -94,28 +157,197 @@ def get_revenue_for_categories_periods(
             if start_date is not None and end_date is not None and start_date >= end_date:
                 raise ValueError("start_date must be before end_date when both are provided")
 
-            query = (
-                session.query(
-                    Category.name.label("category_name"),
-                    func.sum(SaleItem.total_price).label("revenue")
-                )
-                .join(Product, Product.category_id == Category.id)
-                .join(SaleItem, SaleItem.product_id == Product.id)
-                .join(Sale, Sale.id == SaleItem.sales_id)
-                .filter(Category.name.in_(categories))
-            )
-
+        conditions = []
+        for start_date, end_date in periods:
+            bounds = []
             if start_date is not None:
-                query = query.filter(Sale.sale_date >= start_date)
+                bounds.append(Sale.sale_date >= to_utc_naive(start_date))
             if end_date is not None:
-                query = query.filter(Sale.sale_date < end_date)
+                bounds.append(Sale.sale_date < to_utc_naive(end_date))
+            conditions.append(and_(*bounds) if bounds else true())
 
-            query = query.group_by(Category.name)
+        query = (
+            session.query(
+                Category.name.label("category_name"),
+                *[
+                    func.sum(case((condition, SaleItem.total_price))).label(f"period_{index}")
+                    for index, condition in enumerate(conditions)
+                ]
+            )
+            .join(Product, Product.category_id == Category.id)
+            .join(SaleItem, SaleItem.product_id == Product.id)
+            .join(Sale, Sale.id == SaleItem.sales_id)
+            .filter(Category.name.in_(categories), or_(*conditions))
+            .group_by(Category.name)
+        )
+        rows = query.all()
 
-            period_revenue = {row.category_name: row.revenue or Decimal("0.00") for row in query.all()}
+        for index in range(len(periods)):
+            period_revenue = {row.category_name: row[index + 1] or Decimal("0.00") for row in rows}
             for cat in categories:
                 period_revenue.setdefault(cat, Decimal("0.00"))
             results.append(period_revenue)
 
     return results
 
+
+SERIES_MAX_POINTS = {
+    SeriesGranularity.day: REVENUE_SERIES_MAX_DAYS,
+    SeriesGranularity.week: REVENUE_SERIES_MAX_WEEKS,
+    SeriesGranularity.month: REVENUE_SERIES_MAX_MONTHS,
+}
+
+def series_point_count(start_date: date, end_date: date, granularity: SeriesGranularity) -> int:
+    first = _bucket_start(start_date, granularity)
+    if granularity == SeriesGranularity.month:
+        return (end_date.year - first.year) * 12 + end_date.month - first.month + (end_date.day > 1)
+    days = (end_date - first).days
+    return -(-days // 7) if granularity == SeriesGranularity.week else days
+
+def check_series_range(start_date: date, end_date: date, granularity: SeriesGranularity) -> None:
+    # every bucket is built and serialized even when empty, so the range bounds the work
+    if start_date >= end_date:
+        raise ValueError("Start date must be before end date.")
+    points = series_point_count(start_date, end_date, granularity)
+    if points > SERIES_MAX_POINTS[granularity]:
+        raise ValueError(
+            f"A {granularity.value} series covers at most {SERIES_MAX_POINTS[granularity]} "
+            f"{granularity.value}s, this range has {points}."
+        )
+
+def _bucket_start(day: date, granularity: SeriesGranularity) -> date:
+    if granularity == SeriesGranularity.week:
+        return day - timedelta(days=day.weekday())
+    if granularity == SeriesGranularity.month:
+        return day.replace(day=1)
+    return day
+
+def _next_bucket(bucket: date, granularity: SeriesGranularity) -> date:
+    if granularity == SeriesGranularity.week:
+        return bucket + timedelta(days=7)
+    if granularity == SeriesGranularity.month:
+        if bucket.month == 12:
+            return bucket.replace(year=bucket.year + 1, month=1)
+        return bucket.replace(month=bucket.month + 1)
+    return bucket + timedelta(days=1)
+
+@timed_analytics("revenue_series")
+def get_revenue_series(
+    start_date: date,
+    end_date: date,
+    granularity: SeriesGranularity = SeriesGranularity.day,
+    platform_id: Optional[int] = None,
+    category: Optional[str] = None
+) -> RevenueSeriesOut:
+    if start_date >= end_date:
+        raise ValueError("Start date must be before end date.")
+
+    with ReadSessionLocal() as session:
+        query = session.query(
+                DailyRevenue.day,
+                func.sum(DailyRevenue.revenue).label("revenue"),
+                func.sum(DailyRevenue.units_sold).label("units_sold")
+            )\
+            .filter(DailyRevenue.day >= start_date, DailyRevenue.day < end_date)
+
+        if platform_id is not None:
+            query = query.filter(DailyRevenue.platform_id == platform_id)
+        if category:
+            query = query.join(Category, Category.id == DailyRevenue.category_id)\
+                .filter(Category.name == category)
+
+        rows = query.group_by(DailyRevenue.day).all()
+
+    buckets = {}
+    bucket = _bucket_start(start_date, granularity)
+    while bucket < end_date:
+        buckets[bucket] = [Decimal("0.00"), 0]
+        bucket = _next_bucket(bucket, granularity)
+
+    for day, revenue, units_sold in rows:
+        if isinstance(day, str):
+            day = date.fromisoformat(day)
+        totals = buckets[_bucket_start(day, granularity)]
+        totals[0] += revenue or Decimal("0.00")
+        totals[1] += int(units_sold or 0)
+
+    points = [
+        RevenueSeriesPoint(period_start=bucket, revenue=revenue, units_sold=units_sold)
+        for bucket, (revenue, units_sold) in buckets.items()
+    ]
+    return RevenueSeriesOut(
+        granularity=granularity,
+        start_date=start_date,
+        end_date=end_date,
+        total_revenue=sum((point.revenue for point in points), Decimal("0.00")),
+        points=points
+    )
+
+
+def _product_rank(row) -> ProductSalesRank:
+    return ProductSalesRank(
+        product_id=row.id,
+        name=row.name,
+        sku=row.sku,
+        units_sold=int(row.units_sold or 0),
+        revenue=row.revenue or Decimal("0.00")
+    )
+
+@timed_analytics("product_ranking")
+def get_product_ranking(
+    start_date: datetime,
+    end_date: datetime,
+    metric: RankingMetric = RankingMetric.units,
+    limit: int = 10,
+    platform_id: Optional[int] = None,
+    category: Optional[str] = None
+) -> ProductRankingOut:
+    if start_date >= end_date:
+        raise ValueError("Start date must be before end date.")
+    limit = max(1, min(limit, 100))
+    start, end = to_utc_naive(start_date), to_utc_naive(end_date)
+
+    sale_filters = [Sale.sale_date >= start, Sale.sale_date < end]
+    if platform_id is not None:
+        sale_filters.append(Sale.platform_id == platform_id)
+
+    with ReadSessionLocal() as session:
+        units_sold = func.sum(SaleItem.quantity).label("units_sold")
+        revenue = func.sum(SaleItem.total_price).label("revenue")
+        ranked_by = units_sold if metric == RankingMetric.units else revenue
+
+        ranking = session.query(Product.id, Product.name, Product.sku, units_sold, revenue)\
+            .join(SaleItem, SaleItem.product_id == Product.id)\
+            .join(Sale, Sale.id == SaleItem.sales_id)\
+            .filter(*sale_filters)
+        products = session.query(Product.id, Product.name, Product.sku)
+        if category:
+            ranking = ranking.join(Category, Category.id == Product.category_id)\
+                .filter(Category.name == category)
+            products = products.join(Category, Category.id == Product.category_id)\
+                .filter(Category.name == category)
+        ranking = ranking.group_by(Product.id, Product.name, Product.sku)
+
+        top = ranking.order_by(ranked_by.desc(), Product.id).limit(limit).all()
+
+        # products without a single sale in the range rank lowest, so fetch them first
+        has_sales = session.query(SaleItem.id)\
+            .join(Sale, Sale.id == SaleItem.sales_id)\
+            .filter(SaleItem.product_id == Product.id, *sale_filters)\
+            .exists()
+        unsold = products.filter(~has_sales).order_by(Product.name).limit(limit).all()
+        bottom = [
+            ProductSalesRank(product_id=row.id, name=row.name, sku=row.sku, units_sold=0, revenue=Decimal("0.00"))
+            for row in unsold
+        ]
+        if len(bottom) < limit:
+            least_sold = ranking.order_by(ranked_by.asc(), Product.id).limit(limit - len(bottom)).all()
+            bottom.extend(_product_rank(row) for row in least_sold)
+
+    return ProductRankingOut(
+        metric=metric,
+        start_date=start_date,
+        end_date=end_date,
+        top=[_product_rank(row) for row in top],
+        bottom=bottom
+    )
@@ -0,0 +1,238 @@
+import argparse
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Dict, List
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from ..db.database import SessionLocal
+from app.models import Category, Platform, Product, Inventory, InventorySnapshot, Sale, SaleItem
+from .revenue_rollup import record_revenue
+from .revenue_cache import invalidate_all_revenue
+from .cache import catalog_cache
+
+DEFAULT_PLATFORMS = [
+    "Amazon", "Walmart", "Alibaba", "eBay", "Etsy",
+    "Flipkart", "AliExpress", "Target", "Rakuten", "BigCommerce"
+]
+MAX_STOCK = 99999
+RESTOCK_QUANTITY = 5000
+
+
+class SeedStats:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.rows: Dict[str, int] = {}
+
+    def add(self, table: str, count: int):
+        self.rows[table] = self.rows.get(table, 0) + count
+
+    @property
+    def total(self) -> int:
+        return sum(self.rows.values())
+
+    def rate(self) -> float:
+        return self.total / max(time.perf_counter() - self.started, 1e-9)
+
+    def report(self) -> str:
+        elapsed = time.perf_counter() - self.started
+        tables = ", ".join(f"{table}={count}" for table, count in self.rows.items())
+        return f"{self.total} rows in {elapsed:.1f}s ({self.rate():.0f} rows/sec): {tables}"
+
+
+def _next_id(db: Session, model) -> int:
+    # ids are handed out client side so executemany inserts need no RETURNING round trip;
+    # only run this against a database nothing else is writing to
+    return (db.scalar(select(func.max(model.id))) or 0) + 1
+
+
+def _insert(db: Session, model, rows: List[dict], stats: SeedStats, batch_size: int):
+    for start in range(0, len(rows), batch_size):
+        db.execute(insert(model), rows[start:start + batch_size])
+    stats.add(model.__tablename__, len(rows))
+
+
+def seed_catalog(db: Session, rng: random.Random, tag: str, categories: int, products: int, stats: SeedStats, batch_size: int):
+    category_rows = [
+        {"id": str(uuid.UUID(int=rng.getrandbits(128))), "name": f"Category {tag}-{i}", "sku": f"c{tag}-{i}"}
+        for i in range(categories)
+    ]
+    _insert(db, Category, category_rows, stats, batch_size)
+
+    category_ids = [row["id"] for row in category_rows]
+    prices = [Decimal(cents) / 100 for cents in rng.choices(range(100, 999999), k=products)]
+    product_rows = [
+        {
+            "id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "name": f"Product {tag}-{i}",
+            "sku": f"p{tag}-{i}",
+            "description": f"Generated product {i} for load testing",
+            "price": price,
+            "published": True,
+            "category_id": category_id,
+        }
+        for i, (price, category_id) in enumerate(zip(prices, rng.choices(category_ids, k=products)))
+    ]
+    _insert(db, Product, product_rows, stats, batch_size)
+
+    existing_platforms = set(db.scalars(select(Platform.name)))
+    missing = [{"name": name} for name in DEFAULT_PLATFORMS if name not in existing_platforms]
+    if missing:
+        _insert(db, Platform, missing, stats, batch_size)
+
+    db.commit()
+    return product_rows
+
+
+def seed_history(
+    db: Session,
+    rng: random.Random,
+    product_rows: List[dict],
+    orders: int,
+    years: float,
+    stats: SeedStats,
+    batch_size: int
+):
+    platform_ids = list(db.scalars(select(Platform.id)))
+    products = [(row["id"], row["price"], row["category_id"]) for row in product_rows]
+    stock = {product_id: 0 for product_id, _, _ in products}
+    thresholds = {product_id: Decimal(rng.choice([50, 75, 100])) for product_id, _, _ in products}
+    versions = {product_id: 0 for product_id, _, _ in products}
+
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    first_sale = now - timedelta(days=365 * years)
+    step = (now - first_sale) / max(orders, 1)
+    next_sale_id = _next_id(db, Sale)
+    next_item_id = _next_id(db, SaleItem)
+    next_ledger_id = _next_id(db, Inventory)
+
+    def ledger(product_id: str, changed: int, reason: str, at: datetime) -> dict:
+        nonlocal next_ledger_id
+        before = stock[product_id]
+        stock[product_id] = before + changed
+        versions[product_id] += 1
+        row = {
+            "id": next_ledger_id,
+            "product_id": product_id,
+            "quantity_before": before,
+            "quantity_changed": changed,
+            "quantity_after": before + changed,
+            "threshold": thresholds[product_id],
+            "reason": reason,
+            "created_at": at,
+        }
+        next_ledger_id += 1
+        return row
+
+    opening = [ledger(product_id, RESTOCK_QUANTITY, "Initial stock", first_sale) for product_id in stock]
+    _insert(db, Inventory, opening, stats, batch_size)
+    db.commit()
+
+    for batch_start in range(0, orders, batch_size):
+        count = min(batch_size, orders - batch_start)
+        # draw the random columns for the whole batch at once
+        item_counts = rng.choices([1, 1, 1, 2, 2, 3, 4], k=count)
+        order_platforms = rng.choices(platform_ids, k=count)
+        jitter = [rng.random() for _ in range(count)]
+        total_items = sum(item_counts)
+        item_products = rng.choices(products, k=total_items)
+        item_quantities = rng.choices([1, 1, 1, 2, 2, 3, 5], k=total_items)
+
+        sales, items, ledger_rows, revenue_lines = [], [], [], []
+        position = 0
+        for offset in range(count):
+            sale_id = next_sale_id
+            next_sale_id += 1
+            sale_date = first_sale + step * (batch_start + offset + jitter[offset])
+            total = Decimal("0.00")
+            for product, quantity in zip(
+                item_products[position:position + item_counts[offset]],
+                item_quantities[position:position + item_counts[offset]]
+            ):
+                product_id, price, category_id = product
+                if stock[product_id] < quantity:
+                    ledger_rows.append(ledger(product_id, min(RESTOCK_QUANTITY, MAX_STOCK - stock[product_id]), "Restock", sale_date))
+                line_total = price * quantity
+                total += line_total
+                items.append({
+                    "id": next_item_id,
+                    "sales_id": sale_id,
+                    "product_id": product_id,
+                    "quantity": quantity,
+                    "per_item_price": price,
+                    "total_price": line_total,
+                    "created_at": sale_date,
+                })
+                next_item_id += 1
+                ledger_rows.append(ledger(product_id, -quantity, f"Sold in order {sale_id}", sale_date))
+                revenue_lines.append((sale_date, order_platforms[offset], category_id, line_total, quantity))
+            position += item_counts[offset]
+            sales.append({
+                "id": sale_id,
+                "platform_id": order_platforms[offset],
+                "total_amount": total,
+                "sale_date": sale_date,
+                "created_at": sale_date,
+            })
+
+        _insert(db, Sale, sales, stats, batch_size)
+        _insert(db, SaleItem, items, stats, batch_size)
+        _insert(db, Inventory, ledger_rows, stats, batch_size)
+        record_revenue(db, revenue_lines)
+        db.commit()
+        print(f"  {batch_start + count}/{orders} orders, {stats.rate():.0f} rows/sec")
+
+    snapshots = [
+        {"product_id": product_id, "quantity": quantity, "threshold": thresholds[product_id], "version": versions[product_id]}
+        for product_id, quantity in stock.items()
+    ]
+    _insert(db, InventorySnapshot, snapshots, stats, batch_size)
+    db.commit()
+
+
+def seed_dataset(
+    categories: int = 20,
+    products: int = 10000,
+    orders: int = 100000,
+    years: float = 3,
+    batch_size: int = 10000,
+    seed: int = None
+) -> SeedStats:
+    stats = SeedStats()
+
+    with SessionLocal() as db:
+        # ids and skus come from the seeded generator, so a second run with the same seed
+        # seeds from what is already there instead of repeating the first one
+        rng = random.Random(seed if seed is None else f"{seed}:{db.scalar(select(func.count(Product.id)))}")
+        tag = f"{rng.getrandbits(24):06x}"
+        product_rows = seed_catalog(db, rng, tag, categories, products, stats, batch_size)
+        seed_history(db, rng, product_rows, orders, years, stats, batch_size)
+
+    # rows were written with core inserts, which the session cache hooks never see
+    catalog_cache.invalidate("categories", "products", "platforms")
+    invalidate_all_revenue()
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a large dataset for load testing")
+    parser.add_argument("--categories", type=int, default=20)
+    parser.add_argument("--products", type=int, default=10000)
+    parser.add_argument("--orders", type=int, default=100000)
+    parser.add_argument("--years", type=float, default=3, help="spread orders over this many years up to now")
+    parser.add_argument("--batch-size", type=int, default=10000, help="rows per insert and orders per transaction")
+    parser.add_argument("--seed", type=int, default=None, help="random seed for a reproducible dataset")
+    args = parser.parse_args()
+
+    stats = seed_dataset(
+        categories=args.categories,
+        products=args.products,
+        orders=args.orders,
+        years=args.years,
+        batch_size=args.batch_size,
+        seed=args.seed
+    )
+    print(f"Seeded {stats.report()}")
@@ -0,0 +1,190 @@
+import hashlib
+import inspect
+import json
+import threading
+from contextlib import ExitStack
+from functools import wraps
+from itertools import chain
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from ..constants import CACHE_KEY_PREFIX, CATALOG_CACHE_ENABLED, CATALOG_CACHE_TTL
+from ..db.replica import ReplicaRoutingSession
+from .cache_backends import CacheBackend, cache_backend
+
+MISSING = object()
+
+# table name -> [(cache, namespaces made stale by a changed row of that table)]
+_invalidation_rules: Dict[str, List[Tuple["NamespacedCache", Callable[[Any], Iterable[str]]]]] = {}
+
+
+class NamespacedCache:
+    def __init__(self, name: str, backend: CacheBackend, ttl: Optional[float], enabled: bool = True):
+        self.name = name
+        self.backend = backend
+        self.ttl = ttl
+        self.enabled = enabled
+        self.channel = f"{CACHE_KEY_PREFIX}:{name}:invalidate"
+        # local mirror of the shared generation counters, kept current by invalidation broadcasts
+        self._generations: Dict[str, int] = {}
+        self._subscription_epoch = backend.subscription_epoch
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        if enabled:
+            backend.subscribe(self.channel, self._on_invalidation)
+
+    def _counter_key(self, namespace: str) -> str:
+        return f"{CACHE_KEY_PREFIX}:{self.name}:generation:{namespace}"
+
+    def _current_generations(self, namespaces: Tuple[str, ...]) -> Optional[Tuple[int, ...]]:
+        if not namespaces:
+            return ()
+        if self.backend.listening:
+            with self._lock:
+                if self._subscription_epoch != self.backend.subscription_epoch:
+                    # resubscribed after an outage, broadcasts sent meanwhile never arrived
+                    self._generations.clear()
+                    self._subscription_epoch = self.backend.subscription_epoch
+                missing = [namespace for namespace in namespaces if namespace not in self._generations]
+            if not missing:
+                with self._lock:
+                    return tuple(self._generations[namespace] for namespace in namespaces)
+
+        counters = self.backend.get_counters([self._counter_key(namespace) for namespace in namespaces])
+        if counters is None:
+            return None
+        with self._lock:
+            for namespace, generation in zip(namespaces, counters):
+                self._generations[namespace] = max(self._generations.get(namespace, 0), generation)
+        return tuple(counters)
+
+    def _on_invalidation(self, message: str):
+        with self._lock:
+            for namespace, generation in json.loads(message).items():
+                self._generations[namespace] = max(self._generations.get(namespace, 0), generation)
+
+    def _key(self, namespaces: Tuple[str, ...], generations: Tuple[int, ...], key: Hashable) -> str:
+        # bumping a namespace generation orphans every key built with the old one,
+        # including values still being loaded while the invalidation happened
+        digest = hashlib.sha1(repr((namespaces, generations, key)).encode()).hexdigest()
+        return f"{CACHE_KEY_PREFIX}:{self.name}:{digest}"
+
+    def lookup(self, namespaces: Tuple[str, ...], key: Hashable) -> Tuple[Optional[str], Any]:
+        if not self.enabled:
+            return None, MISSING
+
+        generations = self._current_generations(namespaces)
+        if generations is None:
+            return None, MISSING
+
+        slot = self._key(namespaces, generations, key)
+        value = self.backend.get(slot, MISSING)
+        if value is MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return slot, value
+
+    def store(self, slot: Optional[str], value: Any, ttl: Any = MISSING):
+        if slot is not None:
+            self.backend.set(slot, value, self.ttl if ttl is MISSING else ttl)
+
+    def get_or_load(self, namespaces: Tuple[str, ...], key: Hashable, loader: Callable[[], Any]) -> Any:
+        slot, value = self.lookup(namespaces, key)
+        if value is MISSING:
+            value = loader()
+            self.store(slot, value)
+        return value
+
+    def invalidate(self, *namespaces: str):
+        generations = {}
+        for namespace in namespaces:
+            generation = self.backend.incr(self._counter_key(namespace))
+            if generation is not None:
+                generations[namespace] = generation
+
+        self.invalidations += 1
+        if generations:
+            self._on_invalidation(json.dumps(generations))
+            self.backend.publish(self.channel, json.dumps(generations))
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        with self._lock:
+            tracked_namespaces = len(self._generations)
+        return {
+            "enabled": self.enabled,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "invalidations": self.invalidations,
+            "tracked_namespaces": tracked_namespaces,
+            **self.backend.stats(),
+        }
+
+
+def invalidate_on_change(tablename: str, cache: NamespacedCache, namespaces):
+    rule = namespaces if callable(namespaces) else (lambda instance: namespaces)
+    _invalidation_rules.setdefault(tablename, []).append((cache, rule))
+
+
+catalog_cache = NamespacedCache("catalog", cache_backend, CATALOG_CACHE_TTL, enabled=CATALOG_CACHE_ENABLED)
+invalidate_on_change("categories", catalog_cache, ("categories", "products"))
+invalidate_on_change("products", catalog_cache, ("products",))
+invalidate_on_change("platforms", catalog_cache, ("platforms",))
+
+
+def cached(*namespaces: str):
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (func.__qualname__,) + tuple(
+                (name, value) for name, value in bound.arguments.items()
+                if not isinstance(value, Session)
+            )
+            slot, value = catalog_cache.lookup(namespaces, key)
+            if value is not MISSING:
+                return value
+            if slot is None:
+                return func(*args, **kwargs)
+
+            # filled from the primary, an entry read from a lagging replica would outlive its invalidation
+            with ExitStack() as stack:
+                for argument in bound.arguments.values():
+                    if isinstance(argument, ReplicaRoutingSession):
+                        stack.enter_context(argument.primary_reads())
+                value = func(*args, **kwargs)
+            catalog_cache.store(slot, value)
+            return value
+
+        return wrapper
+    return decorator
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_stale_namespaces(session, flush_context):
+    stale = session.info.setdefault("stale_cache_namespaces", {})
+    for instance in chain(session.new, session.dirty, session.deleted):
+        for cache, rule in _invalidation_rules.get(getattr(instance, "__tablename__", None), ()):
+            stale.setdefault(cache, set()).update(rule(instance))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session):
+    stale = session.info.pop("stale_cache_namespaces", None) or {}
+    for cache, namespaces in stale.items():
+        if namespaces:
+            cache.invalidate(*namespaces)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session):
+    session.info.pop("stale_cache_namespaces", None)
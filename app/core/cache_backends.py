@@ -0,0 +1,242 @@
+import logging
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+from ..constants import CACHE_BACKEND, CACHE_REDIS_URL, CACHE_MAX_ENTRIES
+from ..utils.blocking import run_blocking
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend:
+    name = "base"
+    # True while published messages are known to reach this process's subscribers
+    listening = False
+    # bumped whenever the subscription is re-established, messages published before may have been missed
+    subscription_epoch = 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        raise NotImplementedError
+
+    def get_counters(self, keys: List[str]) -> Optional[List[int]]:
+        raise NotImplementedError
+
+    def incr(self, key: str) -> Optional[int]:
+        raise NotImplementedError
+
+    def publish(self, channel: str, message: str):
+        raise NotImplementedError
+
+    def subscribe(self, channel: str, handler: Callable[[str], None]):
+        raise NotImplementedError
+
+    def ping(self):
+        pass
+
+    def stats(self) -> dict:
+        return {"backend": self.name, "listening": self.listening}
+
+
+class MemoryBackend(CacheBackend):
+    name = "memory"
+    listening = True
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._counters: Dict[str, int] = {}
+        self._handlers: Dict[str, List[Callable[[str], None]]] = {}
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_counters(self, keys: List[str]) -> List[int]:
+        with self._lock:
+            return [self._counters.get(key, 0) for key in keys]
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def publish(self, channel: str, message: str):
+        for handler in self._handlers.get(channel, []):
+            handler(message)
+
+    def subscribe(self, channel: str, handler: Callable[[str], None]):
+        self._handlers.setdefault(channel, []).append(handler)
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = len(self._entries)
+        return {
+            **super().stats(),
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+        }
+
+
+class RedisBackend(CacheBackend):
+    name = "redis"
+
+    def __init__(
+        self,
+        url: str,
+        client=None,
+        resubscribe_min_delay: float = 0.5,
+        resubscribe_max_delay: float = 30.0
+    ):
+        try:
+            import redis
+        except ImportError:
+            raise ValueError("CACHE_BACKEND=redis requires the redis package (pip install redis)")
+
+        # any server speaking the Redis protocol works, a fake client can be passed in for local testing
+        self.client = client if client is not None else redis.Redis.from_url(url)
+        self._errors = (redis.RedisError, OSError)
+        self._subscriptions = {}
+        self._listener = None
+        self._subscribe_lock = threading.Lock()
+        self._resubscribe_timer = None
+        self._resubscribe_attempts = 0
+        self.resubscribe_min_delay = resubscribe_min_delay
+        self.resubscribe_max_delay = resubscribe_max_delay
+        self.errors = 0
+        self.resubscribes = 0
+
+    @property
+    def listening(self) -> bool:
+        return self._listener is not None and self._listener.is_alive()
+
+    def _failed(self, action: str, error: Exception):
+        # a broken cache must never fail the request, callers treat errors as misses
+        self.errors += 1
+        logger.warning("Cache backend %s failed: %s", action, error)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            raw = run_blocking(self.client.get, key)
+        except self._errors as e:
+            self._failed("get", e)
+            return default
+        return default if raw is None else pickle.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        try:
+            if ttl is None:
+                run_blocking(self.client.set, key, pickle.dumps(value))
+            else:
+                run_blocking(self.client.set, key, pickle.dumps(value), px=max(1, int(ttl * 1000)))
+        except self._errors as e:
+            self._failed("set", e)
+
+    def get_counters(self, keys: List[str]) -> Optional[List[int]]:
+        try:
+            return [int(value or 0) for value in run_blocking(self.client.mget, keys)]
+        except self._errors as e:
+            self._failed("get_counters", e)
+            return None
+
+    def incr(self, key: str) -> Optional[int]:
+        try:
+            return run_blocking(self.client.incr, key)
+        except self._errors as e:
+            self._failed("incr", e)
+            return None
+
+    def publish(self, channel: str, message: str):
+        try:
+            run_blocking(self.client.publish, channel, message)
+        except self._errors as e:
+            self._failed("publish", e)
+
+    def subscribe(self, channel: str, handler: Callable[[str], None]):
+        def dispatch(message):
+            data = message["data"]
+            handler(data.decode() if isinstance(data, bytes) else data)
+
+        self._subscriptions[channel] = dispatch
+        self._listen()
+
+    def _listen(self):
+        # (re)subscribe every channel on a fresh connection, retrying with backoff while Redis is unreachable
+        with self._subscribe_lock:
+            self._resubscribe_timer = None
+            if self._listener is not None:
+                self._listener.stop()
+                self._listener = None
+            try:
+                pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(**self._subscriptions)
+                self._listener = pubsub.run_in_thread(
+                    sleep_time=1.0,
+                    daemon=True,
+                    exception_handler=self._listener_failed
+                )
+            except self._errors as e:
+                self._failed("subscribe", e)
+                self._schedule_resubscribe()
+                return
+            self._resubscribe_attempts = 0
+            self.subscription_epoch += 1
+
+    def _schedule_resubscribe(self):
+        if self._resubscribe_timer is not None:
+            return
+        delay = min(self.resubscribe_max_delay, self.resubscribe_min_delay * 2 ** self._resubscribe_attempts)
+        self._resubscribe_attempts += 1
+        self.resubscribes += 1
+        logger.info("Resubscribing to cache invalidations in %.1fs", delay)
+        self._resubscribe_timer = threading.Timer(delay, self._listen)
+        self._resubscribe_timer.daemon = True
+        self._resubscribe_timer.start()
+
+    def ping(self):
+        run_blocking(self.client.ping)
+
+    def _listener_failed(self, error, pubsub, thread):
+        self._failed("subscription", error)
+        thread.stop()
+        with self._subscribe_lock:
+            if self._listener is thread:
+                self._listener = None
+                self._schedule_resubscribe()
+
+    def stats(self) -> dict:
+        return {**super().stats(), "errors": self.errors, "resubscribes": self.resubscribes}
+
+
+def create_backend() -> CacheBackend:
+    if CACHE_BACKEND == "redis":
+        return RedisBackend(CACHE_REDIS_URL)
+    return MemoryBackend(CACHE_MAX_ENTRIES)
+
+
+cache_backend = create_backend()
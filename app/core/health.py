@@ -0,0 +1,121 @@
+import time
+from typing import Awaitable, Callable
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool
+from starlette.concurrency import run_in_threadpool
+
+from ..db.database import engine, async_engine
+from .cache_backends import cache_backend
+from ..constants import (
+    HEALTH_DB_MAX_LATENCY_MS,
+    HEALTH_POOL_MAX_SATURATION,
+    HEALTH_CHECK_CACHE,
+    HEALTH_CACHE_MAX_LATENCY_MS
+)
+
+
+def _timed_probe(probe: Callable[[], None], threshold_ms: float) -> dict:
+    started = time.perf_counter()
+    try:
+        probe()
+    except Exception as e:
+        return {"status": "fail", "threshold_ms": threshold_ms, "error": str(e)}
+    return _probe_latency(started, threshold_ms)
+
+
+async def _timed_async_probe(probe: Callable[[], Awaitable[None]], threshold_ms: float) -> dict:
+    started = time.perf_counter()
+    try:
+        await probe()
+    except Exception as e:
+        return {"status": "fail", "threshold_ms": threshold_ms, "error": str(e)}
+    return _probe_latency(started, threshold_ms)
+
+
+def _probe_latency(started: float, threshold_ms: float) -> dict:
+    latency_ms = round((time.perf_counter() - started) * 1000, 3)
+    return {
+        "status": "ok" if latency_ms <= threshold_ms else "fail",
+        "latency_ms": latency_ms,
+        "threshold_ms": threshold_ms
+    }
+
+
+def check_pool(pool=None) -> dict:
+    pool = engine.pool if pool is None else pool
+    if not isinstance(pool, QueuePool):
+        return {"status": "ok", "pool_class": type(pool).__name__}
+
+    checked_out = pool.checkedout()
+    # max_overflow=-1 lets the pool open as many connections as requested, it never saturates
+    if pool._max_overflow < 0:
+        return {"status": "ok", "checked_out": checked_out, "capacity": None, "saturation": None}
+
+    capacity = pool.size() + pool._max_overflow
+    saturation = round(checked_out / capacity, 4) if capacity else 0.0
+    return {
+        "status": "ok" if saturation <= HEALTH_POOL_MAX_SATURATION else "fail",
+        "checked_out": checked_out,
+        "capacity": capacity,
+        "saturation": saturation,
+        "threshold": HEALTH_POOL_MAX_SATURATION
+    }
+
+
+def _exhausted_pool() -> dict:
+    return {"status": "fail", "threshold_ms": HEALTH_DB_MAX_LATENCY_MS, "error": "no free connection in the pool"}
+
+
+def _pool_exhausted(pool_check: dict) -> bool:
+    capacity = pool_check.get("capacity")
+    return capacity is not None and pool_check["checked_out"] >= capacity
+
+
+def check_database(pool_exhausted: bool = False) -> dict:
+    # waiting for a connection could take the whole pool timeout, report the exhausted pool instead
+    if pool_exhausted:
+        return _exhausted_pool()
+
+    def probe():
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+    return _timed_probe(probe, HEALTH_DB_MAX_LATENCY_MS)
+
+
+async def check_async_database(pool_exhausted: bool = False) -> dict:
+    if pool_exhausted:
+        return _exhausted_pool()
+
+    async def probe():
+        async with async_engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    return await _timed_async_probe(probe, HEALTH_DB_MAX_LATENCY_MS)
+
+
+def check_cache() -> dict:
+    return {"backend": cache_backend.name, **_timed_probe(cache_backend.ping, HEALTH_CACHE_MAX_LATENCY_MS)}
+
+
+def _checks() -> dict:
+    checks = {"pool": check_pool()}
+    checks["database"] = check_database(_pool_exhausted(checks["pool"]))
+    if HEALTH_CHECK_CACHE:
+        checks["cache"] = check_cache()
+    return checks
+
+
+def _report(checks: dict) -> dict:
+    ready = all(check["status"] == "ok" for check in checks.values())
+    return {"status": "ready" if ready else "unavailable", "checks": checks}
+
+
+async def readiness() -> dict:
+    # with DB_ASYNC=true the API is served from the async engine's own pool, which is probed
+    # on the event loop it belongs to; the sync engine still serves caches and exports
+    checks = await run_in_threadpool(_checks)
+    if async_engine is not None:
+        checks["async_pool"] = check_pool(async_engine.sync_engine.pool)
+        checks["async_database"] = await check_async_database(_pool_exhausted(checks["async_pool"]))
+    return _report(checks)
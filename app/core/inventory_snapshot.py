@@ -0,0 +1,132 @@
+from decimal import Decimal
+from typing import Callable, Dict, Iterable, Optional, TypeVar
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+
+from ..db.database import SessionLocal
+from ..constants import STOCK_LOCKING_MODE, STOCK_UPDATE_MAX_RETRIES
+from app.models import Inventory, InventorySnapshot
+
+T = TypeVar("T")
+
+
+def get_stock(db: Session, product_id: str, for_update: bool = False) -> Optional[InventorySnapshot]:
+    if for_update:
+        return db.get(InventorySnapshot, product_id, with_for_update=True)
+    return db.get(InventorySnapshot, product_id)
+
+
+def get_stocks(
+    db: Session,
+    product_ids: Iterable[str],
+    for_update: bool = False
+) -> Dict[str, InventorySnapshot]:
+    product_ids = set(product_ids)
+    if not product_ids:
+        return {}
+    query = db.query(InventorySnapshot)\
+        .filter(InventorySnapshot.product_id.in_(product_ids))
+    if for_update:
+        # lock rows in primary key order so concurrent orders can't deadlock each other
+        query = query.order_by(InventorySnapshot.product_id)\
+            .with_for_update()\
+            .populate_existing()
+    return {snapshot.product_id: snapshot for snapshot in query.all()}
+
+
+def retry_stale_stock(update: Callable[[bool], T]) -> T:
+    """Run ``update(lock_stock)``, running it again when a concurrent writer changed a stock row first.
+
+    Snapshot writes are checked against their version in both modes: a database that ignores
+    ``FOR UPDATE`` (SQLite) can still lose the race in pessimistic mode. ``update`` must roll
+    back before letting the StaleDataError out; the last one is re-raised once retries run out.
+    """
+    lock_stock = STOCK_LOCKING_MODE == "pessimistic"
+    for attempt in range(STOCK_UPDATE_MAX_RETRIES + 1):
+        try:
+            return update(lock_stock)
+        except StaleDataError:
+            if attempt == STOCK_UPDATE_MAX_RETRIES:
+                raise
+
+
+def stage_inventory_change(
+    snapshot: InventorySnapshot,
+    quantity_changed: Decimal,
+    reason: Optional[str] = None,
+    threshold: Optional[Decimal] = None
+) -> Dict:
+    if threshold is None:
+        threshold = snapshot.threshold
+
+    row = {
+        "product_id": snapshot.product_id,
+        "quantity_before": snapshot.quantity,
+        "quantity_after": snapshot.quantity + quantity_changed,
+        "quantity_changed": quantity_changed,
+        "threshold": threshold,
+        "reason": reason
+    }
+
+    snapshot.quantity = row["quantity_after"]
+    snapshot.threshold = threshold
+    snapshot.version += 1
+
+    return row
+
+
+def record_inventory_change(
+    db: Session,
+    product_id: str,
+    quantity_changed: Decimal,
+    reason: Optional[str] = None,
+    threshold: Optional[Decimal] = None,
+    snapshot: Optional[InventorySnapshot] = None
+) -> Inventory:
+    if snapshot is None:
+        snapshot = get_stock(db, product_id)
+
+    if snapshot is None:
+        snapshot = InventorySnapshot(
+            product_id=product_id,
+            quantity=Decimal(0),
+            threshold=threshold,
+            version=0
+        )
+        db.add(snapshot)
+
+    inventory = Inventory(**stage_inventory_change(snapshot, quantity_changed, reason, threshold))
+    db.add(inventory)
+
+    return inventory
+
+
+def rebuild_inventory_snapshots(db: Session, batch_size: int = 1000) -> int:
+    rows = db.query(Inventory.product_id, Inventory.quantity_after, Inventory.threshold)\
+        .order_by(Inventory.created_at.asc(), Inventory.id.asc())\
+        .yield_per(batch_size)
+
+    snapshots = {}
+    for product_id, quantity_after, threshold in rows:
+        version = snapshots[product_id]["version"] + 1 if product_id in snapshots else 1
+        snapshots[product_id] = {
+            "product_id": product_id,
+            "quantity": quantity_after,
+            "threshold": threshold,
+            "version": version
+        }
+
+    db.query(InventorySnapshot).delete(synchronize_session=False)
+    values = list(snapshots.values())
+    for start in range(0, len(values), batch_size):
+        db.execute(insert(InventorySnapshot), values[start:start + batch_size])
+    db.commit()
+
+    return len(values)
+
+
+if __name__ == "__main__":
+    with SessionLocal() as session:
+        count = rebuild_inventory_snapshots(session)
+    print(f"Rebuilt inventory snapshots for {count} products")
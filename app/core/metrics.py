@@ -0,0 +1,87 @@
+import os
+import time
+from functools import wraps
+
+from ..constants import METRICS_ENABLED
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+ORDER_ITEM_BUCKETS = (1, 2, 3, 4, 5, 10, 20, 50, 100)
+
+
+class _NoopMetric:
+    def labels(self, *args, **kwargs):
+        return self
+
+    def inc(self, amount: float = 1):
+        pass
+
+    def observe(self, value: float):
+        pass
+
+
+if METRICS_ENABLED:
+    try:
+        # reads PROMETHEUS_MULTIPROC_DIR on import: with it set every worker writes its
+        # samples to memory-mapped files there and /metrics adds them up across workers
+        from prometheus_client import Counter, Histogram
+    except ImportError:
+        raise ValueError("METRICS_ENABLED requires the prometheus-client package (pip install prometheus-client)")
+
+    http_requests = Counter(
+        "http_requests_total", "HTTP requests by route and status", ["method", "route", "status"]
+    )
+    http_request_duration = Histogram(
+        "http_request_duration_seconds", "HTTP request latency by route", ["method", "route"],
+        buckets=LATENCY_BUCKETS
+    )
+    orders_created = Counter(
+        "orders_created_total", "Orders placed", ["source"]
+    )
+    orders_failed = Counter(
+        "orders_failed_total", "Orders rejected or failed, by reason", ["source", "reason"]
+    )
+    order_items = Histogram(
+        "order_items", "Items per placed order", buckets=ORDER_ITEM_BUCKETS
+    )
+    analytics_query_duration = Histogram(
+        "analytics_query_duration_seconds", "Sales analysis query time", ["query"],
+        buckets=LATENCY_BUCKETS
+    )
+else:
+    http_requests = http_request_duration = _NoopMetric()
+    orders_created = orders_failed = order_items = _NoopMetric()
+    analytics_query_duration = _NoopMetric()
+
+
+def timed_analytics(query: str):
+    """Observe how long the decorated sales analysis query takes, under ``query``."""
+    def decorator(func):
+        if not METRICS_ENABLED:
+            return func
+
+        histogram = analytics_query_duration.labels(query=query)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - started)
+
+        return wrapper
+    return decorator
+
+
+def render_metrics():
+    """The exposition text of every metric and its content type."""
+    from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, generate_latest
+
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
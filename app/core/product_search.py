@@ -0,0 +1,97 @@
+import re
+from typing import List, Tuple
+from sqlalchemy import func, inspect, literal_column, or_, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Query, Session
+
+from ..db.database import SessionLocal
+from .cache import catalog_cache
+from app.models import Product
+from app.models.product_model import PRODUCT_SEARCH_DDL
+
+SEARCH_TERM = re.compile(r"\w+")
+
+
+def search_terms(search: str) -> List[str]:
+    return SEARCH_TERM.findall(search.lower())
+
+
+def _mysql_search(query: Query, terms: List[str]) -> Tuple[Query, list]:
+    from sqlalchemy.dialects.mysql import match
+
+    # every term required, each matched as a prefix
+    relevance = match(
+        Product.name, Product.sku, Product.description,
+        against=" ".join(f"+{term}*" for term in terms)
+    ).in_boolean_mode()
+    return query.filter(relevance > 0), [relevance.desc()]
+
+
+def _sqlite_search(query: Query, terms: List[str]) -> Tuple[Query, list]:
+    # bm25 is lower for better matches, a hit in the name weighs more than one in the description
+    matches = select(
+            literal_column("rowid").label("rowid"),
+            literal_column("bm25(products_fts, 10.0, 5.0, 1.0)").label("score")
+        )\
+        .select_from(text("products_fts"))\
+        .where(text("products_fts MATCH :match").bindparams(
+            match=" ".join(f'"{term}"*' for term in terms)
+        ))\
+        .subquery()
+    query = query.join(matches, literal_column("products.rowid") == matches.c.rowid)
+    return query, [matches.c.score.asc()]
+
+
+def _substring_search(query: Query, terms: List[str]) -> Tuple[Query, list]:
+    for term in terms:
+        query = query.filter(or_(
+            func.lower(Product.name).contains(term),
+            func.lower(Product.sku).contains(term),
+            func.lower(Product.description).contains(term)
+        ))
+    return query, []
+
+
+SEARCH_BACKENDS = {
+    "mysql": _mysql_search,
+    "sqlite": _sqlite_search,
+}
+
+
+def search_products(db: Session, query: Query, search: str) -> Tuple[Query, list]:
+    """Filter a product query by a search string, returning it with its relevance ordering."""
+    terms = search_terms(search)
+    if not terms:
+        return query, []
+    backend = SEARCH_BACKENDS.get(db.get_bind().dialect.name, _substring_search)
+    return backend(query, terms)
+
+
+def search_index_exists(connection: Connection) -> bool:
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        return "products_fts" in inspect(connection).get_table_names()
+    if dialect == "mysql":
+        return any(index["name"] == "ft_products_search" for index in inspect(connection).get_indexes("products"))
+    return True
+
+
+def create_search_index(connection: Connection) -> None:
+    # the index is created along with the products table, this adds it to one that predates it
+    for statement in PRODUCT_SEARCH_DDL.get(connection.dialect.name, []):
+        connection.execute(text(statement))
+
+
+def rebuild_search_index(db: Session) -> None:
+    # MySQL maintains its FULLTEXT index itself, the FTS5 table can drift if triggers were skipped
+    if db.get_bind().dialect.name == "sqlite":
+        db.execute(text("INSERT INTO products_fts(products_fts) VALUES ('rebuild')"))
+        db.commit()
+        # cached search pages were answered by the drifted index
+        catalog_cache.invalidate("products")
+
+
+if __name__ == "__main__":
+    with SessionLocal() as session:
+        rebuild_search_index(session)
+    print("Rebuilt product search index")
@@ -0,0 +1,89 @@
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Callable, List, Tuple
+from sqlalchemy import inspect
+
+from ..constants import REVENUE_CACHE_ENABLED, REVENUE_CACHE_OPEN_TTL, REVENUE_CACHE_CLOSED_TTL
+from .cache import NamespacedCache, MISSING, invalidate_on_change
+from .cache_backends import cache_backend
+from .revenue_rollup import to_utc_naive
+
+# bumped when the rollup is rebuilt, every cached total depends on it
+ALL_REVENUE = "all"
+
+revenue_cache = NamespacedCache("revenue", cache_backend, None, enabled=REVENUE_CACHE_ENABLED)
+
+
+def _next_month(day: date) -> date:
+    if day.month == 12:
+        return day.replace(year=day.year + 1, month=1, day=1)
+    return day.replace(month=day.month + 1, day=1)
+
+
+def range_namespaces(start: datetime, end: datetime) -> Tuple[str, ...]:
+    # cover [start, end) with as few whole years and months as possible, days at the edges
+    first_day = start.date()
+    last_day = end.date() if end.time() == datetime.min.time() else end.date() + timedelta(days=1)
+
+    namespaces = [ALL_REVENUE]
+    day = first_day
+    while day < last_day:
+        if day.month == 1 and day.day == 1 and day.replace(year=day.year + 1) <= last_day:
+            namespaces.append(f"year:{day.year}")
+            day = day.replace(year=day.year + 1)
+        elif day.day == 1 and _next_month(day) <= last_day:
+            namespaces.append(f"month:{day:%Y-%m}")
+            day = _next_month(day)
+        else:
+            namespaces.append(f"day:{day.isoformat()}")
+            day += timedelta(days=1)
+    return tuple(namespaces)
+
+
+def _sale_namespaces(sale) -> Tuple[str, ...]:
+    sale_date = inspect(sale).dict.get("sale_date")
+    if sale_date is None:
+        return ()
+    day = to_utc_naive(sale_date).date()
+    return f"year:{day.year}", f"month:{day:%Y-%m}", f"day:{day.isoformat()}"
+
+
+def cached_revenue(
+    periods: List[Tuple[datetime, datetime]],
+    load: Callable[[List[Tuple[datetime, datetime]], bool], List[Decimal]]
+) -> List[Decimal]:
+    # ranges ending before today can only change through a backdated sale, which
+    # invalidates them on commit, and expire after a day so unused ranges don't pile
+    # up in the backend; ranges reaching into today expire quickly.
+    # closed ranges are kept until that commit, so they are loaded from the primary:
+    # a lagging replica could still answer with the total from before the sale
+    today = datetime.combine(datetime.utcnow().date(), datetime.min.time())
+    totals = [None] * len(periods)
+    pending = {True: {}, False: {}}
+
+    for index, (start_date, end_date) in enumerate(periods):
+        start_date, end_date = to_utc_naive(start_date), to_utc_naive(end_date)
+        closed = end_date <= today
+        namespaces = range_namespaces(start_date, end_date) if closed else (ALL_REVENUE,)
+        slot, value = revenue_cache.lookup(namespaces, ("revenue", start_date, end_date))
+        if value is MISSING:
+            pending[closed][index] = (slot, REVENUE_CACHE_CLOSED_TTL if closed else REVENUE_CACHE_OPEN_TTL)
+        else:
+            totals[index] = value
+
+    for closed, missing in pending.items():
+        if not missing:
+            continue
+        loaded = load([periods[index] for index in missing], closed)
+        for (index, (slot, ttl)), value in zip(missing.items(), loaded):
+            revenue_cache.store(slot, value, ttl)
+            totals[index] = value
+
+    return totals
+
+
+def invalidate_all_revenue():
+    revenue_cache.invalidate(ALL_REVENUE)
+
+
+invalidate_on_change("sales", revenue_cache, _sale_namespaces)
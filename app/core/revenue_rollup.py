@@ -0,0 +1,99 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Iterable, Tuple
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from ..db.database import SessionLocal
+from app.models import DailyRevenue, Sale, SaleItem, Product
+
+
+def to_utc_naive(value: datetime) -> datetime:
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _upsert_statement(db: Session):
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+        stmt = mysql_insert(DailyRevenue)
+        return stmt.on_duplicate_key_update(
+            revenue=DailyRevenue.revenue + stmt.inserted.revenue,
+            units_sold=DailyRevenue.units_sold + stmt.inserted.units_sold
+        )
+
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as conflict_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as conflict_insert
+    stmt = conflict_insert(DailyRevenue)
+    return stmt.on_conflict_do_update(
+        index_elements=[DailyRevenue.day, DailyRevenue.platform_id, DailyRevenue.category_id],
+        set_={
+            "revenue": DailyRevenue.revenue + stmt.excluded.revenue,
+            "units_sold": DailyRevenue.units_sold + stmt.excluded.units_sold
+        }
+    )
+
+
+def record_revenue(
+    db: Session,
+    lines: Iterable[Tuple[datetime, int, str, Decimal, int]]
+) -> None:
+    totals = {}
+    for sale_date, platform_id, category_id, revenue, units in lines:
+        key = (to_utc_naive(sale_date).date(), platform_id, category_id)
+        current_revenue, current_units = totals.get(key, (Decimal("0"), 0))
+        totals[key] = (current_revenue + revenue, current_units + int(units))
+
+    if not totals:
+        return
+
+    db.execute(_upsert_statement(db), [
+        {
+            "day": day,
+            "platform_id": platform_id,
+            "category_id": category_id,
+            "revenue": revenue,
+            "units_sold": units
+        }
+        for (day, platform_id, category_id), (revenue, units) in totals.items()
+    ])
+
+
+def rebuild_daily_revenue(db: Session) -> int:
+    day = func.date(Sale.sale_date)
+    history = select(
+            day,
+            Sale.platform_id,
+            Product.category_id,
+            func.sum(SaleItem.total_price),
+            func.sum(SaleItem.quantity)
+        )\
+        .select_from(SaleItem)\
+        .join(Sale, Sale.id == SaleItem.sales_id)\
+        .join(Product, Product.id == SaleItem.product_id)\
+        .where(Sale.sale_date.isnot(None))\
+        .group_by(day, Sale.platform_id, Product.category_id)
+
+    db.query(DailyRevenue).delete(synchronize_session=False)
+    result = db.execute(
+        insert(DailyRevenue).from_select(
+            ["day", "platform_id", "category_id", "revenue", "units_sold"],
+            history
+        )
+    )
+    db.commit()
+
+    from .revenue_cache import invalidate_all_revenue
+    invalidate_all_revenue()
+
+    return result.rowcount
+
+
+if __name__ == "__main__":
+    with SessionLocal() as session:
+        count = rebuild_daily_revenue(session)
+    print(f"Rebuilt {count} daily revenue rows")
@@ -1,15 +1,19 @@
 from sqlalchemy.orm import Session
-from app.models import Product, Inventory, Category, Platform
-from ..controllers.order_controller import create_order
+from app.models import Product, Category, Platform
+from ..controllers.order_controller import create_orders_bulk
+from .inventory_snapshot import get_stocks, record_inventory_change
 from ..schemas.sale_item_schema import SaleIn, SaleItemIn
 from decimal import Decimal
-from ..db.database import SessionLocal 
+from ..db.database import SessionLocal
 from sqlalchemy.exc import IntegrityError
 import random
 from sqlalchemy import select
 from datetime import datetime, timedelta, timezone
 from sqlalchemy import func
 
+# each seeder checks what exists with one query and writes the rest in a single
+# transaction; an IntegrityError means another worker seeded the same rows first
+
 def seed_categories():
     db: Session = SessionLocal()
     categories = [
@@ -25,20 +29,16 @@ def seed_categories():
         {"name": "Office Supplies", "sku": "office-supplies-010"}
     ]
 
-
-    for cat in categories:
-        existing = db.query(Category).filter_by(name=cat["name"]).first()
-        if not existing:
-            try:
-                new_category = Category(**cat)
-                db.add(new_category)
-                db.commit()
-            except IntegrityError:
-                db.rollback()
-                print(f"Category {cat['name']} already exists. Skipping.")
-            except Exception as e:
-                db.rollback()
-                print(f"Error adding {cat['name']}: {e}")
+    existing = set(db.scalars(select(Category.name)))
+    try:
+        db.add_all([Category(**cat) for cat in categories if cat["name"] not in existing])
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        print("Categories were seeded concurrently. Skipping.")
+    except Exception as e:
+        db.rollback()
+        print(f"Error adding categories: {e}")
     db.close()
 
 def seed_products():
@@ -49,40 +49,32 @@ def seed_products():
         print("No categories found. Skipping product seeding.")
         return
 
-    product_names = [
-        f"Product {i}" for i in range(1, 51)
-    ]
-
-    for i, name in enumerate(product_names):
-        sku = f"{name.lower().replace(' ', '-')}-{random.randint(1000,9999)}"
-        price = Decimal(f"{random.randint(100, 10000) / 100:.2f}")
-        description = f"Description for {name}"
-        category = random.choice(categories)
-
-        existing_product = db.query(Product).filter_by(sku=sku).first()
-        if existing_product:
+    existing = set(db.scalars(select(Product.name)))
+    products = []
+    for name in [f"Product {i}" for i in range(1, 51)]:
+        if name in existing:
             continue
-
-        try:
-            product = Product(
-                name=name,
-                sku=sku,
-                price=price,
-                published=bool(random.getrandbits(1)),
-                description=description,
-                category_id=category.id
-            )
-            db.add(product)
-            db.commit()
-        except IntegrityError:
-            db.rollback()
-        except Exception as e:
-            db.rollback()
-            print(f"Error adding product {name}: {e}")
+        products.append(Product(
+            name=name,
+            sku=f"{name.lower().replace(' ', '-')}-{random.randint(1000,9999)}",
+            price=Decimal(f"{random.randint(100, 10000) / 100:.2f}"),
+            published=bool(random.getrandbits(1)),
+            description=f"Description for {name}",
+            category_id=random.choice(categories).id
+        ))
+
+    try:
+        db.add_all(products)
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+    except Exception as e:
+        db.rollback()
+        print(f"Error adding products: {e}")
 
     db.close()
-    
-    
+
+
 def seed_inventory_history():
     db: Session = SessionLocal()
     products = db.query(Product).all()
@@ -91,41 +83,27 @@ def seed_inventory_history():
         print("No products found. Skipping inventory seeding.")
         return
 
-    for product in products:
-        last_inventory = (
-            db.query(Inventory)
-            .filter(Inventory.product_id == product.id)
-            .order_by(Inventory.created_at.desc())
-            .first()
-        )
-
-        quantity_before = last_inventory.quantity_after if last_inventory else Decimal(0)
-        quantity_changed = Decimal(random.randint(5, 50))
-        quantity_after = quantity_before + quantity_changed
-        threshold = Decimal(random.choice([50, 75, 100]))
-        reason = f"Initial stock added for {product.name}"
-
-        try:
-            inventory = Inventory(
-                product_id=product.id,
-                quantity_before=quantity_before,
-                quantity_after=quantity_after,
-                quantity_changed=quantity_changed,
-                threshold=threshold,
-                reason=reason,
-                created_at=datetime.utcnow()
+    stocks = get_stocks(db, [product.id for product in products])
+    try:
+        for product in products:
+            record_inventory_change(
+                db,
+                product.id,
+                quantity_changed=Decimal(random.randint(5, 50)),
+                reason=f"Initial stock added for {product.name}",
+                threshold=Decimal(random.choice([50, 75, 100])),
+                snapshot=stocks.get(product.id)
             )
-            db.add(inventory)
-            db.commit()
-        except IntegrityError:
-            db.rollback()
-        except Exception as e:
-            db.rollback()
-            print(f"Error adding inventory for {product.name}: {e}")
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+    except Exception as e:
+        db.rollback()
+        print(f"Error adding inventory: {e}")
 
     db.close()
-    
-    
+
+
 def seed_platforms():
     db: Session = SessionLocal()
     platforms = [
@@ -133,23 +111,22 @@ def seed_platforms():
         "Flipkart", "AliExpress", "Target", "Rakuten", "BigCommerce"
     ]
 
+    existing = {name.lower() for name in db.scalars(select(func.lower(Platform.name)))}
     for name in platforms:
-        existing = db.query(Platform).filter(func.lower(Platform.name) == func.lower(name)).first()
-        if existing:
+        if name.lower() in existing:
             print(f"Platform {name} already exists. Skipping.")
-            continue
-        try:
-            platform = Platform(name=name)
-            db.add(platform)
-            db.commit()
-        except IntegrityError:
-            db.rollback()
-        except Exception as e:
-            db.rollback()
-            print(f"Error creating platform {name}: {e}")
+
+    try:
+        db.add_all([Platform(name=name) for name in platforms if name.lower() not in existing])
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+    except Exception as e:
+        db.rollback()
+        print(f"Error creating platforms: {e}")
 
     db.close()
-    
+
 def seed_orders():
     db: Session = SessionLocal()
 
@@ -163,34 +140,30 @@ def seed_orders():
         print("No platforms found in DB. Skipping order seeding.")
         return
 
+    # track stock locally so the whole batch can go through the bulk order path in one transaction
+    remaining = {product_id: int(stock.quantity) for product_id, stock in get_stocks(db, [p.id for p in products]).items()}
+    orders = []
     for _ in range(50):
         product = random.choice(products)
         platform = random.choice(platforms)
 
-        inventory = db.execute(
-            select(Product)
-            .filter(Product.id == product.id)
-            .join(Product.inventories)
-            .order_by(Product.inventories.property.mapper.class_.created_at.desc())
-        ).scalars().first()
-
-        if not product.inventories:
+        if product.id not in remaining:
             print(f"Skipping product {product.id} due to missing inventory")
             continue
 
-        latest_inventory = product.inventories[-1]
-        max_qty = int(latest_inventory.quantity_after)
+        max_qty = remaining[product.id]
 
         if max_qty <= 0:
             print(f"Skipping product {product.id} due to insufficient stock")
             continue
 
         quantity = random.randint(1, min(5, max_qty))
+        remaining[product.id] -= quantity
 
         days_ago = random.randint(1, 365)
         sale_date = datetime.now(timezone.utc) - timedelta(days=days_ago)
 
-        order_data = SaleIn(
+        orders.append(SaleIn(
             platform_id=platform.id,
             sale_date=sale_date,
             items=[
@@ -199,11 +172,15 @@ def seed_orders():
                     quantity=quantity
                 )
             ]
-        )
+        ))
 
+    if orders:
         try:
-            create_order(db, order_data)
+            result = create_orders_bulk(db, orders)
+            for failure in result.data.results:
+                if not failure.status:
+                    print(f"Failed to create order: {failure.error}")
         except Exception as e:
-            print(f"Failed to create order: {e}")
-    
-    db.close()
\ No newline at end of file
+            print(f"Failed to create orders: {e}")
+
+    db.close()
@@ -1,19 +1,121 @@
 from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
-from ..constants import DB_URL
+from ..constants import (
+    DB_URL,
+    DB_ASYNC,
+    DB_ASYNC_URL,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+    DB_POOL_PRE_PING,
+    DB_READ_URL,
+    DB_READ_MAX_LAG_SECONDS,
+    DB_READ_CHECK_INTERVAL,
+    QUERY_STATS_ENABLED
+)
+from .query_stats import instrument_engine
+from .pool_metrics import pool_metrics, async_pool_metrics, InstrumentedQueuePool, InstrumentedAsyncQueuePool
+from .replica import ReplicaRouter, ReplicaRoutingSession
 
 if not DB_URL:
     raise ValueError("DB_URL environment variable is not set.")
 
-engine = create_engine(DB_URL)
+def pool_options(url) -> dict:
+    url = make_url(url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+engine_options = pool_options(DB_URL)
+if engine_options:
+    engine_options["poolclass"] = InstrumentedQueuePool
+
+engine = create_engine(DB_URL, **engine_options)
 
 @event.listens_for(engine, "connect")
 def connect_event_handler(dbapi_connection, connection_record):
-    print("Database connected")
+    pool_metrics.record_connect()
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+read_engine = create_engine(DB_READ_URL, **pool_options(DB_READ_URL)) if DB_READ_URL else None
+
+if QUERY_STATS_ENABLED:
+    instrument_engine(engine)
+    if read_engine is not None:
+        instrument_engine(read_engine)
+
+read_router = ReplicaRouter(engine, read_engine, DB_READ_MAX_LAG_SECONDS, DB_READ_CHECK_INTERVAL)
+ReadSessionLocal = sessionmaker(
+    class_=ReplicaRoutingSession,
+    router=read_router,
+    autocommit=False,
+    autoflush=False
+)
+
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
+
+def async_url(url: str):
+    url = make_url(url)
+    if url.drivername not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver known for {url.drivername}, set DB_ASYNC_URL explicitly")
+    return url.set(drivername=ASYNC_DRIVERS[url.drivername])
+
+async_engine = None
+async_read_engine = None
+AsyncSessionLocal = None
+AsyncReadSessionLocal = None
+
+if DB_ASYNC:
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+    async_database_url = DB_ASYNC_URL or async_url(DB_URL)
+    async_engine_options = pool_options(async_database_url)
+    if async_engine_options:
+        async_engine_options["poolclass"] = InstrumentedAsyncQueuePool
+    async_engine = create_async_engine(async_database_url, **async_engine_options)
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False)
+
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def async_connect_event_handler(dbapi_connection, connection_record):
+        async_pool_metrics.record_connect()
+
+    if DB_READ_URL:
+        async_read_url = async_url(DB_READ_URL)
+        async_read_engine = create_async_engine(async_read_url, **pool_options(async_read_url))
+
+    if QUERY_STATS_ENABLED:
+        instrument_engine(async_engine.sync_engine)
+        if async_read_engine is not None:
+            instrument_engine(async_read_engine.sync_engine)
+
+    async_read_router = ReplicaRouter(
+        async_engine.sync_engine,
+        async_read_engine.sync_engine if async_read_engine else None,
+        DB_READ_MAX_LAG_SECONDS,
+        DB_READ_CHECK_INTERVAL
+    )
+    AsyncReadSessionLocal = async_sessionmaker(
+        sync_session_class=ReplicaRoutingSession,
+        router=async_read_router,
+        autoflush=False
+    )
+
 Base = declarative_base()
 
 def get_db():
@@ -21,4 +123,23 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+def get_read_db():
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_db():
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async database access is disabled, set DB_ASYNC=true")
+    async with AsyncSessionLocal() as db:
+        yield db
+
+async def get_async_read_db():
+    if AsyncReadSessionLocal is None:
+        raise RuntimeError("Async database access is disabled, set DB_ASYNC=true")
+    async with AsyncReadSessionLocal() as db:
+        yield db
\ No newline at end of file
@@ -0,0 +1,95 @@
+import os
+import threading
+import time
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class PoolMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_count = 0
+        self.wait_sum = 0.0
+        self.wait_buckets = [0] * len(WAIT_BUCKETS)
+
+    def record_connect(self):
+        with self._lock:
+            self.connects += 1
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def observe_wait(self, seconds: float, checked_out: bool = True):
+        with self._lock:
+            if checked_out:
+                self.checkouts += 1
+            self.wait_count += 1
+            self.wait_sum += seconds
+            for index, bound in enumerate(WAIT_BUCKETS):
+                if seconds <= bound:
+                    self.wait_buckets[index] += 1
+
+    def snapshot(self, pool) -> dict:
+        with self._lock:
+            counters = {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_seconds": {
+                    "count": self.wait_count,
+                    "sum": round(self.wait_sum, 6),
+                    "buckets": {
+                        **{str(bound): count for bound, count in zip(WAIT_BUCKETS, self.wait_buckets)},
+                        "+Inf": self.wait_count
+                    }
+                }
+            }
+
+        state = {"pid": os.getpid(), "pool_class": type(pool).__name__}
+        if isinstance(pool, QueuePool):
+            state.update({
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+                "max_overflow": pool._max_overflow,
+                "timeout": pool.timeout()
+            })
+        return {**state, **counters}
+
+
+class InstrumentedPoolMixin:
+    """Records the checkout waits and timeouts of a queue pool in ``metrics``."""
+
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        started = time.perf_counter()
+        checked_out = False
+        try:
+            connection = super()._do_get()
+            checked_out = True
+            return connection
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+        finally:
+            self.metrics.observe_wait(time.perf_counter() - started, checked_out)
+
+
+def instrumented_pool(pool_class, metrics: PoolMetrics):
+    return type(f"Instrumented{pool_class.__name__}", (InstrumentedPoolMixin, pool_class), {"metrics": metrics})
+
+
+# one set of counters per engine: the async engine keeps its own pool
+pool_metrics = PoolMetrics()
+async_pool_metrics = PoolMetrics()
+
+InstrumentedQueuePool = instrumented_pool(QueuePool, pool_metrics)
+InstrumentedAsyncQueuePool = instrumented_pool(AsyncAdaptedQueuePool, async_pool_metrics)
@@ -0,0 +1,144 @@
+import heapq
+import json
+import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Optional
+from sqlalchemy import event
+
+from ..constants import QUERY_SLOW_MS, QUERY_STATS_SLOWEST
+
+logger = logging.getLogger("app.db.queries")
+
+STATEMENT_MAX_LENGTH = 500
+WHITESPACE = re.compile(r"\s+")
+
+
+def _statement_text(statement: str) -> str:
+    statement = WHITESPACE.sub(" ", statement).strip()
+    if len(statement) > STATEMENT_MAX_LENGTH:
+        return statement[:STATEMENT_MAX_LENGTH] + "..."
+    return statement
+
+
+class QueryStats:
+    """Queries run while this collector is active: count, total time and the slowest statements."""
+
+    def __init__(self, slowest: int = QUERY_STATS_SLOWEST, keep_statements: bool = False):
+        self._lock = threading.Lock()
+        self._slowest_size = slowest
+        self._slowest: list = []
+        self._sequence = 0
+        self.count = 0
+        self.total_ms = 0.0
+        self.slow_count = 0
+        self.statements: Optional[List[str]] = [] if keep_statements else None
+
+    def record(self, statement: str, elapsed_ms: float):
+        with self._lock:
+            self.count += 1
+            self.total_ms += elapsed_ms
+            if elapsed_ms >= QUERY_SLOW_MS:
+                self.slow_count += 1
+            if self.statements is not None:
+                self.statements.append(_statement_text(statement))
+            if self._slowest_size:
+                # the sequence number keeps equal durations from comparing statements
+                self._sequence += 1
+                entry = (elapsed_ms, self._sequence, statement)
+                if len(self._slowest) < self._slowest_size:
+                    heapq.heappush(self._slowest, entry)
+                elif elapsed_ms > self._slowest[0][0]:
+                    heapq.heapreplace(self._slowest, entry)
+
+    def slowest(self) -> List[dict]:
+        with self._lock:
+            entries = sorted(self._slowest, reverse=True)
+        return [{"statement": _statement_text(statement), "ms": round(ms, 3)} for ms, _, statement in entries]
+
+    def summary(self) -> dict:
+        return {
+            "queries": self.count,
+            "db_ms": round(self.total_ms, 3),
+            "slow_queries": self.slow_count,
+            "slowest": self.slowest()
+        }
+
+
+# the collector of the current request, copied into the threadpool with the rest of the context
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+# collectors that see every query in the process, whichever thread or event loop runs it
+_global_stats: List[QueryStats] = []
+_global_lock = threading.Lock()
+
+
+@contextmanager
+def track_queries(slowest: int = QUERY_STATS_SLOWEST):
+    stats = QueryStats(slowest)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+@contextmanager
+def query_budget(max_queries: int):
+    """Fail when the block runs more than ``max_queries`` statements.
+
+    Counts every query in the process, so it also sees the queries of requests made
+    through a ``TestClient``, which runs the app on another thread::
+
+        with query_budget(3):
+            client.post("/api/v1/orders", json=order)
+    """
+    stats = QueryStats(slowest=0, keep_statements=True)
+    with _global_lock:
+        _global_stats.append(stats)
+    try:
+        yield stats
+    finally:
+        with _global_lock:
+            _global_stats.remove(stats)
+
+    if stats.count > max_queries:
+        statements = "\n".join(f"  {index}. {statement}" for index, statement in enumerate(stats.statements, 1))
+        raise QueryBudgetExceeded(f"{stats.count} queries run, budget was {max_queries}:\n{statements}")
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed_ms = (time.perf_counter() - conn.info["query_start_time"].pop()) * 1000
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed_ms)
+    if _global_stats:
+        with _global_lock:
+            collectors = list(_global_stats)
+        for collector in collectors:
+            collector.record(statement, elapsed_ms)
+
+    if elapsed_ms >= QUERY_SLOW_MS:
+        logger.warning(json.dumps({
+            "event": "slow_query",
+            "ms": round(elapsed_ms, 3),
+            "statement": _statement_text(statement),
+            "executemany": executemany
+        }))
+
+
+def instrument_engine(engine):
+    """Time every statement the engine runs; pass ``AsyncEngine.sync_engine`` for async engines."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
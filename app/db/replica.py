@@ -0,0 +1,115 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+from sqlalchemy import text
+from sqlalchemy.engine import Engine, Connection
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+logger = logging.getLogger(__name__)
+
+
+def _replication_lag(connection: Connection) -> Optional[float]:
+    if connection.dialect.name != "mysql":
+        return 0.0
+
+    for statement, column in (
+        ("SHOW REPLICA STATUS", "Seconds_Behind_Source"),
+        ("SHOW SLAVE STATUS", "Seconds_Behind_Master"),
+    ):
+        try:
+            row = connection.exec_driver_sql(statement).mappings().first()
+        except DBAPIError:
+            continue
+        if row is None:
+            # not configured as a replica, e.g. a second local instance
+            return 0.0
+        return row[column]
+    return 0.0
+
+
+class ReplicaRouter:
+    def __init__(
+        self,
+        primary: Engine,
+        replica: Optional[Engine],
+        max_lag_seconds: float,
+        check_interval: float
+    ):
+        self.primary = primary
+        self.replica = replica
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._healthy = False
+        self._checked_at = None
+        self._checking = False
+
+    def _check_replica(self) -> bool:
+        try:
+            with self.replica.connect() as connection:
+                connection.execute(text("SELECT 1"))
+                lag = _replication_lag(connection)
+        except Exception as e:
+            logger.warning("Read replica unavailable, falling back to primary: %s", e)
+            return False
+
+        if lag is None or lag > self.max_lag_seconds:
+            logger.warning("Read replica lag %ss exceeds %ss, falling back to primary", lag, self.max_lag_seconds)
+            return False
+        return True
+
+    def replica_healthy(self) -> bool:
+        if self.replica is None:
+            return False
+
+        # one caller runs the check without holding the lock, the others keep the last result meanwhile.
+        # On the async engine connecting yields to the event loop, and a coroutine blocked on a
+        # thread lock held across that switch would freeze the loop
+        with self._lock:
+            now = time.monotonic()
+            due = self._checked_at is None or now - self._checked_at >= self.check_interval
+            if not due or self._checking:
+                return self._healthy
+            self._checking = True
+
+        healthy = False
+        try:
+            healthy = self._check_replica()
+        finally:
+            with self._lock:
+                self._healthy = healthy
+                self._checking = False
+                self._checked_at = time.monotonic()
+        return healthy
+
+    def read_engine(self) -> Engine:
+        return self.replica if self.replica_healthy() else self.primary
+
+
+class ReplicaRoutingSession(Session):
+    def __init__(self, *args, router: ReplicaRouter, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.router = router
+        self._primary_reads = 0
+
+    @contextmanager
+    def primary_reads(self):
+        """Send reads to the primary for the duration of the block.
+
+        For results that outlive the request, such as cache fills: a replica lagging behind
+        a commit would store the state from before it after the commit invalidated it.
+        """
+        self._primary_reads += 1
+        try:
+            yield self
+        finally:
+            self._primary_reads -= 1
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._primary_reads or self._flushing or isinstance(clause, UpdateBase):
+            return self.router.primary
+        return self.router.read_engine()
@@ -5,29 +5,38 @@ from .routers.platform_router import router as platform_router
 from .routers.inventory_router import router as inventory_router
 from .routers.order_router import router as order_router
 from .routers.sales_analysis_router import router as sales_router
+from .routers.export_router import router as export_router
+from .routers.internal_router import router as internal_router
+from .routers.health_router import router as health_router
+from .routers.metrics_router import router as metrics_router
 
-from .core.seeder import seed_categories, seed_products, seed_inventory_history, seed_platforms, seed_orders
+from .core.bootstrap import bootstrap, check_ready
 
-from .db.database import engine
-from app import models
+from .constants import DB_ASYNC, STARTUP_MODE, QUERY_STATS_ENABLED, METRICS_ENABLED
+from .utils.async_routes import async_router
+from .utils.request_timing import QueryTimingMiddleware, RequestMetricsMiddleware
 
 app = FastAPI()
-models.Base.metadata.create_all(bind=engine)
 
-app.include_router(category_router, prefix="/api/v1")
-app.include_router(product_router, prefix="/api/v1")
-app.include_router(platform_router, prefix="/api/v1")
-app.include_router(inventory_router, prefix="/api/v1")
-app.include_router(order_router, prefix="/api/v1")
-app.include_router(sales_router, prefix="/api/v1")
+if QUERY_STATS_ENABLED:
+    app.add_middleware(QueryTimingMiddleware)
+if METRICS_ENABLED:
+    app.add_middleware(RequestMetricsMiddleware)
+
+for router in (category_router, product_router, platform_router, inventory_router, order_router, sales_router, export_router):
+    app.include_router(async_router(router) if DB_ASYNC else router, prefix="/api/v1")
+
+app.include_router(internal_router)
+app.include_router(health_router)
+if METRICS_ENABLED:
+    app.include_router(metrics_router)
 
 @app.on_event("startup")
 def startup_event():
-    seed_categories()
-    seed_products()
-    seed_inventory_history()
-    seed_platforms()
-    seed_orders()
+    if STARTUP_MODE == "bootstrap":
+        bootstrap()
+    else:
+        check_ready()
 
 @app.get("/")
 def root():
@@ -1,7 +1,9 @@
 from .category_model import Category
 from .product_model import Product
 from .inventory_model import Inventory
+from .inventory_snapshot_model import InventorySnapshot
 from .platform_model import Platform
 from .sale_item_model import SaleItem
 from .sale_model import Sale
+from .daily_revenue_model import DailyRevenue
 from ..db.database import Base
\ No newline at end of file
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, ForeignKey, Numeric, Integer, Date
+from ..db.database import Base
+
+class DailyRevenue(Base):
+    __tablename__ = "daily_revenue"
+
+    day = Column(Date, primary_key=True)
+    platform_id = Column(Integer, ForeignKey("platforms.id"), primary_key=True)
+    category_id = Column(String(36), ForeignKey("categories.id"), primary_key=True)
+    revenue = Column(Numeric(16, 2), nullable=False, default=0)
+    units_sold = Column(Integer, nullable=False, default=0)
@@ -8,6 +8,7 @@ class Inventory(IncrementalIDMixin, TimestampMixin, Base):
     __tablename__ = "inventories"
     __table_args__ = (
         Index("idx_inventory_updated_at", "updated_at"),
+        Index("idx_inventory_product_created_at", "product_id", "created_at"),
         CheckConstraint("quantity_before >= 0", name="ck_quantity_before_non_negative"),
         CheckConstraint("quantity_after >= 0", name="ck_quantity_after_non_negative"),
         CheckConstraint("threshold >= 0", name="ck_threshold_non_negative"),
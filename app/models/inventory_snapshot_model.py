@@ -0,0 +1,23 @@
+from sqlalchemy import Column, String, ForeignKey, Numeric, Integer, CheckConstraint
+from sqlalchemy.orm import relationship
+from ..db.database import Base
+from ..mixins.timestamp_mixin import TimestampMixin
+
+class InventorySnapshot(TimestampMixin, Base):
+    __tablename__ = "inventory_snapshots"
+    __table_args__ = (
+        CheckConstraint("quantity >= 0", name="ck_snapshot_quantity_non_negative"),
+        CheckConstraint("threshold >= 0", name="ck_snapshot_threshold_non_negative"),
+
+        CheckConstraint("quantity <= 99999", name="ck_snapshot_quantity_max"),
+        CheckConstraint("threshold <= 999", name="ck_snapshot_threshold_max"),
+    )
+
+    product_id = Column(String(36), ForeignKey("products.id"), primary_key=True)
+    quantity = Column(Numeric(5, 0), nullable=False, default=0)
+    threshold = Column(Numeric(3, 0), default=0)
+    version = Column(Integer, nullable=False, default=0)
+
+    __mapper_args__ = {"version_id_col": version, "version_id_generator": False}
+
+    product = relationship("Product", back_populates="stock")
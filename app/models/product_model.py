@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, Numeric, CheckConstraint, Boolean
+from sqlalchemy import Column, String, ForeignKey, Numeric, CheckConstraint, Boolean, DDL, event
 from sqlalchemy.orm import relationship 
 from ..db.database import Base
 from ..mixins.uuid_mixin import UUIDStringMixin
@@ -20,4 +20,48 @@ class Product(UUIDStringMixin, TimestampMixin, Base):
     
     category = relationship("Category", back_populates="products")
     inventories = relationship("Inventory", back_populates="product")
+    stock = relationship("InventorySnapshot", back_populates="product", uselist=False)
     sale_items = relationship("SaleItem", back_populates="product")
+
+
+# full-text search over name, sku and description: a FULLTEXT index on MySQL, an
+# external-content FTS5 table kept in sync by triggers on SQLite
+PRODUCT_SEARCH_DDL = {
+    "mysql": [
+        "CREATE FULLTEXT INDEX ft_products_search ON products (name, sku, description)",
+    ],
+    "sqlite": [
+        "CREATE VIRTUAL TABLE products_fts USING fts5("
+        "name, sku, description, content='products', content_rowid='rowid')",
+        "CREATE TRIGGER products_fts_insert AFTER INSERT ON products BEGIN "
+        "INSERT INTO products_fts(rowid, name, sku, description) "
+        "VALUES (new.rowid, new.name, new.sku, new.description); END",
+        "CREATE TRIGGER products_fts_delete AFTER DELETE ON products BEGIN "
+        "INSERT INTO products_fts(products_fts, rowid, name, sku, description) "
+        "VALUES ('delete', old.rowid, old.name, old.sku, old.description); END",
+        "CREATE TRIGGER products_fts_update AFTER UPDATE ON products BEGIN "
+        "INSERT INTO products_fts(products_fts, rowid, name, sku, description) "
+        "VALUES ('delete', old.rowid, old.name, old.sku, old.description); "
+        "INSERT INTO products_fts(rowid, name, sku, description) "
+        "VALUES (new.rowid, new.name, new.sku, new.description); END",
+    ],
+}
+
+PRODUCT_SEARCH_DROP_DDL = {
+    "mysql": [
+        "DROP INDEX ft_products_search ON products",
+    ],
+    "sqlite": [
+        "DROP TRIGGER IF EXISTS products_fts_update",
+        "DROP TRIGGER IF EXISTS products_fts_delete",
+        "DROP TRIGGER IF EXISTS products_fts_insert",
+        "DROP TABLE IF EXISTS products_fts",
+    ],
+}
+
+for dialect, statements in PRODUCT_SEARCH_DDL.items():
+    for statement in statements:
+        event.listen(Product.__table__, "after_create", DDL(statement).execute_if(dialect=dialect))
+for dialect, statements in PRODUCT_SEARCH_DROP_DDL.items():
+    for statement in statements:
+        event.listen(Product.__table__, "before_drop", DDL(statement).execute_if(dialect=dialect))
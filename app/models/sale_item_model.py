@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Numeric, CheckConstraint, String, Integer
+from sqlalchemy import Column, ForeignKey, Numeric, CheckConstraint, String, Integer, Index
 from sqlalchemy.orm import relationship
 from ..db.database import Base
 from ..mixins.incremental_id_mixin import IncrementalIDMixin
@@ -7,6 +7,7 @@ from ..mixins.timestamp_mixin import TimestampMixin
 class SaleItem(IncrementalIDMixin, TimestampMixin, Base):
     __tablename__ = "sale_items"
     __table_args__ = (
+        Index("idx_sale_items_sales_product_total", "sales_id", "product_id", "total_price"),
         CheckConstraint("quantity >= 0", name="ck_quantity_non_negative"),
         CheckConstraint("per_item_price >= 0", name="ck_per_item_price_non_negative"),
         CheckConstraint("total_price >= 0", name="ck_total_price_non_negative"),
@@ -9,7 +9,7 @@ from ..mixins.timestamp_mixin import TimestampMixin
 class Sale(IncrementalIDMixin, TimestampMixin, Base):
     __tablename__ = "sales"
     __table_args__ = (
-        Index("idx_sales_created_at", "updated_at"),
+        Index("idx_sales_sale_date_total_amount", "sale_date", "total_amount"),
         CheckConstraint("total_amount >= 0", name="ck_total_amount_non_negative"),
         CheckConstraint("total_amount <= 999979000000.00", name="ck_total_amount_max"),
     )
@@ -2,8 +2,8 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from typing import Annotated, List
 
-from ..db.database import get_db
-from ..utils.response_wrapper import APIResponse
+from ..db.database import get_db, get_read_db
+from ..utils.response_wrapper import APIResponse, json_response
 from ..schemas.category_schema import CategoryCreate, CategoryUpdate, CategoryOut
 from ..schemas.base_schema import PaginatedResponse
 from ..controllers.category_controller import (
@@ -23,9 +23,19 @@ def get_categories(
     page: int = 1,
     limit: int = 100,
     search: str = "",
-    db: Session = Depends(get_db)
+    cursor: str | None = None,
+    include_total: bool = True,
+    db: Session = Depends(get_read_db)
 ):
-    return list_categories(db, page=page, limit=limit, search=search)
+    categories = list_categories(
+        db,
+        page=page,
+        limit=limit,
+        search=search,
+        cursor=cursor,
+        include_total=include_total
+    )
+    return json_response(categories)
 
 
 @router.get("/{category_id}", response_model=APIResponse[CategoryOut])
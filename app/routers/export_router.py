@@ -0,0 +1,55 @@
+from fastapi import APIRouter, Query, HTTPException
+from fastapi.responses import StreamingResponse
+from datetime import datetime
+from typing import Iterable, List, Optional, Sequence
+
+from ..schemas.export_schema import ExportFormat
+from ..utils.export import encode_csv, encode_ndjson
+from ..controllers.export_controller import export_sales, export_inventory
+
+router = APIRouter(prefix="/export", tags=["Export"])
+
+MEDIA_TYPES = {
+    ExportFormat.ndjson: "application/x-ndjson",
+    ExportFormat.csv: "text/csv",
+}
+
+def _streaming_export(
+    name: str,
+    format: ExportFormat,
+    header: List[str],
+    batches: Iterable[Sequence[tuple]]
+) -> StreamingResponse:
+    encode = encode_csv if format == ExportFormat.csv else encode_ndjson
+    return StreamingResponse(
+        encode(header, batches),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{format.value}"'}
+    )
+
+@router.get("/sales")
+def export_sales_ledger(
+    format: ExportFormat = ExportFormat.ndjson,
+    start_date: Optional[datetime] = Query(None, description="Start datetime in ISO format"),
+    end_date: Optional[datetime] = Query(None, description="End datetime in ISO format"),
+    product_id: Optional[str] = None,
+    platform_id: Optional[int] = None,
+):
+    try:
+        header, batches = export_sales(start_date, end_date, product_id=product_id, platform_id=platform_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _streaming_export("sales", format, header, batches)
+
+@router.get("/inventory")
+def export_inventory_ledger(
+    format: ExportFormat = ExportFormat.ndjson,
+    start_date: Optional[datetime] = Query(None, description="Start datetime in ISO format"),
+    end_date: Optional[datetime] = Query(None, description="End datetime in ISO format"),
+    product_id: Optional[str] = None,
+):
+    try:
+        header, batches = export_inventory(start_date, end_date, product_id=product_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _streaming_export("inventory", format, header, batches)
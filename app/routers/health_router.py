@@ -0,0 +1,15 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from ..core.health import readiness
+
+router = APIRouter(prefix="/health", tags=["health"])
+
+@router.get("/live")
+def live():
+    return {"status": "alive"}
+
+@router.get("/ready")
+async def ready():
+    report = await readiness()
+    return JSONResponse(report, status_code=200 if report["status"] == "ready" else 503)
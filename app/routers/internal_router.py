@@ -0,0 +1,20 @@
+from fastapi import APIRouter
+
+from ..db.database import engine, async_engine
+from ..db.pool_metrics import pool_metrics, async_pool_metrics
+from ..core.cache import catalog_cache
+from ..core.revenue_cache import revenue_cache
+
+router = APIRouter(prefix="/internal", tags=["internal"])
+
+@router.get("/metrics/pool")
+def pool_status():
+    status = pool_metrics.snapshot(engine.pool)
+    # with DB_ASYNC=true the API routes check out from the async engine's pool instead
+    if async_engine is not None:
+        status["async"] = async_pool_metrics.snapshot(async_engine.sync_engine.pool)
+    return status
+
+@router.get("/metrics/cache")
+def cache_status():
+    return {"catalog": catalog_cache.stats(), "revenue": revenue_cache.stats()}
@@ -2,9 +2,9 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from typing import Annotated
 
-from ..utils.response_wrapper import APIResponse
+from ..utils.response_wrapper import APIResponse, json_response
 from ..schemas.base_schema import PaginatedResponse
-from ..db.database import get_db
+from ..db.database import get_db, get_read_db
 from ..schemas.inventory_schema import InventoryUpdate, InventoryOut
 from ..controllers.inventory_controller import (
     update_inventory_by_product,
@@ -14,6 +14,7 @@ from ..controllers.inventory_controller import (
 router = APIRouter(prefix="/inventory", tags=["inventory"])
 
 db_dependency = Annotated[Session, Depends(get_db)]
+read_db_dependency = Annotated[Session, Depends(get_read_db)]
 
 
 @router.put(
@@ -41,6 +42,18 @@ def create_update_inventory_by_product_id(
 )
 def get_product_inventory_complete_history(
     product_id: str,
-    db: db_dependency
+    db: read_db_dependency,
+    page: int = 1,
+    limit: int = 100,
+    cursor: str | None = None,
+    include_total: bool = True
 ):
-    return get_product_inventory_history(db, product_id)
\ No newline at end of file
+    history = get_product_inventory_history(
+        db,
+        product_id,
+        page=page,
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total
+    )
+    return json_response(history)
\ No newline at end of file
@@ -0,0 +1,10 @@
+from fastapi import APIRouter, Response
+
+from ..core.metrics import render_metrics
+
+router = APIRouter(tags=["metrics"])
+
+@router.get("/metrics", include_in_schema=False)
+def metrics():
+    body, content_type = render_metrics()
+    return Response(body, media_type=content_type)
@@ -1,10 +1,10 @@
 from fastapi import APIRouter, Depends
-from typing import Annotated
+from typing import Annotated, List
 from sqlalchemy.orm import Session
 from ..utils.response_wrapper import APIResponse
 from ..db.database import get_db
-from ..controllers.order_controller import create_order
-from ..schemas.sale_item_schema import SaleOut, SaleIn
+from ..controllers.order_controller import create_order, create_orders_bulk
+from ..schemas.sale_item_schema import SaleOut, SaleIn, BulkOrderOut
 
 router = APIRouter(prefix="/orders", tags=["orders"])
 
@@ -15,4 +15,11 @@ def place_order(
     order_data: SaleIn,
     db: db_dependency
 ):
-    return create_order(db, order_data)
\ No newline at end of file
+    return create_order(db, order_data)
+
+@router.post("/bulk", response_model=APIResponse[BulkOrderOut])
+def place_orders_bulk(
+    orders: List[SaleIn],
+    db: db_dependency
+):
+    return create_orders_bulk(db, orders)
\ No newline at end of file
@@ -2,8 +2,8 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from typing import List, Annotated
 
-from ..utils.response_wrapper import APIResponse
-from ..db.database import get_db
+from ..utils.response_wrapper import APIResponse, json_response
+from ..db.database import get_db, get_read_db
 from ..schemas.platform_schema import PlatformCreate, PlatformUpdate, PlatformOut
 from ..schemas.base_schema import PaginatedResponse
 from ..controllers.platform_controller import (
@@ -15,6 +15,7 @@ from ..controllers.platform_controller import (
 )
 
 db_dependency = Annotated[Session, Depends(get_db)]
+read_db_dependency = Annotated[Session, Depends(get_read_db)]
 
 router = APIRouter(prefix="/platforms", tags=["platforms"])
 
@@ -24,19 +25,26 @@ def create_new_platform(platform: PlatformCreate, db: db_dependency):
 
 @router.get("/", response_model=APIResponse[PaginatedResponse[PlatformOut]])
 def read_platforms(
-    db: db_dependency,
+    db: read_db_dependency,
     page: int = 1,
     limit: int = 100,
     search: str = "",
+    cursor: str | None = None,
+    include_total: bool = True,
 ):
-    return get_platforms(db, page=page, limit=limit, search=search)
+    platforms = get_platforms(
+        db,
+        page=page,
+        limit=limit,
+        search=search,
+        cursor=cursor,
+        include_total=include_total
+    )
+    return json_response(platforms)
 
 @router.get("/{platform_id}", response_model=APIResponse[PlatformOut])
 def read_platform(platform_id: int, db: db_dependency):
-    db_platform = get_platform(db, platform_id)
-    if db_platform is None:
-        raise HTTPException(status_code=404, detail="Platform not found")
-    return db_platform
+    return get_platform(db, platform_id)
 
 @router.put("/{platform_id}", response_model=APIResponse[PlatformOut])
 def update_existing_platform(platform_id: int, platform: PlatformUpdate, db: db_dependency):
@@ -3,8 +3,8 @@ from sqlalchemy.orm import Session
 from uuid import UUID
 from typing import Annotated, List
 
-from ..utils.response_wrapper import APIResponse
-from ..db.database import get_db
+from ..utils.response_wrapper import APIResponse, json_response
+from ..db.database import get_db, get_read_db
 from ..schemas.product_schema import ProductCreate, ProductUpdate, ProductOut
 from ..schemas.base_schema import PaginatedResponse
 from ..controllers import product_controller
@@ -19,15 +19,20 @@ def list_products(
     limit: int = 100,
     search: str = "",
     category_id: str | None = None,
-    db: Session = Depends(get_db)
+    cursor: str | None = None,
+    include_total: bool = True,
+    db: Session = Depends(get_read_db)
 ):
-    return product_controller.get_all_products(
+    products = product_controller.get_all_products(
         db,
         page=page,
         limit=limit,
         search=search,
-        category_id=category_id
+        category_id=category_id,
+        cursor=cursor,
+        include_total=include_total
     )
+    return json_response(products)
 
 @router.get("/{product_id}", response_model=APIResponse[ProductOut])
 def retrieve_product(product_id: str, db: db_dependency):
@@ -1,8 +1,15 @@
 from fastapi import APIRouter, Query, HTTPException
-from datetime import datetime
+from datetime import datetime, date
 from decimal import Decimal
-from typing import List, Dict
-from ..schemas.sale_item_schema import CompareRevenueIn, CompareRevenueByCategoryIn
+from typing import List, Dict, Optional
+from ..schemas.sale_item_schema import (
+    CompareRevenueIn,
+    CompareRevenueByCategoryIn,
+    SeriesGranularity,
+    RevenueSeriesOut,
+    RankingMetric,
+    ProductRankingOut
+)
 from ..controllers.sales_analysis import (
     get_daily_revenue,
     get_weekly_revenue,
@@ -10,7 +17,10 @@ from ..controllers.sales_analysis import (
     get_annual_revenue,
     get_custom_revenue,
     get_revenue_for_periods,
-    get_revenue_for_categories_periods
+    get_revenue_for_categories_periods,
+    get_revenue_series,
+    check_series_range,
+    get_product_ranking
 )
 
 router = APIRouter(prefix="/revenue", tags=["Revenue"])
@@ -41,6 +51,41 @@ def custom_date_range(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.get("/series", response_model=RevenueSeriesOut)
+def revenue_series(
+    start: date = Query(..., description="First day of the series"),
+    end: date = Query(..., description="Day after the last day of the series"),
+    granularity: SeriesGranularity = SeriesGranularity.day,
+    platform_id: Optional[int] = None,
+    category: Optional[str] = Query(None, description="Category name"),
+):
+    try:
+        check_series_range(start, end, granularity)
+        return get_revenue_series(start, end, granularity, platform_id=platform_id, category=category)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/products/top", response_model=ProductRankingOut)
+def product_ranking(
+    start_date: datetime = Query(..., description="Start datetime in ISO format"),
+    end_date: datetime = Query(..., description="End datetime in ISO format"),
+    metric: RankingMetric = RankingMetric.units,
+    limit: int = Query(10, ge=1, le=100),
+    platform_id: Optional[int] = None,
+    category: Optional[str] = Query(None, description="Category name"),
+):
+    try:
+        return get_product_ranking(
+            start_date,
+            end_date,
+            metric=metric,
+            limit=limit,
+            platform_id=platform_id,
+            category=category
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.post("/compare", response_model=List[Decimal])
 def compare_revenues_by_multiple_dates(payload: CompareRevenueIn):
     try:
@@ -1,5 +1,6 @@
 from decimal import Decimal
-from datetime import datetime
+from datetime import datetime, date
+from enum import Enum
 from .base_schema import BaseModel
 from typing import Optional, List
 from pydantic import BaseModel, ConfigDict, field_validator
@@ -31,6 +32,18 @@ class SaleOut(BaseModel):
             Decimal: lambda v: str(v)
         }
 
+class BulkOrderResult(BaseModel):
+    index: int
+    status: bool
+    data: Optional[SaleOut] = None
+    error: Optional[str] = None
+
+class BulkOrderOut(BaseModel):
+    total: int
+    succeeded: int
+    failed: int
+    results: List[BulkOrderResult]
+
 class RevenueOut(BaseModel):
     model_config = ConfigDict(from_attributes=True, json_encoders={Decimal: lambda v: str(v)})
 
@@ -46,4 +59,39 @@ class CompareRevenueIn(BaseModel):
     
 class CompareRevenueByCategoryIn(BaseModel):
     categories: List[str]
-    periods: List[Period]
\ No newline at end of file
+    periods: List[Period]
+
+class SeriesGranularity(str, Enum):
+    day = "day"
+    week = "week"
+    month = "month"
+
+class RevenueSeriesPoint(BaseModel):
+    period_start: date
+    revenue: Decimal
+    units_sold: int
+
+class RevenueSeriesOut(BaseModel):
+    granularity: SeriesGranularity
+    start_date: date
+    end_date: date
+    total_revenue: Decimal
+    points: List[RevenueSeriesPoint]
+
+class RankingMetric(str, Enum):
+    units = "units"
+    revenue = "revenue"
+
+class ProductSalesRank(BaseModel):
+    product_id: str
+    name: str
+    sku: str
+    units_sold: int
+    revenue: Decimal
+
+class ProductRankingOut(BaseModel):
+    metric: RankingMetric
+    start_date: datetime
+    end_date: datetime
+    top: List[ProductSalesRank]
+    bottom: List[ProductSalesRank]
\ No newline at end of file
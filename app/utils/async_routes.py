@@ -0,0 +1,96 @@
+import inspect
+from typing import Annotated, get_args, get_origin
+from fastapi import APIRouter, Depends
+from fastapi.params import Depends as DependsParam
+from fastapi.routing import APIRoute
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db.database import get_db, get_read_db, get_async_db, get_async_read_db
+
+ASYNC_DEPENDENCIES = {get_db: get_async_db, get_read_db: get_async_read_db}
+
+
+def _sync_db_dependency(parameter: inspect.Parameter):
+    if isinstance(parameter.default, DependsParam) and parameter.default.dependency in ASYNC_DEPENDENCIES:
+        return parameter.default.dependency
+    if get_origin(parameter.annotation) is Annotated:
+        for meta in get_args(parameter.annotation)[1:]:
+            if isinstance(meta, DependsParam) and meta.dependency in ASYNC_DEPENDENCIES:
+                return meta.dependency
+    return None
+
+
+def _async_parameter(parameter: inspect.Parameter) -> inspect.Parameter:
+    dependency = Depends(ASYNC_DEPENDENCIES[_sync_db_dependency(parameter)])
+    if get_origin(parameter.annotation) is Annotated:
+        return parameter.replace(annotation=Annotated[AsyncSession, dependency])
+    return parameter.replace(annotation=AsyncSession, default=dependency)
+
+
+def async_endpoint(endpoint):
+    signature = inspect.signature(endpoint)
+    db_params = [name for name, parameter in signature.parameters.items() if _sync_db_dependency(parameter)]
+    if not db_params:
+        return endpoint
+
+    # the sync handler and its controller run inside run_sync, so every query
+    # awaits the async driver instead of blocking a threadpool worker
+    async def wrapper(**kwargs):
+        db: AsyncSession = kwargs[db_params[0]]
+
+        def call(session):
+            return endpoint(**{**kwargs, **{name: session for name in db_params}})
+
+        return await db.run_sync(call)
+
+    wrapper.__name__ = endpoint.__name__
+    wrapper.__doc__ = endpoint.__doc__
+    wrapper.__signature__ = signature.replace(parameters=[
+        _async_parameter(parameter) if name in db_params else parameter
+        for name, parameter in signature.parameters.items()
+    ])
+    return wrapper
+
+
+# everything add_api_route accepts besides the path and endpoint, so a converted route behaves
+# like the original; router-level dependencies are already merged into route.dependencies
+ROUTE_OPTIONS = (
+    "response_model",
+    "status_code",
+    "tags",
+    "dependencies",
+    "summary",
+    "description",
+    "response_description",
+    "responses",
+    "deprecated",
+    "methods",
+    "operation_id",
+    "response_model_include",
+    "response_model_exclude",
+    "response_model_by_alias",
+    "response_model_exclude_unset",
+    "response_model_exclude_defaults",
+    "response_model_exclude_none",
+    "include_in_schema",
+    "response_class",
+    "name",
+    "callbacks",
+    "openapi_extra",
+    "generate_unique_id_function",
+)
+
+
+def async_router(router: APIRouter) -> APIRouter:
+    converted = APIRouter()
+    for route in router.routes:
+        if not isinstance(route, APIRoute):
+            converted.routes.append(route)
+            continue
+        converted.add_api_route(
+            route.path,
+            async_endpoint(route.endpoint),
+            route_class_override=type(route),
+            **{option: getattr(route, option) for option in ROUTE_OPTIONS}
+        )
+    return converted
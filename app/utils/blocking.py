@@ -0,0 +1,18 @@
+import asyncio
+from typing import Callable, TypeVar
+
+from sqlalchemy.util import await_only
+from sqlalchemy.util.concurrency import in_greenlet
+
+T = TypeVar("T")
+
+
+def run_blocking(func: Callable[..., T], *args, **kwargs) -> T:
+    """Call a blocking function, in a worker thread when called from a handler running on the event loop.
+
+    Async endpoints run their sync controller code in SQLAlchemy's greenlet on the event loop
+    thread (see ``async_routes``), where blocking network I/O would stall every other request.
+    """
+    if in_greenlet():
+        return await_only(asyncio.to_thread(func, *args, **kwargs))
+    return func(*args, **kwargs)
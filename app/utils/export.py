@@ -0,0 +1,32 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from typing import Iterable, Iterator, List, Sequence
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_ndjson(header: List[str], batches: Iterable[Sequence[tuple]]) -> Iterator[str]:
+    for batch in batches:
+        yield "".join(
+            json.dumps(dict(zip(header, row)), default=_json_default) + "\n"
+            for row in batch
+        )
+
+
+def encode_csv(header: List[str], batches: Iterable[Sequence[tuple]]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    for batch in batches:
+        writer.writerows(batch)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
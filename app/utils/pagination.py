@@ -0,0 +1,105 @@
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import List, Optional, Tuple, Any
+from fastapi import HTTPException
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"cannot encode {type(value).__name__} in a cursor")
+
+
+def encode_cursor(values: List[Any]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(values, default=_encode_value).encode()).decode()
+
+
+def _decode_value(value: Any, column) -> Any:
+    # the cursor is client input: anything that is not the key column's type would reach the database unchecked
+    python_type = column.type.python_type
+    if value is None or isinstance(value, bool):
+        raise ValueError(f"cursor value for {column.key} has the wrong type")
+    if python_type is str and isinstance(value, str):
+        return value
+    if python_type is int and isinstance(value, int):
+        return value
+    if python_type is float and isinstance(value, (int, float)):
+        return float(value)
+    if python_type is Decimal and isinstance(value, (int, float, str)):
+        return Decimal(str(value))
+    if python_type is datetime and isinstance(value, str):
+        return datetime.fromisoformat(value)
+    if python_type is date and isinstance(value, str):
+        return date.fromisoformat(value)
+    raise ValueError(f"cursor value for {column.key} has the wrong type")
+
+
+def decode_cursor(cursor: str, key_columns: List) -> List[Any]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(payload, list) or len(payload) != len(key_columns):
+            raise ValueError("cursor does not match the sort key")
+        return [_decode_value(value, column) for value, column in zip(payload, key_columns)]
+    except (ValueError, TypeError, UnicodeDecodeError, InvalidOperation, NotImplementedError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
+def _after(key_columns: List, values: List[Any], descending: bool):
+    # (a, b) > (x, y) expanded to a > x OR (a = x AND b > y), which every backend can use an index for
+    conditions = []
+    for index, column in enumerate(key_columns):
+        step = column < values[index] if descending else column > values[index]
+        conditions.append(and_(*[key_columns[i] == values[i] for i in range(index)], step))
+    return or_(*conditions)
+
+
+def paginate(
+    query: Query,
+    key_columns: List,
+    page: int = 1,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    descending: bool = False,
+    ranked_by: Optional[list] = None
+) -> Tuple[list, dict]:
+    # results ordered by a computed rank (e.g. search relevance) can only be paged by offset
+    if ranked_by and cursor:
+        raise HTTPException(status_code=400, detail="Cursor pagination is not available for ranked results")
+
+    total_count = query.order_by(None).count() if include_total else None
+
+    query = query.order_by(
+        *(ranked_by or []),
+        *[column.desc() if descending else column.asc() for column in key_columns]
+    )
+    if cursor:
+        query = query.filter(_after(key_columns, decode_cursor(cursor, key_columns), descending))
+    else:
+        query = query.offset((page - 1) * limit)
+
+    rows = query.limit(limit + 1).all()
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+
+    next_cursor = None
+    if has_next and not ranked_by:
+        next_cursor = encode_cursor([getattr(rows[-1], column.key) for column in key_columns])
+
+    pagination = {
+        "total_items": total_count,
+        "total_pages": max(1, (total_count + limit - 1) // limit) if include_total else None,
+        "current_page": None if cursor else page,
+        "page_size": limit,
+        "items_on_page": len(rows),
+        "has_next": has_next,
+        "has_previous": True if cursor else page > 1,
+        "next_cursor": next_cursor
+    }
+    return rows, pagination
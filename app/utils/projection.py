@@ -0,0 +1,24 @@
+from typing import Any, Sequence, Type
+from pydantic import BaseModel
+
+
+class Projection:
+    """The columns of ``model`` behind the scalar fields of ``schema``, and a way back from result rows.
+
+    Selecting these instead of the entity yields plain row tuples: no identity map, no
+    change tracking and no attribute instrumentation, just the values the schema needs.
+    """
+
+    def __init__(self, schema: Type[BaseModel], model, prefix: str = "", fields: Sequence[str] = None):
+        table_columns = model.__table__.c
+        self.fields = [
+            name for name in (fields or schema.model_fields)
+            if name in table_columns
+        ]
+        self.columns = [getattr(model, name).label(prefix + name) for name in self.fields]
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    def values(self, row: Sequence[Any], offset: int = 0) -> dict:
+        return dict(zip(self.fields, row[offset:offset + len(self.fields)]))
@@ -0,0 +1,85 @@
+import json
+import logging
+import time
+
+from ..db.query_stats import track_queries
+from ..core.metrics import http_requests, http_request_duration
+
+logger = logging.getLogger("app.requests")
+
+
+class QueryTimingMiddleware:
+    """Report the queries of each request in a ``Server-Timing`` header and a structured log line.
+
+    The header is written when the response starts, so rows a streaming response reads
+    afterwards only show up in the log line.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        with track_queries() as stats:
+            async def send_with_timing(message):
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    elapsed_ms = (time.perf_counter() - started) * 1000
+                    server_timing = (
+                        f'db;dur={stats.total_ms:.3f};desc="{stats.count} queries", '
+                        f"app;dur={elapsed_ms:.3f}"
+                    )
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"server-timing", server_timing.encode("latin-1"))
+                    ]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                log = {
+                    "event": "request",
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status": status_code,
+                    "ms": round((time.perf_counter() - started) * 1000, 3),
+                    **stats.summary()
+                }
+                logger.log(logging.WARNING if stats.slow_count else logging.INFO, json.dumps(log))
+
+
+class RequestMetricsMiddleware:
+    """Count requests and observe their latency per route template, so ids in paths do not add series."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # the router stores the matched route in the scope it was handed
+            route = scope.get("route")
+            route = route.path if route is not None else "unmatched"
+            http_request_duration.labels(method=scope["method"], route=route).observe(time.perf_counter() - started)
+            http_requests.labels(method=scope["method"], route=route, status=str(status_code)).inc()
@@ -1,4 +1,6 @@
 from typing import Generic, TypeVar, Optional
+from fastapi import Response
+from pydantic import BaseModel
 from pydantic.generics import GenericModel
 
 T = TypeVar("T")
@@ -8,3 +10,13 @@ class APIResponse(GenericModel, Generic[T]):
     message: str
     data: Optional[T]
     error: Optional[str]
+
+
+def json_response(payload: BaseModel, status_code: int = 200) -> Response:
+    # the payload is already validated, so dump it straight to JSON instead of letting
+    # FastAPI validate it against response_model and run jsonable_encoder over it again
+    return Response(
+        content=payload.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json"
+    )
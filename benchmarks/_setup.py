@@ -0,0 +1,39 @@
+"""Shared setup for the benchmark scripts, imported before anything from the app.
+
+Settings are read when ``app.constants`` is imported, so the database is chosen here: a
+throwaway SQLite file unless ``DB_URL`` is set in the environment.
+"""
+import os
+import tempfile
+import time
+from typing import Callable, Tuple, TypeVar
+
+if not os.getenv("DB_URL"):
+    _directory = tempfile.mkdtemp(prefix="ecommerce-bench-")
+    os.environ["DB_URL"] = f"sqlite:///{os.path.join(_directory, 'bench.db')}"
+os.environ.setdefault("DB_READ_URL", "")
+os.environ.setdefault("STARTUP_MODE", "check")
+
+T = TypeVar("T")
+
+
+def reset_database():
+    from app.db.database import Base, engine
+    from app.core.cache import catalog_cache
+    from app.core.revenue_cache import invalidate_all_revenue
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    catalog_cache.invalidate("categories", "products", "platforms")
+    invalidate_all_revenue()
+
+
+def best_of(runs: int, call: Callable[[], T]) -> Tuple[float, T]:
+    """The shortest of ``runs`` timings of ``call`` in seconds, and its last result."""
+    timings = []
+    result = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = call()
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
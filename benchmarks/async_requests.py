@@ -0,0 +1,92 @@
+"""Latency and throughput of a list endpoint served by the threadpool (sync) and by the async engine.
+
+Starts uvicorn once per mode on the same seeded database and keeps ``concurrency`` clients busy:
+
+    python -m benchmarks.async_requests [requests] [concurrency]
+"""
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks import _setup
+
+import httpx
+
+from app.core.bootstrap import seed
+
+PORT = 8765
+PATH = "/api/v1/products/?limit=20&include_total=false"
+
+
+def _start_server(db_async: bool) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "DB_ASYNC": "true" if db_async else "false",
+        # measure the database path, not cache hits
+        "CATALOG_CACHE_ENABLED": "false",
+        "QUERY_STATS_ENABLED": "false",
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(PORT), "--log-level", "warning"],
+        env=env
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{PORT}/health/live").status_code == 200:
+                return server
+        except httpx.TransportError:
+            time.sleep(0.1)
+    server.kill()
+    raise RuntimeError("uvicorn did not start")
+
+
+async def _load(requests: int, concurrency: int):
+    latencies = []
+    failures = 0
+    pending = iter(range(requests))
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{PORT}", limits=limits, timeout=60) as client:
+        async def worker():
+            nonlocal failures
+            for _ in pending:
+                started = time.perf_counter()
+                try:
+                    response = await client.get(PATH)
+                except httpx.TransportError:
+                    failures += 1
+                    continue
+                latencies.append(time.perf_counter() - started)
+                failures += response.status_code != 200
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return latencies, failures, elapsed
+
+
+def main(requests: int = 5000, concurrency: int = 500):
+    _setup.reset_database()
+    seed()
+
+    print(f"{requests} requests of GET {PATH}, {concurrency} concurrent clients")
+    for db_async in (False, True):
+        server = _start_server(db_async)
+        try:
+            latencies, failures, elapsed = asyncio.run(_load(requests, concurrency))
+        finally:
+            server.terminate()
+            server.wait()
+        percentiles = statistics.quantiles(latencies, n=100)
+        print(
+            f"{'async' if db_async else 'sync':>5}: {requests / elapsed:7.0f} req/s, "
+            f"p50 {percentiles[49] * 1000:7.1f} ms, p99 {percentiles[98] * 1000:7.1f} ms, {failures} failed"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,81 @@
+"""Projected product rows against hydrated entities: time and peak memory of one read.
+
+    python -m benchmarks.list_projection [products]
+"""
+import sys
+import time
+import tracemalloc
+import uuid
+
+from benchmarks import _setup
+
+from decimal import Decimal
+from sqlalchemy import insert
+from sqlalchemy.orm import joinedload
+
+from app.db.database import SessionLocal
+from app.models import Category, Product
+from app.controllers.product_controller import PRODUCT_CATEGORY_COLUMNS, PRODUCT_COLUMNS
+from app.schemas.product_schema import ProductOut
+
+
+def _measure(load):
+    tracemalloc.start()
+    started = time.perf_counter()
+    rows = load()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return rows, elapsed, peak
+
+
+def main(products: int = 10000):
+    _setup.reset_database()
+    with SessionLocal() as db:
+        category = Category(name="Bench", sku="bench")
+        db.add(category)
+        db.flush()
+        db.execute(insert(Product), [
+            {
+                "id": str(uuid.uuid4()),
+                "name": f"Product {n}",
+                "sku": f"bench-{n}",
+                "price": Decimal("1.00"),
+                "published": True,
+                "category_id": category.id,
+            }
+            for n in range(products)
+        ])
+        db.commit()
+
+        def hydrated():
+            # the previous read path: entities with their category, converted to dicts
+            rows = [
+                ProductOut.model_validate(product).model_dump()
+                for product in db.query(Product).options(joinedload(Product.category)).all()
+            ]
+            db.expunge_all()
+            return rows
+
+        def projected():
+            query = db.query(*PRODUCT_COLUMNS.columns, *PRODUCT_CATEGORY_COLUMNS.columns)\
+                .outerjoin(Category, Category.id == Product.category_id)
+            rows = []
+            for row in query.all():
+                product = PRODUCT_COLUMNS.values(row)
+                product["category"] = PRODUCT_CATEGORY_COLUMNS.values(row, offset=len(PRODUCT_COLUMNS))
+                rows.append(product)
+            return rows
+
+        entities, entity_time, entity_peak = _measure(hydrated)
+        columns, column_time, column_peak = _measure(projected)
+
+    assert len(entities) == len(columns) == products, "both reads must return every product"
+    print(f"{products} rows")
+    print(f"  entities: {entity_time:6.2f}s {entity_peak / 2**20:6.1f} MiB peak")
+    print(f"   columns: {column_time:6.2f}s {column_peak / 2**20:6.1f} MiB peak")
+    print(f"columns are {entity_time / column_time:.1f}x faster and use {entity_peak / column_peak:.1f}x less memory")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,64 @@
+"""Bulk order ingestion against the same orders placed one request at a time.
+
+    python -m benchmarks.orders [orders] [items_per_order]
+"""
+import sys
+import time
+
+from benchmarks import _setup
+
+from decimal import Decimal
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.db.database import SessionLocal
+from app.db.query_stats import query_budget
+from app.models import Category, Platform, Product
+from app.core.inventory_snapshot import record_inventory_change
+
+
+def _catalog(products: int):
+    with SessionLocal() as db:
+        category = Category(name="Bench", sku="bench")
+        platform = Platform(name="Bench")
+        db.add_all([category, platform])
+        db.flush()
+        rows = [
+            Product(name=f"Bench {n}", sku=f"bench-{n}", price=Decimal("1.00"), published=True, category_id=category.id)
+            for n in range(products)
+        ]
+        db.add_all(rows)
+        db.flush()
+        for product in rows:
+            record_inventory_change(db, product.id, Decimal(99999), reason="Initial stock", threshold=Decimal(10))
+        db.commit()
+        return platform.id, [product.id for product in rows]
+
+
+def main(orders: int = 500, items_per_order: int = 5):
+    client = TestClient(app)
+    results = {}
+    for mode in ("single", "bulk"):
+        _setup.reset_database()
+        platform_id, products = _catalog(items_per_order)
+        payload = [
+            {"platform_id": platform_id, "items": [{"product_id": product_id, "quantity": 1} for product_id in products]}
+            for _ in range(orders)
+        ]
+
+        with query_budget(10 ** 9) as stats:
+            started = time.perf_counter()
+            if mode == "single":
+                for order in payload:
+                    client.post("/api/v1/orders/", json=order)
+            else:
+                client.post("/api/v1/orders/bulk", json=payload)
+            elapsed = time.perf_counter() - started
+        results[mode] = elapsed
+        print(f"{mode:>6}: {orders / elapsed:8.0f} orders/s, {stats.count} statements")
+
+    print(f"bulk is {results['single'] / results['bulk']:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
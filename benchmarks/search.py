@@ -0,0 +1,57 @@
+"""Product search through the full-text index against a substring scan of every product.
+
+    python -m benchmarks.search [products]
+"""
+import sys
+import uuid
+
+from benchmarks import _setup
+
+from decimal import Decimal
+from sqlalchemy import insert, text
+
+from app.db.database import SessionLocal
+from app.models import Category, Product
+from app.core.product_search import _substring_search, search_products
+
+WORDS = ["oak", "pine", "steel", "glass", "velvet", "linen", "marble", "cedar", "brass", "wool"]
+ITEMS = ["chair", "table", "lamp", "shelf", "sofa", "rug", "desk", "bench", "stool", "mirror"]
+
+
+def main(products: int = 20000):
+    _setup.reset_database()
+    with SessionLocal() as db:
+        category = Category(name="Bench", sku="bench")
+        db.add(category)
+        db.flush()
+        db.execute(insert(Product), [
+            {
+                "id": str(uuid.uuid4()),
+                "name": f"{WORDS[n % 10]} {ITEMS[n // 10 % 10]} {n}",
+                "sku": f"bench-{n}",
+                "description": f"{WORDS[n // 100 % 10]} finish",
+                "price": Decimal("1.00"),
+                "published": True,
+                "category_id": category.id,
+            }
+            for n in range(products)
+        ])
+        db.commit()
+        if db.get_bind().dialect.name == "sqlite":
+            db.execute(text("ANALYZE"))
+
+        def run(search):
+            return lambda: set(search(db.query(Product.id)).all())
+
+        indexed, found = _setup.best_of(5, run(lambda query: search_products(db, query, "velvet lamp")[0]))
+        scanned, expected = _setup.best_of(5, run(lambda query: _substring_search(query, ["velvet", "lamp"])[0]))
+
+    assert found == expected, "the index and the scan disagree"
+    print(f"{products} products, {len(found)} matches")
+    print(f"   index: {indexed * 1000:8.2f} ms")
+    print(f"    scan: {scanned * 1000:8.2f} ms")
+    print(f"index is {scanned / indexed:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
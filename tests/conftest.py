@@ -0,0 +1,94 @@
+import importlib.util
+import os
+import tempfile
+
+# settings are read when app.constants is imported, so the test database has to be
+# configured before anything from the app is
+_database_dir = tempfile.mkdtemp(prefix="ecommerce-tests-")
+os.environ["DB_URL"] = f"sqlite:///{os.path.join(_database_dir, 'test.db')}"
+os.environ["DB_READ_URL"] = ""
+os.environ["DB_ASYNC"] = "false"
+os.environ["CACHE_BACKEND"] = "memory"
+os.environ["STARTUP_MODE"] = "check"
+# prometheus-client is optional, the metrics tests skip without it
+os.environ["METRICS_ENABLED"] = "true" if importlib.util.find_spec("prometheus_client") else "false"
+os.environ.pop("PROMETHEUS_MULTIPROC_DIR", None)
+
+from decimal import Decimal
+from itertools import count
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.db.database import Base, engine, SessionLocal
+from app.models import Category, Platform, Product
+from app.core.cache import catalog_cache
+from app.core.inventory_snapshot import record_inventory_change
+from app.core.revenue_cache import invalidate_all_revenue
+
+_sequence = count(1)
+
+
+@pytest.fixture(autouse=True)
+def database():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    # every cached entry hangs off one of these namespaces
+    catalog_cache.invalidate("categories", "products", "platforms")
+    invalidate_all_revenue()
+    yield engine
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client():
+    # not entered as a context manager, so the startup hook never runs
+    return TestClient(app)
+
+
+@pytest.fixture
+def platform(db):
+    platform = Platform(name=f"Platform {next(_sequence)}")
+    db.add(platform)
+    db.commit()
+    return platform.id
+
+
+@pytest.fixture
+def category(db):
+    number = next(_sequence)
+    category = Category(name=f"Category {number}", sku=f"category-{number}")
+    db.add(category)
+    db.commit()
+    return category.id
+
+
+@pytest.fixture
+def make_product(db, category):
+    def make_product(stock: int = 100, price: str = "10.00", name: str = None, category_id: str = None, **fields):
+        number = next(_sequence)
+        product = Product(
+            name=name or f"Product {number}",
+            sku=fields.pop("sku", f"product-{number}"),
+            price=Decimal(price),
+            published=True,
+            category_id=category_id or category,
+            **fields
+        )
+        db.add(product)
+        db.flush()
+        if stock:
+            record_inventory_change(db, product.id, Decimal(stock), reason="Initial stock", threshold=Decimal(10))
+        db.commit()
+        return product.id
+
+    return make_product
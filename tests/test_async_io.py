@@ -0,0 +1,106 @@
+import asyncio
+import threading
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.cache_backends import RedisBackend
+from app.db.database import engine
+from app.db.replica import ReplicaRouter, ReplicaRoutingSession
+
+
+def _run_with_timeout(coroutine_factory, timeout=10):
+    # a frozen event loop cannot time itself out, so the loop runs in a thread the test can give up on
+    outcome = {}
+
+    def run():
+        try:
+            outcome["result"] = asyncio.run(coroutine_factory())
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "event loop did not finish, it is blocked"
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+def test_replica_check_does_not_block_other_callers():
+    router = ReplicaRouter(engine, create_engine("sqlite://"), max_lag_seconds=5, check_interval=0)
+    started, release = threading.Event(), threading.Event()
+
+    def slow_check():
+        started.set()
+        return release.wait(5)
+
+    router._check_replica = slow_check
+    checker = threading.Thread(target=router.replica_healthy)
+    checker.start()
+    try:
+        assert started.wait(5)
+        # the check in flight is not repeated and its last result (none yet) routes to the primary
+        assert router.read_engine() is engine
+    finally:
+        release.set()
+        checker.join(5)
+
+    assert router._healthy is True
+
+
+def test_concurrent_async_reads_with_a_replica_keep_the_loop_running(database):
+    async def read_concurrently():
+        url = database.url.set(drivername="sqlite+aiosqlite")
+        primary, replica = create_async_engine(url), create_async_engine(url)
+        router = ReplicaRouter(primary.sync_engine, replica.sync_engine, max_lag_seconds=5, check_interval=0)
+        sessions = async_sessionmaker(sync_session_class=ReplicaRoutingSession, router=router)
+
+        async def read():
+            async with sessions() as session:
+                return (await session.execute(text("SELECT 1"))).scalar()
+
+        try:
+            return await asyncio.gather(*(read() for _ in range(20)))
+        finally:
+            await primary.dispose()
+            await replica.dispose()
+
+    assert _run_with_timeout(read_concurrently) == [1] * 20
+
+
+class _RecordingClient:
+    def __init__(self):
+        self.threads = []
+
+    def get(self, key):
+        self.threads.append(threading.get_ident())
+        return None
+
+    def pubsub(self, **kwargs):
+        raise OSError("no pub/sub in this test")
+
+
+def test_redis_calls_from_async_handlers_run_off_the_event_loop(database):
+    pytest.importorskip("redis")
+    client = _RecordingClient()
+    backend = RedisBackend("redis://unused", client=client)
+
+    async def lookup_from_handler():
+        url = database.url.set(drivername="sqlite+aiosqlite")
+        async_engine = create_async_engine(url)
+        try:
+            async with async_sessionmaker(async_engine)() as session:
+                # the same path an async endpoint takes: sync code inside run_sync
+                await session.run_sync(lambda _: backend.get("key"))
+        finally:
+            await async_engine.dispose()
+        return threading.get_ident()
+
+    loop_thread = _run_with_timeout(lookup_from_handler)
+
+    backend.get("key")
+    assert client.threads[0] != loop_thread
+    assert client.threads[1] == threading.get_ident()
@@ -0,0 +1,95 @@
+import asyncio
+from typing import Optional
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI, Header, HTTPException
+from fastapi.responses import PlainTextResponse
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from app.db.database import get_async_db, get_db
+from app.utils.async_routes import ROUTE_OPTIONS, async_router
+
+
+class Answer(BaseModel):
+    value: int
+    note: Optional[str] = None
+
+
+def require_token(x_token: str = Header(None)):
+    if x_token != "secret":
+        raise HTTPException(status_code=403, detail="Missing token")
+
+
+def _router():
+    router = APIRouter(prefix="/things", dependencies=[Depends(require_token)])
+
+    @router.get(
+        "/answer",
+        response_model=Answer,
+        response_model_exclude_none=True,
+        operation_id="get_answer",
+        deprecated=True,
+        summary="The answer",
+        response_description="An answer",
+    )
+    def answer(db: Session = Depends(get_db)):
+        return {"value": db.execute(text("SELECT 42")).scalar(), "note": None}
+
+    @router.get("/plain", response_class=PlainTextResponse, include_in_schema=False)
+    def plain(db: Session = Depends(get_db)):
+        return "plain"
+
+    return router
+
+
+@pytest.fixture
+def async_app(database):
+    engine = create_async_engine(database.url.set(drivername="sqlite+aiosqlite"))
+    sessions = async_sessionmaker(engine)
+
+    async def override():
+        async with sessions() as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(async_router(_router()))
+    app.dependency_overrides[get_async_db] = override
+    yield app
+    asyncio.run(engine.dispose())
+
+
+def test_converted_routes_keep_every_option():
+    original = [route for route in _router().routes if isinstance(route, APIRoute)]
+    converted = [route for route in async_router(_router()).routes if isinstance(route, APIRoute)]
+
+    for before, after in zip(original, converted):
+        for option in ROUTE_OPTIONS:
+            if option in ("dependencies", "generate_unique_id_function"):
+                continue
+            assert getattr(after, option) == getattr(before, option), option
+        assert [d.dependency for d in after.dependencies] == [require_token]
+        assert after.endpoint is not before.endpoint
+
+
+def test_converted_routes_run_dependencies_and_response_options(async_app):
+    client = TestClient(async_app)
+
+    assert client.get("/things/answer").status_code == 403
+
+    answer = client.get("/things/answer", headers={"x-token": "secret"})
+    assert answer.json() == {"value": 42}
+    plain = client.get("/things/plain", headers={"x-token": "secret"})
+    assert plain.headers["content-type"].startswith("text/plain")
+    assert plain.text == "plain"
+
+
+def test_openapi_schema_is_unchanged(async_app):
+    sync_app = FastAPI()
+    sync_app.include_router(_router())
+
+    assert async_app.openapi()["paths"] == sync_app.openapi()["paths"]
@@ -0,0 +1,71 @@
+from datetime import date, datetime
+from sqlalchemy import insert, text
+
+from app.core.bootstrap import create_schema
+from app.models import Category, DailyRevenue, Inventory, InventorySnapshot, Platform, Product, Sale, SaleItem
+from app.models.product_model import PRODUCT_SEARCH_DROP_DDL
+
+
+def _ledger_row(product_id: str, before: int, after: int) -> dict:
+    return {
+        "product_id": product_id,
+        "quantity_before": before,
+        "quantity_changed": after - before,
+        "quantity_after": after,
+        "threshold": 10,
+        "reason": "Restock",
+    }
+
+
+def test_create_schema_backfills_snapshots_on_existing_database(database, db):
+    # a database from before the snapshot table: ledger rows but no projection
+    InventorySnapshot.__table__.drop(database)
+    db.execute(insert(Category), [{"id": "c1", "name": "Books", "sku": "books"}])
+    db.execute(insert(Product), [{"id": "p1", "name": "Novel", "sku": "novel", "price": 5, "category_id": "c1"}])
+    db.execute(insert(Inventory), [_ledger_row("p1", 0, 4000), _ledger_row("p1", 4000, 3988)])
+    db.commit()
+
+    create_schema()
+
+    snapshot = db.get(InventorySnapshot, "p1")
+    assert snapshot.quantity == 3988
+    assert snapshot.version == 2
+
+
+def test_create_schema_leaves_fresh_database_empty(database, db):
+    InventorySnapshot.metadata.drop_all(bind=database)
+
+    create_schema()
+
+    assert db.query(InventorySnapshot).count() == 0
+
+
+def test_create_schema_backfills_daily_revenue_on_existing_database(database, db):
+    DailyRevenue.__table__.drop(database)
+    db.execute(insert(Category), [{"id": "c1", "name": "Books", "sku": "books"}])
+    db.execute(insert(Product), [{"id": "p1", "name": "Novel", "sku": "novel", "price": 5, "category_id": "c1"}])
+    db.execute(insert(Platform), [{"id": 1, "name": "Etsy"}])
+    db.execute(insert(Sale), [{"id": 1, "platform_id": 1, "total_amount": 15, "sale_date": datetime(2025, 5, 1, 12)}])
+    db.execute(insert(SaleItem), [{"sales_id": 1, "product_id": "p1", "quantity": 3, "per_item_price": 5, "total_price": 15}])
+    db.commit()
+
+    create_schema()
+
+    rollup = db.query(DailyRevenue).one()
+    assert (rollup.day, rollup.revenue, rollup.units_sold) == (date(2025, 5, 1), 15, 3)
+
+
+def test_create_schema_adds_search_index_to_existing_database(database, db, client):
+    # a database from before full-text search: products but no FTS table or triggers
+    with database.begin() as connection:
+        for statement in PRODUCT_SEARCH_DROP_DDL["sqlite"]:
+            connection.execute(text(statement))
+    db.execute(insert(Category), [{"id": "c1", "name": "Books", "sku": "books"}])
+    db.execute(insert(Product), [{"id": "p1", "name": "Novel", "sku": "novel", "price": 5, "published": True, "category_id": "c1"}])
+    db.commit()
+
+    create_schema()
+
+    response = client.get("/api/v1/products/", params={"search": "nov"})
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()["data"]["items"]] == ["p1"]
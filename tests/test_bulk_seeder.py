@@ -0,0 +1,54 @@
+from sqlalchemy import func
+
+from app.core.bulk_seeder import seed_dataset
+from app.core.inventory_snapshot import rebuild_inventory_snapshots
+from app.core.revenue_rollup import rebuild_daily_revenue
+from app.models import Category, DailyRevenue, InventorySnapshot, Product, Sale, SaleItem
+
+
+def _snapshots(db):
+    return sorted(
+        (row.product_id, row.quantity, row.threshold, row.version)
+        for row in db.query(InventorySnapshot)
+    )
+
+
+def _rollup(db):
+    return sorted(
+        (row.day, row.platform_id, row.category_id, row.revenue, row.units_sold)
+        for row in db.query(DailyRevenue)
+    )
+
+
+def _assert_consistent(db):
+    # the projections written alongside the ledger are what rebuilding them from it gives
+    snapshots, rollup = _snapshots(db), _rollup(db)
+    rebuild_inventory_snapshots(db)
+    rebuild_daily_revenue(db)
+    db.expire_all()
+    assert _snapshots(db) == snapshots
+    assert _rollup(db) == rollup
+
+    line_totals = db.query(SaleItem.sales_id, func.sum(SaleItem.total_price))\
+        .group_by(SaleItem.sales_id)\
+        .all()
+    assert dict(line_totals) == dict(db.query(Sale.id, Sale.total_amount))
+    assert all(item.total_price == item.quantity * item.per_item_price for item in db.query(SaleItem))
+
+
+def test_seeded_projections_match_the_ledger(db):
+    stats = seed_dataset(categories=3, products=20, orders=300, years=0.5, batch_size=100, seed=7)
+
+    assert stats.rows["sales"] == 300
+    assert db.query(Product).count() == 20
+    _assert_consistent(db)
+
+
+def test_seeding_twice_adds_a_second_dataset(db):
+    seed_dataset(categories=3, products=20, orders=100, years=0.5, batch_size=50, seed=7)
+    seed_dataset(categories=3, products=20, orders=100, years=0.5, batch_size=50, seed=7)
+
+    assert db.query(Category).count() == 6
+    assert db.query(func.count(func.distinct(Product.sku))).scalar() == 40
+    assert db.query(Sale).count() == 200
+    _assert_consistent(db)
@@ -0,0 +1,107 @@
+import logging
+import threading
+import time
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+redis = pytest.importorskip("redis")
+
+from app.core.cache import NamespacedCache, MISSING
+from app.core.cache_backends import RedisBackend
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached in time"
+        time.sleep(0.01)
+
+
+class FlakyClient:
+    """A fake Redis whose pub/sub connections fail ``failures`` times before working."""
+
+    def __init__(self, failures=0):
+        self.redis = fakeredis.FakeRedis()
+        self.failures = failures
+
+    def __getattr__(self, name):
+        return getattr(self.redis, name)
+
+    def pubsub(self, **kwargs):
+        if self.failures:
+            self.failures -= 1
+            raise redis.ConnectionError("connection refused")
+        return self.redis.pubsub(**kwargs)
+
+
+def _backend(client):
+    return RedisBackend("redis://unused", client=client, resubscribe_min_delay=0.01, resubscribe_max_delay=0.05)
+
+
+def test_failures_are_logged_and_treated_as_misses(caplog):
+    class DownClient(FlakyClient):
+        def get(self, key):
+            raise redis.ConnectionError("connection refused")
+
+    backend = _backend(DownClient())
+
+    with caplog.at_level(logging.WARNING, logger="app.core.cache_backends"):
+        assert backend.get("key", MISSING) is MISSING
+
+    assert "Cache backend get failed: connection refused" in caplog.text
+    assert backend.errors == 1
+
+
+def test_subscription_is_retried_with_backoff_until_redis_answers():
+    backend = _backend(FlakyClient(failures=3))
+    received = []
+    backend.subscribe("channel", received.append)
+
+    assert not backend.listening
+    _wait_for(lambda: backend.listening)
+    assert backend.resubscribes == 3
+
+    backend.publish("channel", "hello")
+    _wait_for(lambda: received == ["hello"])
+
+
+def test_listener_resubscribes_after_losing_its_connection():
+    client = FlakyClient()
+    backend = _backend(client)
+    received = []
+    backend.subscribe("channel", received.append)
+    _wait_for(lambda: backend.listening)
+    epoch = backend.subscription_epoch
+
+    listener = backend._listener
+    broken = threading.Event()
+
+    def drop_connection(**kwargs):
+        broken.set()
+        raise redis.ConnectionError("connection lost")
+
+    listener.pubsub.get_message = drop_connection
+    _wait_for(broken.is_set)
+    _wait_for(lambda: backend.listening and backend._listener is not listener)
+
+    assert backend.subscription_epoch == epoch + 1
+    backend.publish("channel", "after")
+    _wait_for(lambda: received == ["after"])
+
+
+def test_cache_refetches_generations_missed_while_resubscribing():
+    client = FlakyClient()
+    backend = _backend(client)
+    cache = NamespacedCache("test", backend, ttl=None)
+    _wait_for(lambda: backend.listening)
+
+    slot, _ = cache.lookup(("products",), "key")
+    cache.store(slot, "stale")
+    assert cache.lookup(("products",), "key")[1] == "stale"
+
+    # another worker invalidated while this one was not subscribed, its broadcast was lost
+    client.redis.incr(cache._counter_key("products"))
+    backend._listen()
+
+    assert cache.lookup(("products",), "key")[1] is MISSING
@@ -0,0 +1,47 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.controllers import platform_controller
+from app.core.cache import catalog_cache
+from app.db.database import Base, engine
+from app.db.replica import ReplicaRouter, ReplicaRoutingSession
+
+
+@pytest.fixture
+def lagging_read_session(tmp_path):
+    # a replica that has not caught up with anything written to the primary yet
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    Base.metadata.create_all(bind=replica)
+    router = ReplicaRouter(engine, replica, max_lag_seconds=5, check_interval=60)
+    with sessionmaker(class_=ReplicaRoutingSession, router=router)() as session:
+        yield session
+    replica.dispose()
+
+
+def _names(response):
+    return [platform.name for platform in response.data.items]
+
+
+def test_cache_is_filled_from_the_primary_not_a_lagging_replica(client, lagging_read_session):
+    client.post("/api/v1/platforms/", json={"name": "Fresh"})
+
+    assert _names(platform_controller.get_platforms(lagging_read_session)) == ["Fresh"]
+    # served from the cache, still the primary's rows
+    assert _names(platform_controller.get_platforms(lagging_read_session)) == ["Fresh"]
+
+
+def test_uncached_reads_still_use_the_replica(client, lagging_read_session, monkeypatch):
+    monkeypatch.setattr(catalog_cache, "enabled", False)
+    client.post("/api/v1/platforms/", json={"name": "Fresh"})
+
+    assert _names(platform_controller.get_platforms(lagging_read_session)) == []
+
+
+def test_committed_change_drops_cached_pages(client):
+    client.post("/api/v1/platforms/", json={"name": "First"})
+    assert client.get("/api/v1/platforms/").json()["data"]["pagination"]["total_items"] == 1
+
+    client.post("/api/v1/platforms/", json={"name": "Second"})
+
+    assert client.get("/api/v1/platforms/").json()["data"]["pagination"]["total_items"] == 2
@@ -0,0 +1,158 @@
+import csv
+import io
+import json
+from datetime import datetime
+
+import pytest
+from sqlalchemy import insert
+
+from app.controllers import export_controller
+from app.models import Inventory, Platform, Sale, SaleItem
+
+
+def _ndjson(response):
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def _export(client, ledger, **params):
+    return _ndjson(client.get(f"/api/v1/export/{ledger}", params=params))
+
+
+@pytest.fixture
+def sales(db, platform, make_product):
+    lamp, rug = make_product(price="10.00", sku="lamp"), make_product(price="3.00", sku="rug")
+    db.execute(insert(Platform), [{"id": 99, "name": "Marketplace"}])
+    db.execute(insert(Sale), [
+        {"id": 1, "platform_id": platform, "total_amount": 23, "sale_date": datetime(2026, 3, 1, 9)},
+        {"id": 2, "platform_id": 99, "total_amount": 10, "sale_date": datetime(2026, 3, 2, 9)},
+        {"id": 3, "platform_id": platform, "total_amount": 6, "sale_date": datetime(2026, 3, 3, 9)},
+    ])
+    db.execute(insert(SaleItem), [
+        {"id": 1, "sales_id": 1, "product_id": lamp, "quantity": 2, "per_item_price": 10, "total_price": 20},
+        {"id": 2, "sales_id": 1, "product_id": rug, "quantity": 1, "per_item_price": 3, "total_price": 3},
+        {"id": 3, "sales_id": 2, "product_id": lamp, "quantity": 1, "per_item_price": 10, "total_price": 10},
+        {"id": 4, "sales_id": 3, "product_id": rug, "quantity": 2, "per_item_price": 3, "total_price": 6},
+    ])
+    db.commit()
+    return {"lamp": lamp, "rug": rug, "platform": platform}
+
+
+def test_sales_export_streams_one_ndjson_line_per_sale_item(client, sales):
+    response = client.get("/api/v1/export/sales")
+
+    rows = _ndjson(response)
+    assert response.headers["content-disposition"] == 'attachment; filename="sales.ndjson"'
+    assert [row["sale_item_id"] for row in rows] == [1, 2, 3, 4]
+    assert rows[0] == {
+        "sale_id": 1,
+        "sale_date": "2026-03-01T09:00:00",
+        "platform_id": sales["platform"],
+        "sale_item_id": 1,
+        "product_id": sales["lamp"],
+        "sku": "lamp",
+        "quantity": "2",
+        "per_item_price": "10.00",
+        "total_price": "20.00",
+    }
+
+
+def test_sales_export_as_csv(client, sales):
+    response = client.get("/api/v1/export/sales", params={"format": "csv"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["content-disposition"] == 'attachment; filename="sales.csv"'
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == [
+        "sale_id", "sale_date", "platform_id", "sale_item_id", "product_id", "sku",
+        "quantity", "per_item_price", "total_price"
+    ]
+    assert [row[3] for row in rows[1:]] == ["1", "2", "3", "4"]
+    assert rows[1][5:] == ["lamp", "2", "10.00", "20.00"]
+
+
+def test_sales_export_filters(client, sales):
+    def sale_items(**params):
+        return [row["sale_item_id"] for row in _export(client, "sales", **params)]
+
+    # the end date is exclusive
+    assert sale_items(start_date="2026-03-02T00:00:00", end_date="2026-03-03T09:00:00") == [3]
+    assert sale_items(start_date="2026-03-02T00:00:00") == [3, 4]
+    assert sale_items(end_date="2026-03-02T00:00:00") == [1, 2]
+    assert sale_items(product_id=sales["rug"]) == [2, 4]
+    assert sale_items(platform_id=99) == [3]
+    assert sale_items(platform_id=sales["platform"], product_id=sales["lamp"]) == [1]
+
+
+@pytest.mark.parametrize("ledger", ["sales", "inventory"])
+def test_export_rejects_a_reversed_range(client, ledger):
+    response = client.get(f"/api/v1/export/{ledger}", params={
+        "start_date": "2026-03-02T00:00:00",
+        "end_date": "2026-03-02T00:00:00",
+    })
+
+    assert response.status_code == 400
+
+
+def _ledger_row(product_id, before, after, created_at):
+    return {
+        "product_id": product_id,
+        "quantity_before": before,
+        "quantity_changed": after - before,
+        "quantity_after": after,
+        "threshold": 10,
+        "reason": "Restock",
+        "created_at": created_at,
+    }
+
+
+def test_inventory_export_in_both_formats_and_with_filters(client, db, make_product):
+    stool, desk = make_product(stock=0, sku="stool"), make_product(stock=0, sku="desk")
+    db.execute(insert(Inventory), [
+        _ledger_row(stool, 0, 5, datetime(2026, 3, 1)),
+        _ledger_row(desk, 0, 8, datetime(2026, 3, 2)),
+        _ledger_row(stool, 5, 3, datetime(2026, 3, 3)),
+    ])
+    db.commit()
+
+    rows = _export(client, "inventory")
+    assert [(row["sku"], row["quantity_after"]) for row in rows] == [("stool", "5"), ("desk", "8"), ("stool", "3")]
+    assert rows[2]["quantity_changed"] == "-2"
+    assert [row["sku"] for row in _export(client, "inventory", product_id=stool)] == ["stool", "stool"]
+    assert [row["sku"] for row in _export(
+        client, "inventory", start_date="2026-03-02T00:00:00", end_date="2026-03-03T00:00:00"
+    )] == ["desk"]
+
+    response = client.get("/api/v1/export/inventory", params={"format": "csv", "product_id": desk})
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["content-disposition"] == 'attachment; filename="inventory.csv"'
+    header, *lines = csv.reader(io.StringIO(response.text))
+    assert header[:4] == ["id", "created_at", "product_id", "sku"]
+    assert [line[3] for line in lines] == ["desk"]
+
+
+def test_exports_span_several_batches_in_order(client, db, platform, make_product, monkeypatch):
+    monkeypatch.setattr(export_controller, "EXPORT_BATCH_SIZE", 2)
+    product_id = make_product()
+    db.execute(insert(Sale), [
+        # stored out of date order, exported in it
+        {"id": n, "platform_id": platform, "total_amount": 10, "sale_date": datetime(2026, 3, 8 - n)}
+        for n in range(1, 8)
+    ])
+    db.execute(insert(SaleItem), [
+        {"sales_id": n, "product_id": product_id, "quantity": 1, "per_item_price": 10, "total_price": 10}
+        for n in range(1, 8)
+    ])
+    db.commit()
+
+    _, batches = export_controller.export_sales()
+    assert [len(batch) for batch in batches] == [2, 2, 2, 1]
+
+    rows = _export(client, "sales")
+    assert [row["sale_id"] for row in rows] == [7, 6, 5, 4, 3, 2, 1]
+    lines = client.get("/api/v1/export/sales", params={"format": "csv"}).text.splitlines()
+    # one header, no repeated headers between batches
+    assert len(lines) == 8
+    assert [line.split(",")[0] for line in lines[1:]] == ["7", "6", "5", "4", "3", "2", "1"]
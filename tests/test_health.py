@@ -0,0 +1,107 @@
+import asyncio
+from contextlib import ExitStack
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core import health
+from app.db.database import engine
+
+
+def test_live_answers_without_the_database(client):
+    assert client.get("/health/live").json() == {"status": "alive"}
+
+
+def test_ready_reports_every_check(client, monkeypatch):
+    monkeypatch.setattr(health, "HEALTH_CHECK_CACHE", True)
+
+    response = client.get("/health/ready")
+
+    assert response.status_code == 200
+    checks = response.json()["checks"]
+    assert {name: check["status"] for name, check in checks.items()} == {"pool": "ok", "database": "ok", "cache": "ok"}
+    assert checks["pool"]["capacity"] == engine.pool.size() + engine.pool._max_overflow
+    assert checks["cache"]["backend"] == "memory"
+
+
+def test_slow_database_is_not_ready(client, monkeypatch):
+    monkeypatch.setattr(health, "HEALTH_DB_MAX_LATENCY_MS", 0)
+
+    response = client.get("/health/ready")
+
+    assert response.status_code == 503
+    assert response.json()["checks"]["database"]["status"] == "fail"
+
+
+def test_exhausted_pool_fails_without_waiting_for_a_connection(client, monkeypatch):
+    pooled = create_engine(str(engine.url), pool_size=2, max_overflow=1, pool_timeout=30)
+    monkeypatch.setattr(health, "engine", pooled)
+
+    with ExitStack() as stack:
+        for _ in range(3):
+            stack.enter_context(pooled.connect())
+        response = client.get("/health/ready")
+
+    assert response.status_code == 503
+    checks = response.json()["checks"]
+    assert checks["pool"] == {"status": "fail", "checked_out": 3, "capacity": 3, "saturation": 1.0, "threshold": 0.9}
+    assert checks["database"]["error"] == "no free connection in the pool"
+    pooled.dispose()
+
+
+def test_unlimited_overflow_never_counts_as_saturated(client, monkeypatch):
+    pooled = create_engine(str(engine.url), pool_size=1, max_overflow=-1)
+    monkeypatch.setattr(health, "engine", pooled)
+
+    with ExitStack() as stack:
+        for _ in range(3):
+            stack.enter_context(pooled.connect())
+        response = client.get("/health/ready")
+
+    assert response.status_code == 200
+    checks = response.json()["checks"]
+    assert checks["pool"] == {"status": "ok", "checked_out": 3, "capacity": None, "saturation": None}
+    assert checks["database"]["status"] == "ok"
+    pooled.dispose()
+
+
+def _async_engine(**pool):
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    return create_async_engine(engine.url.set(drivername="sqlite+aiosqlite"), poolclass=AsyncAdaptedQueuePool, **pool)
+
+
+def test_ready_probes_the_async_engine_when_configured(client, monkeypatch):
+    pytest.importorskip("aiosqlite")
+    pooled = _async_engine(pool_size=2, max_overflow=1)
+    monkeypatch.setattr(health, "async_engine", pooled)
+
+    response = client.get("/health/ready")
+
+    assert response.status_code == 200
+    checks = response.json()["checks"]
+    assert {name: check["status"] for name, check in checks.items()} == {
+        "pool": "ok", "database": "ok", "async_pool": "ok", "async_database": "ok"
+    }
+    assert checks["async_pool"]["capacity"] == 3
+    asyncio.run(pooled.dispose())
+
+
+def test_exhausted_async_pool_is_not_ready(monkeypatch):
+    pytest.importorskip("aiosqlite")
+    pooled = _async_engine(pool_size=1, max_overflow=0, pool_timeout=30)
+    monkeypatch.setattr(health, "async_engine", pooled)
+
+    async def ready_while_checked_out():
+        async with pooled.connect():
+            report = await health.readiness()
+        await pooled.dispose()
+        return report
+
+    report = asyncio.run(ready_while_checked_out())
+
+    assert report["status"] == "unavailable"
+    assert report["checks"]["async_pool"]["saturation"] == 1.0
+    assert report["checks"]["async_database"]["error"] == "no free connection in the pool"
+    assert report["checks"]["database"]["status"] == "ok"
@@ -0,0 +1,93 @@
+import uuid
+from decimal import Decimal
+
+from sqlalchemy import insert
+
+from app.controllers import inventory_controller, product_controller
+from app.core.cache import catalog_cache
+from app.db.query_stats import track_queries
+from app.models import Product
+from app.schemas.product_schema import ProductOut
+from app.utils.projection import Projection
+
+
+def test_projection_selects_only_schema_columns_and_maps_rows_back():
+    projection = Projection(ProductOut, Product, prefix="p__", fields=["id", "name", "category", "price"])
+
+    # relationships have no column behind them
+    assert projection.fields == ["id", "name", "price"]
+    assert [column.name for column in projection.columns] == ["p__id", "p__name", "p__price"]
+    assert projection.values(("x", "skip", "id-1", "Lamp", Decimal("1.00")), offset=2) == {
+        "id": "id-1", "name": "Lamp", "price": Decimal("1.00")
+    }
+
+
+def test_product_list_loads_no_entities(db, make_product):
+    make_product(name="Lamp")
+    db.expunge_all()
+
+    page = product_controller.get_all_products(db)
+
+    assert [item.name for item in page.data.items] == ["Lamp"]
+    assert page.data.items[0].category is not None
+    assert len(db.identity_map) == 0
+
+
+def test_product_without_category_lists_no_category(db, make_product):
+    product_id = make_product()
+    product = db.get(Product, product_id)
+    # the column is not nullable, so detach the category by pointing at one that was never stored
+    product.category_id = str(uuid.uuid4())
+    db.commit()
+
+    page = product_controller.get_all_products(db)
+
+    assert page.data.items[0].category is None
+
+
+def test_inventory_history_carries_only_the_exposed_product_columns(db, make_product):
+    product_id = make_product(name="Bench", description="Not exposed in history")
+    db.expunge_all()
+
+    history = inventory_controller.get_product_inventory_history(db, product_id).data.items
+
+    assert len(db.identity_map) == 0
+    assert history[0].product.name == "Bench"
+    assert history[0].product.description is None
+
+
+def _insert_products(db, category, count, prefix):
+    db.execute(insert(Product), [
+        {
+            "id": str(uuid.uuid4()),
+            "name": f"{prefix} {n}",
+            "sku": f"{prefix}-{n}",
+            "price": Decimal("1.00"),
+            "published": True,
+            "category_id": category,
+        }
+        for n in range(count)
+    ])
+    db.commit()
+    # a core insert does not reach the cache invalidation hooks
+    catalog_cache.invalidate("products")
+
+
+def _list_products(db, limit):
+    db.expunge_all()
+    with track_queries() as stats:
+        page = product_controller.get_all_products(db, limit=limit)
+    return page, stats.count
+
+
+def test_large_product_page_costs_the_statements_of_a_small_one(db, category):
+    _insert_products(db, category, 5, "small")
+    small, small_statements = _list_products(db, 1000)
+    _insert_products(db, category, 995, "large")
+    large, large_statements = _list_products(db, 1000)
+
+    assert (len(small.data.items), len(large.data.items)) == (5, 1000)
+    # no per-row lazy loads of the category, and nothing kept in the session
+    assert large_statements == small_statements > 0
+    assert len(db.identity_map) == 0
+    assert all(item.category.id == category for item in large.data.items)
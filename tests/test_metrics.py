@@ -0,0 +1,96 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.constants import METRICS_ENABLED
+
+pytestmark = pytest.mark.skipif(not METRICS_ENABLED, reason="prometheus-client is not installed")
+
+
+def _sample(name, **labels):
+    from prometheus_client import REGISTRY
+
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def _order(platform, product_id, quantity):
+    return {"platform_id": platform, "items": [{"product_id": product_id, "quantity": quantity}]}
+
+
+def test_metrics_endpoint_serves_the_exposition_format(client):
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "# TYPE http_requests_total counter" in response.text
+
+
+def test_requests_are_labelled_by_route_template(client, platform):
+    route = "/api/v1/platforms/{platform_id}"
+    before = _sample("http_requests_total", method="GET", route=route, status="200")
+    unmatched = _sample("http_requests_total", method="GET", route="unmatched", status="404")
+
+    client.get(f"/api/v1/platforms/{platform}")
+    client.get(f"/api/v1/platforms/{platform}")
+    client.get("/no/such/path")
+
+    assert _sample("http_requests_total", method="GET", route=route, status="200") == before + 2
+    assert _sample("http_requests_total", method="GET", route="unmatched", status="404") == unmatched + 1
+    assert _sample("http_request_duration_seconds_count", method="GET", route=route) >= 2
+    assert f'route="/api/v1/platforms/{platform}"' not in client.get("/metrics").text
+
+
+def test_orders_are_counted_by_outcome(client, platform, make_product):
+    product_id = make_product(stock=5)
+    created = _sample("orders_created_total", source="single")
+    out_of_stock = _sample("orders_failed_total", source="single", reason="out_of_stock")
+    invalid = _sample("orders_failed_total", source="bulk", reason="invalid")
+    items = _sample("order_items_count")
+
+    client.post("/api/v1/orders/", json=_order(platform, product_id, 2))
+    client.post("/api/v1/orders/", json=_order(platform, product_id, 50))
+    client.post("/api/v1/orders/bulk", json=[_order(platform, product_id, 1), _order(platform, product_id, 0)])
+
+    assert _sample("orders_created_total", source="single") == created + 1
+    assert _sample("orders_failed_total", source="single", reason="out_of_stock") == out_of_stock + 1
+    assert _sample("orders_failed_total", source="bulk", reason="invalid") == invalid + 1
+    assert _sample("order_items_count") == items + 2
+
+
+def test_analytics_queries_are_timed(client):
+    before = _sample("analytics_query_duration_seconds_count", query="revenue")
+
+    client.get("/api/v1/revenue/custom", params={"start_date": "2020-01-01T00:00:00", "end_date": "2020-01-02T00:00:00"})
+
+    assert _sample("analytics_query_duration_seconds_count", query="revenue") == before + 1
+
+
+WORKER = """
+from app.core.metrics import orders_created
+orders_created.labels(source="single").inc({count})
+"""
+
+SCRAPE = """
+from app.core.metrics import render_metrics
+print(render_metrics()[0].decode())
+"""
+
+
+def test_workers_sharing_a_multiprocess_dir_are_summed(tmp_path):
+    env = {
+        **os.environ,
+        "METRICS_ENABLED": "true",
+        "PROMETHEUS_MULTIPROC_DIR": str(tmp_path),
+        "PYTHONPATH": str(Path(__file__).resolve().parent.parent),
+    }
+
+    def run(code):
+        return subprocess.run([sys.executable, "-c", code], env=env, check=True, capture_output=True, text=True).stdout
+
+    run(WORKER.format(count=2))
+    run(WORKER.format(count=3))
+
+    assert 'orders_created_total{source="single"} 5.0' in run(SCRAPE)
@@ -0,0 +1,61 @@
+import os
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import Index, inspect, text
+
+from app.models import Sale
+
+COVERING_INDEXES = {
+    "sales": "idx_sales_sale_date_total_amount",
+    "sale_items": "idx_sale_items_sales_product_total",
+    "inventories": "idx_inventory_product_created_at",
+}
+
+
+def _alembic_config() -> Config:
+    # no ini file: alembic's fileConfig would reset the app's loggers
+    config = Config()
+    config.set_main_option("script_location", os.path.join(os.path.dirname(__file__), "..", "alembic"))
+    return config
+
+
+def _indexes(engine, table: str) -> set:
+    return {index["name"] for index in inspect(engine).get_indexes(table)}
+
+
+def _downgrade_to_previous_revision(engine, with_old_sales_index: bool):
+    with engine.begin() as connection:
+        for table, index in COVERING_INDEXES.items():
+            connection.execute(text(f"DROP INDEX {index}"))
+    if with_old_sales_index:
+        Index("idx_sales_created_at", Sale.__table__.c.updated_at).create(engine)
+    command.stamp(_alembic_config(), "8c2d5e71a9f3")
+
+
+def _drop_alembic_version(engine):
+    with engine.begin() as connection:
+        connection.execute(text("DROP TABLE alembic_version"))
+
+
+def test_covering_index_migration_runs_on_migrated_databases(database):
+    # databases built by migrations alone never had idx_sales_created_at
+    _downgrade_to_previous_revision(database, with_old_sales_index=False)
+    try:
+        command.upgrade(_alembic_config(), "d41e6b9f2c85")
+    finally:
+        _drop_alembic_version(database)
+
+    for table, index in COVERING_INDEXES.items():
+        assert index in _indexes(database, table)
+
+
+def test_covering_index_migration_drops_the_misplaced_sales_index(database):
+    _downgrade_to_previous_revision(database, with_old_sales_index=True)
+    try:
+        command.upgrade(_alembic_config(), "d41e6b9f2c85")
+    finally:
+        _drop_alembic_version(database)
+
+    assert "idx_sales_created_at" not in _indexes(database, "sales")
+    assert COVERING_INDEXES["sales"] in _indexes(database, "sales")
@@ -0,0 +1,112 @@
+from app.controllers import order_controller
+from app.db.query_stats import query_budget
+from app.models import InventorySnapshot, Sale
+
+
+def _order(platform, *lines):
+    return {"platform_id": platform, "items": [{"product_id": product_id, "quantity": quantity} for product_id, quantity in lines]}
+
+
+def _reads(stats) -> int:
+    return sum(statement.startswith("SELECT") for statement in stats.statements)
+
+
+def test_stock_check_reads_do_not_grow_with_item_count(client, platform, make_product):
+    single = make_product()
+    many = [make_product() for _ in range(25)]
+
+    with query_budget(500) as one_item:
+        assert client.post("/api/v1/orders/", json=_order(platform, (single, 1))).status_code == 200
+    with query_budget(500) as many_items:
+        assert client.post("/api/v1/orders/", json=_order(platform, *[(product_id, 1) for product_id in many])).status_code == 200
+
+    assert _reads(many_items) == _reads(one_item)
+
+
+def test_order_is_rejected_when_any_line_lacks_stock(client, db, platform, make_product):
+    plenty = make_product(stock=50)
+    scarce = make_product(stock=2)
+
+    response = client.post("/api/v1/orders/", json=_order(platform, (plenty, 5), (scarce, 3)))
+
+    assert response.status_code == 400
+    assert db.get(InventorySnapshot, plenty).quantity == 50
+    assert db.query(Sale).count() == 0
+
+
+def test_repeated_lines_of_a_product_are_checked_together(client, platform, make_product):
+    product_id = make_product(stock=5)
+
+    response = client.post("/api/v1/orders/", json=_order(platform, (product_id, 3), (product_id, 3)))
+
+    assert response.status_code == 400
+
+
+def test_order_decrements_stock_and_prices_lines(client, db, platform, make_product):
+    product_id = make_product(stock=10, price="2.50")
+
+    response = client.post("/api/v1/orders/", json=_order(platform, (product_id, 4)))
+
+    assert response.status_code == 200
+    assert response.json()["data"]["total_amount"] == "10.00"
+    assert db.get(InventorySnapshot, product_id).quantity == 6
+
+
+def test_non_positive_quantity_is_rejected(client, db, platform, make_product):
+    product_id = make_product(stock=10)
+
+    response = client.post("/api/v1/orders/", json=_order(platform, (product_id, -3)))
+
+    assert response.status_code == 400
+    assert db.get(InventorySnapshot, product_id).quantity == 10
+
+
+def test_bulk_orders_fail_individually(client, db, platform, make_product):
+    product_id = make_product(stock=10)
+    orders = [
+        _order(platform, (product_id, 2)),
+        _order(platform, (product_id, -3)),
+        _order(platform, (product_id, 0)),
+        _order(platform, ("missing", 1)),
+        _order(platform + 1000, (product_id, 1)),
+        _order(platform, (product_id, 50)),
+        _order(platform, (product_id, 3)),
+    ]
+
+    response = client.post("/api/v1/orders/bulk", json=orders)
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert [result["status"] for result in data["results"]] == [True, False, False, False, False, False, True]
+    assert (data["succeeded"], data["failed"]) == (2, 5)
+    assert "must be positive" in data["results"][1]["error"]
+    assert db.get(InventorySnapshot, product_id).quantity == 5
+    assert db.query(Sale).count() == 2
+
+
+def test_bulk_order_runs_a_fraction_of_the_statements_of_single_orders(client, platform, make_product):
+    products = [make_product(stock=1000) for _ in range(5)]
+    orders = [_order(platform, *[(product_id, 1) for product_id in products]) for _ in range(50)]
+
+    with query_budget(10000) as singles:
+        for order in orders:
+            assert client.post("/api/v1/orders/", json=order).status_code == 200
+    with query_budget(10000) as bulk:
+        assert client.post("/api/v1/orders/bulk", json=orders).json()["data"]["succeeded"] == 50
+
+    assert bulk.count * 10 <= singles.count
+
+
+def test_unexpected_bulk_error_rolls_back_and_answers_400(client, db, platform, make_product, monkeypatch):
+    product_id = make_product(stock=10)
+
+    def broken(*args, **kwargs):
+        raise ValueError("revenue rollup unavailable")
+
+    monkeypatch.setattr(order_controller, "record_revenue", broken)
+    response = client.post("/api/v1/orders/bulk", json=[_order(platform, (product_id, 2))])
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "revenue rollup unavailable"
+    assert db.query(Sale).count() == 0
+    assert db.get(InventorySnapshot, product_id).quantity == 10
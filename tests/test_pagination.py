@@ -0,0 +1,62 @@
+import base64
+import json
+
+import pytest
+
+
+def _cursor(values):
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def test_cursor_pages_through_products_without_repeats(client, make_product):
+    created = {make_product() for _ in range(5)}
+
+    seen = []
+    params = {"limit": 2, "include_total": False}
+    while True:
+        response = client.get("/api/v1/products/", params=params)
+        assert response.status_code == 200
+        data = response.json()["data"]
+        seen.extend(item["id"] for item in data["items"])
+        if not data["pagination"]["next_cursor"]:
+            break
+        params["cursor"] = data["pagination"]["next_cursor"]
+
+    assert len(seen) == len(created)
+    assert set(seen) == created
+
+
+def test_cursor_pages_through_integer_keys(client, platform):
+    for name in ("Second", "Third"):
+        client.post("/api/v1/platforms/", json={"name": name})
+
+    first = client.get("/api/v1/platforms/", params={"limit": 1}).json()["data"]
+    cursor = first["pagination"]["next_cursor"]
+    assert json.loads(base64.urlsafe_b64decode(cursor)) == [platform]
+
+    response = client.get("/api/v1/platforms/", params={"limit": 1, "cursor": cursor})
+    assert response.status_code == 200
+    assert response.json()["data"]["items"][0]["id"] > platform
+
+
+@pytest.mark.parametrize("path, values", [
+    ("/api/v1/products/", [{"a": 1}]),
+    ("/api/v1/products/", [1]),
+    ("/api/v1/products/", [None]),
+    ("/api/v1/platforms/", ["1"]),
+    ("/api/v1/platforms/", [1.5]),
+    ("/api/v1/platforms/", [True]),
+    ("/api/v1/platforms/", [[1]]),
+    ("/api/v1/platforms/", [1, 2]),
+])
+def test_malformed_cursor_is_rejected(client, path, values):
+    response = client.get(path, params={"cursor": _cursor(values)})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid pagination cursor"
+
+
+def test_cursor_that_is_not_base64_json_is_rejected(client):
+    response = client.get("/api/v1/products/", params={"cursor": "not a cursor"})
+
+    assert response.status_code == 400
@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, event, exc, text
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.db.pool_metrics import PoolMetrics, WAIT_BUCKETS, instrumented_pool
+
+
+@pytest.fixture
+def metered_engine(tmp_path):
+    metrics = PoolMetrics()
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=instrumented_pool(QueuePool, metrics),
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.1
+    )
+    event.listen(engine, "connect", lambda dbapi_connection, connection_record: metrics.record_connect())
+    yield engine, metrics
+    engine.dispose()
+
+
+def test_checkouts_are_counted_and_their_wait_observed(metered_engine):
+    engine, metrics = metered_engine
+
+    for _ in range(3):
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+    snapshot = metrics.snapshot(engine.pool)
+    assert snapshot["checkouts"] == 3
+    assert snapshot["timeouts"] == 0
+    assert snapshot["wait_seconds"]["count"] == 3
+    assert snapshot["wait_seconds"]["buckets"]["+Inf"] == 3
+    # buckets are cumulative, so they never shrink towards the top
+    counts = [snapshot["wait_seconds"]["buckets"][str(bound)] for bound in WAIT_BUCKETS]
+    assert counts == sorted(counts)
+    assert counts[-1] == 3
+
+
+def test_connections_are_counted_once_and_then_reused(metered_engine):
+    engine, metrics = metered_engine
+
+    for _ in range(3):
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+    assert metrics.snapshot(engine.pool)["connects"] == 1
+
+
+def test_exhausted_pool_counts_a_timeout(metered_engine):
+    engine, metrics = metered_engine
+
+    with engine.connect():
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+
+    snapshot = metrics.snapshot(engine.pool)
+    assert snapshot["timeouts"] == 1
+    # the failed attempt waited but never got a connection
+    assert snapshot["checkouts"] == 1
+    assert snapshot["wait_seconds"]["count"] == 2
+    assert snapshot["wait_seconds"]["sum"] >= 0.1
+
+
+def test_async_pool_is_instrumented_the_same_way(tmp_path):
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    metrics = PoolMetrics()
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=instrumented_pool(AsyncAdaptedQueuePool, metrics),
+        pool_size=1,
+        max_overflow=0
+    )
+
+    async def run():
+        for _ in range(2):
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+        await engine.dispose()
+
+    asyncio.run(run())
+
+    assert metrics.checkouts == 2
+    assert metrics.wait_count == 2
+
+
+def test_pool_endpoint_reports_the_pool_and_its_counters(client):
+    client.get("/api/v1/platforms/")
+
+    body = client.get("/internal/metrics/pool").json()
+
+    assert body["pool_class"] == "InstrumentedQueuePool"
+    for field in ("pid", "size", "checked_in", "checked_out", "overflow", "max_overflow", "timeout"):
+        assert field in body
+    assert body["checkouts"] >= 1
+    assert body["connects"] >= 1
+    assert body["wait_seconds"]["count"] >= body["checkouts"]
+    assert set(body["wait_seconds"]["buckets"]) == {str(bound) for bound in WAIT_BUCKETS} | {"+Inf"}
+    # DB_ASYNC is off in the tests
+    assert "async" not in body
@@ -0,0 +1,81 @@
+import pytest
+
+from app.models import Category, Platform
+
+RANGE = {"start_date": "2026-04-01T00:00:00", "end_date": "2026-05-01T00:00:00"}
+
+
+@pytest.fixture
+def catalog(client, db, platform, make_product):
+    """Five products: cheap bestseller, pricey one, slow seller, one sold only outside the range, one never sold."""
+    other_category = Category(name="Garden", sku="garden")
+    other_platform = Platform(name="Marketplace")
+    db.add_all([other_category, other_platform])
+    db.commit()
+
+    products = {
+        "cheap": make_product(price="1.00", stock=500),
+        "pricey": make_product(price="90.00", stock=500),
+        "slow": make_product(price="5.00", stock=500, category_id=other_category.id),
+        "old": make_product(price="5.00", stock=500),
+        "unsold": make_product(price="5.00", stock=500),
+    }
+
+    def order(name, quantity, sale_date="2026-04-10T12:00:00", platform_id=platform):
+        response = client.post("/api/v1/orders/", json={
+            "platform_id": platform_id,
+            "sale_date": sale_date,
+            "items": [{"product_id": products[name], "quantity": quantity}]
+        })
+        assert response.status_code == 200
+
+    order("cheap", 40)
+    order("pricey", 2)
+    order("slow", 1, platform_id=other_platform.id)
+    order("old", 100, sale_date="2026-03-10T12:00:00")
+    return products, other_platform.id
+
+
+def _ranking(client, **params):
+    response = client.get("/api/v1/revenue/products/top", params={**RANGE, **params})
+    assert response.status_code == 200
+    data = response.json()
+    return [row["product_id"] for row in data["top"]], [row["product_id"] for row in data["bottom"]], data
+
+
+def test_top_products_by_units_and_by_revenue(client, catalog):
+    products, _ = catalog
+
+    top_by_units, _, data = _ranking(client, metric="units", limit=3)
+    top_by_revenue, _, _ = _ranking(client, metric="revenue", limit=3)
+
+    assert top_by_units == [products["cheap"], products["pricey"], products["slow"]]
+    assert top_by_revenue == [products["pricey"], products["cheap"], products["slow"]]
+    assert data["top"][0]["units_sold"] == 40
+
+
+def test_bottom_products_start_with_products_unsold_in_the_range(client, catalog):
+    products, _ = catalog
+
+    _, bottom, data = _ranking(client, limit=3)
+
+    # sales outside the range do not count, never-sold products are included
+    assert set(bottom[:2]) == {products["old"], products["unsold"]}
+    assert bottom[2] == products["slow"]
+    assert [row["units_sold"] for row in data["bottom"]] == [0, 0, 1]
+
+
+def test_ranking_filters_by_category_and_platform(client, catalog):
+    products, other_platform = catalog
+
+    top_in_garden, bottom_in_garden, _ = _ranking(client, category="Garden")
+    top_on_marketplace, _, _ = _ranking(client, platform_id=other_platform)
+
+    assert top_in_garden == bottom_in_garden == [products["slow"]]
+    assert top_on_marketplace == [products["slow"]]
+
+
+def test_ranking_rejects_an_empty_range(client):
+    response = client.get("/api/v1/revenue/products/top", params={"start_date": RANGE["end_date"], "end_date": RANGE["start_date"]})
+
+    assert response.status_code == 400
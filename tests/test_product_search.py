@@ -0,0 +1,94 @@
+from sqlalchemy import insert, text
+
+from app.core.product_search import rebuild_search_index, search_products, search_terms
+from app.models import Product
+
+
+def _search(client, search, **params):
+    response = client.get("/api/v1/products/", params={"search": search, **params})
+    assert response.status_code == 200
+    return [item["name"] for item in response.json()["data"]["items"]]
+
+
+def test_every_word_matches_as_a_prefix(client, make_product):
+    make_product(name="Wireless Keyboard")
+    make_product(name="Wired Keyboard")
+    make_product(name="Wireless Mouse")
+
+    assert sorted(_search(client, "wire")) == ["Wired Keyboard", "Wireless Keyboard", "Wireless Mouse"]
+    assert _search(client, "WIREL key") == ["Wireless Keyboard"]
+    assert _search(client, "keyboard wireless") == ["Wireless Keyboard"]
+    assert _search(client, "ireless") == []
+
+
+def test_searches_sku_and_description(client, make_product):
+    make_product(name="Lamp", sku="LMP-4411")
+    make_product(name="Desk", description="Oak desk with a drawer")
+
+    assert _search(client, "lmp") == ["Lamp"]
+    assert _search(client, "drawer") == ["Desk"]
+
+
+def test_name_matches_rank_before_description_matches(client, make_product):
+    make_product(name="Stand", description="Holds a walnut board")
+    make_product(name="Walnut Board")
+
+    assert _search(client, "walnut") == ["Walnut Board", "Stand"]
+
+
+def test_punctuation_only_search_lists_everything(client, make_product):
+    make_product(name="Chair")
+
+    assert search_terms('"*-') == []
+    assert _search(client, '"*-') == ["Chair"]
+
+
+def test_index_follows_product_updates_and_deletes(client, db, make_product):
+    product_id = make_product(name="Old Name", stock=0)
+
+    db.get(Product, product_id).name = "New Name"
+    db.commit()
+    assert _search(client, "old") == []
+    assert _search(client, "new") == ["New Name"]
+
+    db.delete(db.get(Product, product_id))
+    db.commit()
+    assert _search(client, "new") == []
+
+
+def test_rebuild_restores_a_drifted_index(client, db, make_product):
+    make_product(name="Bookshelf")
+    db.execute(text("INSERT INTO products_fts(products_fts) VALUES ('delete-all')"))
+    db.commit()
+    assert _search(client, "book") == []
+
+    rebuild_search_index(db)
+
+    assert _search(client, "book") == ["Bookshelf"]
+
+
+def test_ranked_results_page_by_offset_only(client, make_product):
+    for finish in ("Oak", "Pine", "Teak"):
+        make_product(name=f"{finish} Table")
+
+    first = client.get("/api/v1/products/", params={"search": "table", "limit": 2}).json()["data"]
+    assert first["pagination"]["has_next"] and first["pagination"]["next_cursor"] is None
+    second = client.get("/api/v1/products/", params={"search": "table", "limit": 2, "page": 2}).json()["data"]
+    assert len({item["id"] for item in first["items"] + second["items"]}) == 3
+
+    response = client.get("/api/v1/products/", params={"search": "table", "cursor": "W10="})
+    assert response.status_code == 400
+
+
+def test_search_is_answered_by_the_fts_index(db, make_product):
+    product_id = make_product(name="Velvet Lamp")
+    make_product(name="Velvet Chair")
+    query, _ = search_products(db, db.query(Product.id), "velvet lamp")
+    statement = query.statement.compile(db.get_bind(), compile_kwargs={"literal_binds": True})
+
+    plan = " | ".join(row[-1] for row in db.execute(text(f"EXPLAIN QUERY PLAN {statement}")))
+
+    assert "products_fts VIRTUAL TABLE INDEX" in plan
+    # matching products are then looked up by rowid instead of scanned
+    assert "SEARCH products USING INTEGER PRIMARY KEY (rowid=?)" in plan
+    assert query.all() == [(product_id,)]
@@ -0,0 +1,112 @@
+import random
+from datetime import date, datetime, timedelta
+from typing import Callable, List
+
+import pytest
+from sqlalchemy import event, insert, text
+
+from app.controllers.inventory_controller import get_product_inventory_history
+from app.controllers.sales_analysis import _load_revenue, get_revenue_series, get_product_ranking
+from app.models import Category, DailyRevenue, Inventory, Platform, Product, Sale, SaleItem
+
+
+@pytest.fixture
+def sales_history(database):
+    # a year of sales with planner statistics, so SQLite picks plans the way it would for real data
+    rng = random.Random(7)
+    start = datetime(2025, 1, 1)
+    sales, items, ledger, rollup = [], [], [], {}
+    for sale_id in range(1, 2001):
+        sale_date = start + timedelta(minutes=rng.randrange(365 * 24 * 60))
+        platform_id = rng.randint(1, 3)
+        sales.append({"id": sale_id, "platform_id": platform_id, "total_amount": 6, "sale_date": sale_date})
+        for product in rng.sample(range(50), 2):
+            items.append({"sales_id": sale_id, "product_id": f"p{product}", "quantity": 1, "per_item_price": 3, "total_price": 3})
+            ledger.append({"product_id": f"p{product}", "quantity_before": 9, "quantity_changed": -1, "quantity_after": 8, "threshold": 1})
+            key = (sale_date.date(), platform_id, f"c{product % 5}")
+            rollup[key] = rollup.get(key, 0) + 3
+
+    with database.begin() as connection:
+        connection.execute(insert(Category), [{"id": f"c{i}", "name": f"Category {i}", "sku": f"c{i}"} for i in range(5)])
+        connection.execute(insert(Platform), [{"id": i, "name": f"Platform {i}"} for i in range(1, 4)])
+        connection.execute(insert(Product), [
+            {"id": f"p{i}", "name": f"Product {i}", "sku": f"p{i}", "price": 3, "category_id": f"c{i % 5}"}
+            for i in range(50)
+        ])
+        connection.execute(insert(Sale), sales)
+        connection.execute(insert(SaleItem), items)
+        connection.execute(insert(Inventory), ledger)
+        connection.execute(insert(DailyRevenue), [
+            {"day": day, "platform_id": platform_id, "category_id": category_id, "revenue": revenue, "units_sold": revenue // 3}
+            for (day, platform_id, category_id), revenue in rollup.items()
+        ])
+        connection.execute(text("ANALYZE"))
+    return database
+
+
+def query_plans(engine, call: Callable[[], object]) -> List[str]:
+    """EXPLAIN QUERY PLAN of every SELECT ``call`` runs, in order."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        call()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    with engine.connect() as connection:
+        return [
+            "\n".join(row[-1] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters))
+            for statement, parameters in statements
+        ]
+
+
+def assert_no_full_scan(plan: str, *tables: str):
+    for table in tables:
+        assert f"SCAN {table}" not in plan, plan
+
+
+def test_revenue_reads_rollup_by_day_and_sales_by_covering_index(sales_history):
+    rollup, raw = query_plans(sales_history, lambda: _load_revenue([(datetime(2025, 3, 1, 12), datetime(2025, 3, 8, 6))]))
+
+    assert "SEARCH daily_revenue USING INDEX" in rollup and "(day>? AND day<?)" in rollup
+    assert "SEARCH sales USING COVERING INDEX idx_sales_sale_date_total_amount" in raw
+    assert_no_full_scan(rollup, "daily_revenue")
+    assert_no_full_scan(raw, "sales")
+
+
+@pytest.mark.parametrize("filters", [{}, {"platform_id": 1, "category": "Category 1"}])
+def test_revenue_series_searches_rollup_by_day(sales_history, filters):
+    (plan,) = query_plans(sales_history, lambda: get_revenue_series(date(2025, 3, 1), date(2025, 3, 8), **filters))
+
+    assert "SEARCH daily_revenue USING INDEX" in plan and "(day>? AND day<?)" in plan
+    assert_no_full_scan(plan, "daily_revenue")
+
+
+@pytest.mark.parametrize("filters", [{}, {"category": "Category 1"}])
+def test_product_ranking_starts_from_the_sale_date_index(sales_history, filters):
+    top, unsold, *least_sold = query_plans(
+        sales_history,
+        lambda: get_product_ranking(datetime(2025, 3, 1), datetime(2025, 3, 8), **filters)
+    )
+
+    for plan in (top, *least_sold):
+        assert "SEARCH sales USING COVERING INDEX idx_sales_sale_date_total_amount" in plan
+        assert "SEARCH sale_items USING" in plan
+        assert_no_full_scan(plan, "sales", "sale_items")
+    # the anti-join probes sale items per product and sale without touching the table
+    assert "SEARCH sale_items USING COVERING INDEX idx_sale_items_sales_product_total" in unsold
+    assert_no_full_scan(unsold, "sales", "sale_items")
+
+
+def test_inventory_history_searches_by_product(sales_history, db):
+    plans = query_plans(sales_history, lambda: get_product_inventory_history(db, "p1", limit=10))
+
+    assert plans
+    for plan in plans:
+        assert "SEARCH inventories USING" in plan
+        assert_no_full_scan(plan, "inventories")
@@ -0,0 +1,96 @@
+import json
+import logging
+import re
+
+import pytest
+from sqlalchemy import text
+
+from app.db import query_stats
+from app.db.query_stats import QueryBudgetExceeded, QueryStats, query_budget, track_queries
+
+
+def _request_logs(caplog):
+    return [json.loads(record.getMessage()) for record in caplog.records if record.name == "app.requests"]
+
+
+def test_response_reports_its_queries_in_server_timing(client, make_product):
+    make_product()
+
+    response = client.get("/api/v1/products/")
+
+    timing = response.headers["server-timing"]
+    match = re.fullmatch(r'db;dur=([\d.]+);desc="(\d+) queries", app;dur=([\d.]+)', timing)
+    assert match, timing
+    assert int(match.group(2)) >= 2  # the count and the page
+    assert float(match.group(1)) <= float(match.group(3))
+
+
+def test_every_request_is_logged_with_its_slowest_statements(client, make_product, caplog):
+    make_product()
+
+    with caplog.at_level(logging.INFO, logger="app.requests"):
+        client.get("/api/v1/products/", params={"limit": 5})
+
+    log = _request_logs(caplog)[-1]
+    assert log["event"] == "request"
+    assert (log["method"], log["path"], log["status"]) == ("GET", "/api/v1/products/", 200)
+    assert log["queries"] >= 2
+    assert 1 <= len(log["slowest"]) <= query_stats.QUERY_STATS_SLOWEST
+    assert all(entry["statement"].startswith("SELECT") for entry in log["slowest"])
+
+
+def test_slow_statements_are_logged_as_warnings(client, monkeypatch, caplog):
+    monkeypatch.setattr(query_stats, "QUERY_SLOW_MS", 0)
+
+    with caplog.at_level(logging.INFO):
+        client.get("/api/v1/platforms/")
+
+    slow = [record for record in caplog.records if record.name == "app.db.queries"]
+    assert slow
+    assert all(record.levelno == logging.WARNING for record in slow)
+    assert all(json.loads(record.getMessage())["event"] == "slow_query" for record in slow)
+    request = [record for record in caplog.records if record.name == "app.requests"][-1]
+    assert request.levelno == logging.WARNING
+
+
+def test_query_budget_lists_the_statements_once_exceeded(db):
+    with query_budget(2) as stats:
+        db.execute(text("SELECT 1"))
+        db.execute(text("SELECT 2"))
+    assert stats.count == 2
+
+    with pytest.raises(QueryBudgetExceeded) as exceeded:
+        with query_budget(1):
+            db.execute(text("SELECT 1"))
+            db.execute(text("SELECT   2"))
+
+    assert "2 queries run, budget was 1" in str(exceeded.value)
+    assert "  2. SELECT 2" in str(exceeded.value)
+
+
+def test_query_budget_counts_requests_served_on_other_threads(client, platform):
+    with query_budget(10) as stats:
+        client.get(f"/api/v1/platforms/{platform}")
+
+    assert stats.count >= 1
+
+
+def test_tracked_queries_stay_with_their_own_context(db):
+    with track_queries() as outer:
+        db.execute(text("SELECT 1"))
+        with track_queries() as inner:
+            db.execute(text("SELECT 2"))
+        db.execute(text("SELECT 3"))
+
+    assert (outer.count, inner.count) == (2, 1)
+
+
+def test_slowest_keeps_the_longest_statements_in_order():
+    stats = QueryStats(slowest=2)
+    for statement, ms in (("a", 5.0), ("b", 1.0), ("c", 9.0), ("d", 5.0)):
+        stats.record(statement, ms)
+
+    # on a tie the statement seen first stays
+    assert [entry["statement"] for entry in stats.slowest()] == ["c", "a"]
+    assert stats.summary()["queries"] == 4
+    assert stats.summary()["db_ms"] == 20.0
@@ -0,0 +1,42 @@
+import logging
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.db.database import engine
+from app.db.replica import ReplicaRouter, ReplicaRoutingSession
+from app.models import Platform
+
+
+def _router(replica, **options):
+    return ReplicaRouter(engine, replica, **{"max_lag_seconds": 5, "check_interval": 60, **options})
+
+
+def test_reads_use_a_healthy_replica_and_writes_the_primary():
+    replica = create_engine("sqlite://")
+    session = sessionmaker(class_=ReplicaRoutingSession, router=_router(replica))()
+
+    assert session.get_bind(clause=text("SELECT 1")) is replica
+    assert session.get_bind(clause=Platform.__table__.insert()) is engine
+    session.close()
+
+
+def test_unreachable_replica_falls_back_to_the_primary_and_logs(caplog):
+    replica = create_engine("sqlite:////nonexistent-dir/replica.db")
+    router = _router(replica)
+
+    with caplog.at_level(logging.WARNING, logger="app.db.replica"):
+        assert router.read_engine() is engine
+
+    assert "Read replica unavailable" in caplog.text
+
+
+def test_replica_is_checked_once_per_interval():
+    router = _router(create_engine("sqlite://"))
+    checks = []
+    router._check_replica = lambda: checks.append(1) or True
+
+    for _ in range(5):
+        router.replica_healthy()
+
+    assert len(checks) == 1
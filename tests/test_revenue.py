@@ -0,0 +1,131 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.constants import REVENUE_CACHE_CLOSED_TTL, REVENUE_CACHE_OPEN_TTL
+from app.controllers import sales_analysis
+from app.core.revenue_cache import revenue_cache
+from app.db.database import Base
+from app.db.query_stats import query_budget
+from app.models import Category, DailyRevenue, Sale
+
+
+def _revenue(client, start: str, end: str) -> Decimal:
+    response = client.get("/api/v1/revenue/custom", params={"start_date": start, "end_date": end})
+    assert response.status_code == 200
+    return Decimal(str(response.json()))
+
+
+def _place(client, platform, product_id, quantity=1, sale_date=None):
+    order = {"platform_id": platform, "items": [{"product_id": product_id, "quantity": quantity}]}
+    if sale_date:
+        order["sale_date"] = sale_date
+    response = client.post("/api/v1/orders/", json=order)
+    assert response.status_code == 200
+    return response.json()["data"]
+
+
+def test_offset_sale_date_is_stored_and_rolled_up_on_its_utc_day(client, db, platform, make_product):
+    product_id = make_product(price="43.24")
+
+    _place(client, platform, product_id, sale_date="2026-03-10T22:30:00-05:00")
+
+    assert db.query(Sale.sale_date).scalar() == datetime(2026, 3, 11, 3, 30)
+    assert db.query(DailyRevenue.day).scalar().isoformat() == "2026-03-11"
+    # whole days come from the rollup, partial ones from raw sales: both see the same day
+    assert _revenue(client, "2026-03-10T00:00:00", "2026-03-11T00:00:00") == 0
+    assert _revenue(client, "2026-03-11T00:00:00", "2026-03-12T00:00:00") == Decimal("43.24")
+    assert _revenue(client, "2026-03-11T03:00:00", "2026-03-11T04:00:00") == Decimal("43.24")
+    assert _revenue(client, "2026-03-10T22:00:00-05:00", "2026-03-10T23:00:00-05:00") == Decimal("43.24")
+
+
+def test_revenue_mixes_rollup_days_and_partial_edges(client, platform, make_product):
+    product_id = make_product(price="5.00")
+    for sale_date in ("2026-01-01T10:00:00", "2026-01-02T10:00:00", "2026-01-03T23:00:00", "2026-01-05T01:00:00"):
+        _place(client, platform, product_id, sale_date=sale_date)
+
+    assert _revenue(client, "2026-01-01T12:00:00", "2026-01-05T00:30:00") == Decimal("10.00")
+    assert _revenue(client, "2026-01-01T00:00:00", "2026-01-06T00:00:00") == Decimal("20.00")
+
+
+def _days(count: int):
+    return [{"start_date": f"2026-01-{day:02d}T00:00:00", "end_date": f"2026-01-{day + 1:02d}T00:00:00"} for day in range(1, count + 1)]
+
+
+def test_compare_costs_the_same_queries_for_any_number_of_periods(client, platform, make_product):
+    product_id = make_product(price="1.00", stock=1000)
+    for day in range(1, 21):
+        _place(client, platform, product_id, quantity=day, sale_date=f"2026-01-{day:02d}T12:00:00")
+
+    with query_budget(50) as two:
+        response = client.post("/api/v1/revenue/compare", json={"periods": _days(2)})
+    assert [Decimal(str(value)) for value in response.json()] == [1, 2]
+
+    with query_budget(50) as twenty:
+        response = client.post("/api/v1/revenue/compare", json={"periods": _days(20)})
+    assert [Decimal(str(value)) for value in response.json()] == list(range(1, 21))
+
+    assert twenty.count == two.count
+
+
+def test_compare_by_category_buckets_every_period_in_one_query(client, db, platform, make_product):
+    books, games = Category(name="Books", sku="books"), Category(name="Games", sku="games")
+    db.add_all([books, games])
+    db.commit()
+    novel = make_product(price="10.00", category_id=books.id)
+    chess = make_product(price="4.00", category_id=games.id)
+    _place(client, platform, novel, sale_date="2026-02-01T10:00:00")
+    _place(client, platform, chess, quantity=2, sale_date="2026-02-01T11:00:00")
+    _place(client, platform, novel, quantity=3, sale_date="2026-02-02T10:00:00")
+
+    periods = [
+        {"start_date": "2026-02-01T00:00:00", "end_date": "2026-02-02T00:00:00"},
+        {"start_date": "2026-02-02T00:00:00", "end_date": "2026-02-03T00:00:00"},
+        {"start_date": "2026-03-01T00:00:00"},
+    ]
+    with query_budget(1) as stats:
+        response = client.post("/api/v1/revenue/compare-by-category", json={"categories": ["Books", "Games"], "periods": periods})
+
+    assert stats.count == 1
+    totals = [{name: Decimal(str(value)) for name, value in period.items()} for period in response.json()]
+    assert totals == [{"Books": 10, "Games": 8}, {"Books": 30, "Games": 0}, {"Books": 0, "Games": 0}]
+
+
+def test_closed_ranges_are_cached_from_the_primary(client, platform, make_product, monkeypatch, tmp_path):
+    # a replica that has not caught up with any sale yet
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    Base.metadata.create_all(bind=replica)
+    monkeypatch.setattr(sales_analysis, "ReadSessionLocal", sessionmaker(bind=replica))
+    product_id = make_product(price="7.00")
+    today = datetime.now(timezone.utc).replace(tzinfo=None, hour=0, minute=0, second=0, microsecond=0)
+    yesterday, tomorrow = today - timedelta(days=1), today + timedelta(days=1)
+
+    _place(client, platform, product_id, sale_date=(yesterday + timedelta(hours=12)).isoformat())
+    _place(client, platform, product_id)
+
+    # cached until a backdated sale invalidates it, so it must not come from the lagging replica
+    assert _revenue(client, yesterday.isoformat(), today.isoformat()) == Decimal("7.00")
+    # expires within REVENUE_CACHE_OPEN_TTL, read from the replica like any other analytics query
+    assert _revenue(client, today.isoformat(), tomorrow.isoformat()) == 0
+    replica.dispose()
+
+
+def test_cached_totals_always_expire(client, platform, make_product, monkeypatch):
+    stored = []
+    store = revenue_cache.store
+
+    def recording_store(slot, value, ttl):
+        stored.append(ttl)
+        store(slot, value, ttl)
+
+    monkeypatch.setattr(revenue_cache, "store", recording_store)
+    product_id = make_product(price="7.00")
+    today = datetime.now(timezone.utc).replace(tzinfo=None, hour=0, minute=0, second=0, microsecond=0)
+    _place(client, platform, product_id)
+
+    _revenue(client, (today - timedelta(days=7)).isoformat(), today.isoformat())
+    _revenue(client, today.isoformat(), (today + timedelta(days=1)).isoformat())
+
+    assert stored == [REVENUE_CACHE_CLOSED_TTL, REVENUE_CACHE_OPEN_TTL]
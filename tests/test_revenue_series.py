@@ -0,0 +1,114 @@
+from datetime import date
+
+import pytest
+
+from app.controllers.sales_analysis import series_point_count
+from app.db.query_stats import query_budget
+from app.models import Category
+from app.schemas.sale_item_schema import SeriesGranularity
+
+
+def _series(client, start, end, granularity="day", **filters):
+    response = client.get(
+        "/api/v1/revenue/series",
+        params={"start": start, "end": end, "granularity": granularity, **filters}
+    )
+    assert response.status_code == 200, response.text
+    data = response.json()
+    return {point["period_start"]: (point["revenue"], point["units_sold"]) for point in data["points"]}, data
+
+
+@pytest.fixture
+def sales(client, db, platform, make_product):
+    garden = Category(name="Garden", sku="garden")
+    db.add(garden)
+    db.commit()
+    lamp = make_product(price="10.00")
+    hose = make_product(price="3.00", category_id=garden.id)
+    other_platform = client.post("/api/v1/platforms/", json={"name": "Marketplace"}).json()["data"]["id"]
+
+    def place(product_id, quantity, sale_date, platform_id=platform):
+        order = {"platform_id": platform_id, "sale_date": sale_date, "items": [{"product_id": product_id, "quantity": quantity}]}
+        assert client.post("/api/v1/orders/", json=order).status_code == 200
+
+    place(lamp, 1, "2026-03-02T09:00:00")                  # Monday
+    place(lamp, 2, "2026-03-04T09:00:00")                  # Wednesday, same week
+    place(hose, 1, "2026-03-09T09:00:00", other_platform)  # next Monday
+    place(lamp, 1, "2026-04-01T00:00:00")                  # first instant of April
+    return {"platform": platform, "other_platform": other_platform}
+
+
+def test_daily_series_zero_fills_empty_days(client, sales):
+    points, data = _series(client, "2026-03-01", "2026-03-05")
+
+    assert points == {
+        "2026-03-01": ("0.00", 0),
+        "2026-03-02": ("10.00", 1),
+        "2026-03-03": ("0.00", 0),
+        "2026-03-04": ("20.00", 2),
+    }
+    assert data["total_revenue"] == "30.00"
+
+
+def test_end_is_exclusive(client, sales):
+    points, _ = _series(client, "2026-03-04", "2026-04-01")
+
+    assert "2026-04-01" not in points
+    assert len(points) == 28
+    assert sum(units for _, units in points.values()) == 3
+
+
+def test_weeks_start_on_monday(client, sales):
+    # starts on a Sunday: its bucket is the week beginning the Monday before
+    points, _ = _series(client, "2026-03-01", "2026-03-16", "week")
+
+    assert points == {
+        "2026-02-23": ("0.00", 0),
+        "2026-03-02": ("30.00", 3),
+        "2026-03-09": ("3.00", 1),
+    }
+
+
+def test_month_buckets(client, sales):
+    points, data = _series(client, "2026-02-15", "2026-05-01", "month")
+
+    assert points == {
+        "2026-02-01": ("0.00", 0),
+        "2026-03-01": ("33.00", 4),
+        "2026-04-01": ("10.00", 1),
+    }
+    assert data["total_revenue"] == "43.00"
+
+
+def test_platform_and_category_filters(client, sales):
+    by_platform, _ = _series(client, "2026-03-01", "2026-04-01", "month", platform_id=sales["other_platform"])
+    by_category, _ = _series(client, "2026-03-01", "2026-05-01", "month", category="Garden")
+
+    assert by_platform == {"2026-03-01": ("3.00", 1)}
+    assert by_category == {"2026-03-01": ("3.00", 1), "2026-04-01": ("0.00", 0)}
+
+
+@pytest.mark.parametrize("granularity, end", [("day", "2027-02-06"), ("week", "2036-01-01"), ("month", "2036-02-01")])
+def test_oversized_range_is_rejected_before_querying(client, granularity, end):
+    with query_budget(0):
+        response = client.get("/api/v1/revenue/series", params={"start": "2026-01-01", "end": end, "granularity": granularity})
+
+    assert response.status_code == 400
+    assert "at most" in response.json()["detail"]
+
+
+def test_reversed_range_is_rejected(client):
+    response = client.get("/api/v1/revenue/series", params={"start": "2026-03-02", "end": "2026-03-01"})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("granularity, start, end, count", [
+    (SeriesGranularity.day, date(2026, 1, 1), date(2027, 2, 5), 400),
+    (SeriesGranularity.week, date(2026, 3, 1), date(2026, 3, 16), 3),
+    (SeriesGranularity.week, date(2026, 3, 2), date(2026, 3, 9), 1),
+    (SeriesGranularity.month, date(2026, 2, 15), date(2026, 5, 1), 3),
+    (SeriesGranularity.month, date(2026, 2, 15), date(2026, 5, 2), 4),
+])
+def test_point_count_matches_the_buckets_built(granularity, start, end, count):
+    assert series_point_count(start, end, granularity) == count
@@ -0,0 +1,53 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main
+from app.core.bootstrap import bootstrap, check_ready
+from app.db.database import Base, engine
+from app.db.query_stats import query_budget
+from app.models import Category, Product, Sale
+
+
+def test_check_mode_verifies_the_database_without_writing(db, monkeypatch):
+    monkeypatch.setattr(app.main, "STARTUP_MODE", "check")
+
+    with TestClient(app.main.app) as client:
+        assert client.get("/").status_code == 200
+
+    assert db.query(Category).count() == 0
+    assert db.query(Product).count() == 0
+
+
+def test_check_mode_refuses_to_start_on_a_missing_schema(monkeypatch):
+    monkeypatch.setattr(app.main, "STARTUP_MODE", "check")
+    Base.metadata.drop_all(bind=engine)
+
+    with pytest.raises(RuntimeError, match="python -m app.core.bootstrap"):
+        with TestClient(app.main.app):
+            pass
+
+
+def test_bootstrap_creates_the_schema_and_seeds_once(db):
+    Base.metadata.drop_all(bind=engine)
+
+    bootstrap()
+    counts = (db.query(Category).count(), db.query(Product).count(), db.query(Sale).count())
+    bootstrap()
+
+    assert counts[0] == 10 and counts[1] == 50 and counts[2] > 0
+    assert (db.query(Category).count(), db.query(Product).count()) == counts[:2]
+
+
+def test_worker_cold_start_is_a_single_round_trip(monkeypatch):
+    monkeypatch.setattr(app.main, "STARTUP_MODE", "check")
+    engine.dispose()
+
+    with query_budget(1) as checked:
+        check_ready()
+    # the startup hook runs on the TestClient's thread
+    with query_budget(1) as started:
+        with TestClient(app.main.app):
+            pass
+
+    assert checked.count == started.count == 1
+    assert checked.statements[0].startswith("SELECT products.id")
@@ -0,0 +1,87 @@
+import threading
+import time
+from collections import Counter
+from decimal import Decimal
+
+import pytest
+from fastapi import HTTPException
+
+from app.core import inventory_snapshot
+from app.controllers.order_controller import create_order
+from app.controllers.inventory_controller import update_inventory_by_product
+from app.db.database import SessionLocal
+from app.models import Inventory, InventorySnapshot, SaleItem
+from app.schemas.inventory_schema import InventoryUpdate
+from app.schemas.sale_item_schema import SaleIn, SaleItemIn
+
+THREADS = 8
+ATTEMPTS_PER_THREAD = 10
+STOCK = 50
+
+
+def _hammer(work, threads: int = THREADS, attempts: int = ATTEMPTS_PER_THREAD) -> Counter:
+    outcomes = Counter()
+    lock = threading.Lock()
+    start = threading.Barrier(threads)
+
+    def worker():
+        start.wait()
+        for _ in range(attempts):
+            db = SessionLocal()
+            try:
+                work(db)
+                outcome = 200
+            except HTTPException as e:
+                outcome = e.status_code
+            except Exception as e:
+                outcome = type(e).__name__
+            finally:
+                db.close()
+            with lock:
+                outcomes[outcome] += 1
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return outcomes
+
+
+@pytest.fixture(params=["pessimistic", "optimistic"])
+def locking_mode(request, monkeypatch):
+    monkeypatch.setattr(inventory_snapshot, "STOCK_LOCKING_MODE", request.param)
+    return request.param
+
+
+def test_concurrent_orders_never_oversell(locking_mode, db, platform, make_product):
+    product_id = make_product(stock=STOCK)
+    order = SaleIn(platform_id=platform, items=[SaleItemIn(product_id=product_id, quantity=1)])
+
+    started = time.perf_counter()
+    outcomes = _hammer(lambda session: create_order(session, order))
+    elapsed = time.perf_counter() - started
+    print(f"\n{locking_mode}: {outcomes[200] / elapsed:.0f} orders/sec, outcomes {dict(outcomes)}")
+
+    # every attempt either sold one unit, ran out of stock or lost a race it was told about
+    assert set(outcomes) <= {200, 400, 409}
+    assert sum(outcomes.values()) == THREADS * ATTEMPTS_PER_THREAD
+    assert outcomes[200] <= STOCK
+
+    sold = db.query(SaleItem).filter(SaleItem.product_id == product_id).count()
+    snapshot = db.get(InventorySnapshot, product_id)
+    latest = db.query(Inventory).filter(Inventory.product_id == product_id).order_by(Inventory.id.desc()).first()
+    assert sold == outcomes[200]
+    assert snapshot.quantity == STOCK - sold
+    assert latest.quantity_after == snapshot.quantity
+
+
+def test_concurrent_stock_adjustments_are_all_applied_or_refused(locking_mode, db, make_product):
+    product_id = make_product(stock=STOCK)
+    update = InventoryUpdate(quantity_changed=Decimal(1))
+
+    outcomes = _hammer(lambda session: update_inventory_by_product(session, product_id, update), attempts=5)
+
+    assert set(outcomes) <= {200, 409}
+    assert db.get(InventorySnapshot, product_id).quantity == STOCK + outcomes[200]
+    assert db.query(Inventory).filter(Inventory.product_id == product_id).count() == 1 + outcomes[200]